@@ -2,8 +2,10 @@
 from manifester import Manifester
 import pytest
 
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.constants import DEFAULT_LOC, DEFAULT_ORG
+from robottelo.logging import logger
+from robottelo.utils.manifest_pool import LocalManifestBackend, ManifesterBackend, ManifestPool
 
 
 @pytest.fixture(scope='session')
@@ -71,18 +73,29 @@ def function_location_with_org(target_sat, function_org):
     return target_sat.api.Location(organization=[function_org]).create()
 
 
+def _manifest_org(satellite, org, manifest):
+    """Upload the manifest to the org, and remove it on teardown if the manifest pool recycles it"""
+    satellite.upload_manifest(org.id, manifest.content)
+    yield org
+    if getattr(manifest, 'recycle', False):
+        try:
+            satellite.api.Subscription().delete_manifest(data={'organization_id': org.id})
+        except Exception as err:
+            logger.warning(f'Manifest {manifest.uuid} not recycled, failed to remove it: {err}')
+        else:
+            manifest.recyclable = True
+
+
 @pytest.fixture(scope='module')
 def module_sca_manifest_org(module_org, module_sca_manifest, module_target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    module_target_sat.upload_manifest(module_org.id, module_sca_manifest.content)
-    return module_org
+    yield from _manifest_org(module_target_sat, module_org, module_sca_manifest)
 
 
 @pytest.fixture(scope='class')
 def class_sca_manifest_org(class_org, class_sca_manifest, class_target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    class_target_sat.upload_manifest(class_org.id, class_sca_manifest.content)
-    return class_org
+    yield from _manifest_org(class_target_sat, class_org, class_sca_manifest)
 
 
 @pytest.fixture
@@ -97,29 +110,25 @@ def sca_manifest_org_for_upgrade(function_org, sca_manifest_for_upgrade, target_
 @pytest.fixture
 def function_sca_manifest_org(function_org, function_sca_manifest, target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    target_sat.upload_manifest(function_org.id, function_sca_manifest.content)
-    return function_org
+    yield from _manifest_org(target_sat, function_org, function_sca_manifest)
 
 
 @pytest.fixture
 def function_els_sca_manifest_org(function_org, function_sca_els_manifest, target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    target_sat.upload_manifest(function_org.id, function_sca_els_manifest.content)
-    return function_org
+    yield from _manifest_org(target_sat, function_org, function_sca_els_manifest)
 
 
 @pytest.fixture(scope='module')
 def module_els_sca_manifest_org(module_org, module_sca_els_manifest, module_target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    module_target_sat.upload_manifest(module_org.id, module_sca_els_manifest.content)
-    return module_org
+    yield from _manifest_org(module_target_sat, module_org, module_sca_els_manifest)
 
 
 @pytest.fixture(scope='class')
 def class_els_sca_manifest_org(class_org, class_sca_els_manifest, class_target_sat):
     """Creates an organization and uploads an SCA mode manifest generated with manifester"""
-    class_target_sat.upload_manifest(class_org.id, class_sca_els_manifest.content)
-    return class_org
+    yield from _manifest_org(class_target_sat, class_org, class_sca_els_manifest)
 
 
 # Note: Manifester should not be used with the Satellite QE RHSM account until
@@ -129,76 +138,99 @@ def class_els_sca_manifest_org(class_org, class_sca_els_manifest, class_target_s
 
 
 @pytest.fixture(scope='session')
-def session_sca_manifest():
+def manifest_pool():
+    """A session-level fixture that provides the pool of manifests shared by the workers,
+    None unless manifest.pool.enabled is set"""
+    if not settings.manifest.pool.enabled:
+        yield None
+        return
+    if settings.manifest.pool.backend == 'local':
+        backend = LocalManifestBackend(robottelo_tmp_dir / 'manifests')
+    else:
+        backend = ManifesterBackend()
+    pool = ManifestPool(
+        backend,
+        robottelo_tmp_dir / 'manifest_pool.json',
+        size=settings.manifest.pool.size,
+        recycle=settings.manifest.pool.recycle,
+        categories=settings.manifest.pool.categories,
+    )
+    yield pool
+    pool.close()
+
+
+def _manifest(manifest_pool, category):
+    """Yield a manifest of the ``settings.manifest`` category, from the pool if enabled"""
+    if manifest_pool is None:
+        with Manifester(manifest_category=settings.manifest.get(category)) as manifest:
+            yield manifest
+        return
+    with manifest_pool.manifest(category) as manifest:
+        yield manifest
+
+
+@pytest.fixture(scope='session')
+def session_sca_manifest(manifest_pool):
     """Yields a manifest in entitlement mode with subscriptions determined by the
     `manifest_category.entitlement` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'golden_ticket')
 
 
 @pytest.fixture(scope='module')
-def module_extra_rhel_sca_manifest():
+def module_extra_rhel_sca_manifest(manifest_pool):
     """Yields a manifest in sca mode with subscriptions determined by the
     'manifest_category.extra_rhel_entitlement` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.extra_rhel_entitlement) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'extra_rhel_entitlement')
 
 
 @pytest.fixture(scope='module')
-def module_sca_manifest():
+def module_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'golden_ticket')
 
 
 @pytest.fixture(scope='class')
-def class_sca_manifest():
+def class_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'golden_ticket')
 
 
 @pytest.fixture
-def function_sca_manifest():
+def function_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'golden_ticket')
 
 
 @pytest.fixture
-def second_function_sca_manifest():
+def second_function_sca_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.golden_ticket` setting in conf/manifest.yaml.
     A different one than is used in `function_sca_manifest_org`."""
-    with Manifester(manifest_category=settings.manifest.golden_ticket) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'golden_ticket')
 
 
 @pytest.fixture(scope='module')
-def module_sca_els_manifest():
+def module_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'els_rhel_manifest')
 
 
 @pytest.fixture(scope='class')
-def class_sca_els_manifest():
+def class_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'els_rhel_manifest')
 
 
 @pytest.fixture
-def function_sca_els_manifest():
+def function_sca_els_manifest(manifest_pool):
     """Yields a manifest in Simple Content Access mode with subscriptions determined by the
     `manifest_category.els_rhel_manifest` setting in conf/manifest.yaml."""
-    with Manifester(manifest_category=settings.manifest.els_rhel_manifest) as manifest:
-        yield manifest
+    yield from _manifest(manifest_pool, 'els_rhel_manifest')
 
 
 @pytest.fixture(scope='module')
@@ -5,15 +5,25 @@ The functions in this module are read in the pytest_plugins/fixture_markers.py m
 All functions in this module will be treated as fixtures that apply the contenthost mark
 """
 
+from functools import cache
+
 from broker import Broker
 import pytest
 
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.enums import NetworkType
+from robottelo.host_helpers.host_pipeline import HostPipeline
+from robottelo.host_helpers.host_pool import HostPool
 from robottelo.hosts import ContentHost, Satellite
 
 
+@cache
+def _deploy_conf(rhelver, kind):
+    """The container or vm deploy arguments of a rhel version, read once from settings"""
+    return settings.content_host.get(rhelver).to_dict().get(kind, {})
+
+
 def host_conf(request):
     """A function that returns arguments for Broker host deployment"""
     conf = params = {}
@@ -32,12 +42,12 @@ def host_conf(request):
             request.node.get_closest_marker('no_containers'),
         ]
     ):
-        deploy_kwargs = settings.content_host.get(_rhelver).to_dict().get('container', {})
+        deploy_kwargs = dict(_deploy_conf(_rhelver, 'container'))
         if deploy_kwargs and network:
             deploy_kwargs.update({'Container': str(network)})
     # if we're not using containers or a container isn't available, use a VM
     if not deploy_kwargs:
-        deploy_kwargs = settings.content_host.get(_rhelver).to_dict().get('vm', {})
+        deploy_kwargs = dict(_deploy_conf(_rhelver, 'vm'))
         if network:
             deploy_kwargs.update({'deploy_network_type': network})
     if network:
@@ -47,13 +57,37 @@ def host_conf(request):
     return conf
 
 
+@pytest.fixture(scope='session')
+def content_host_pool():
+    """A session-level fixture that provides the warm pool of content hosts of this worker,
+    None unless content_host.host_pool.enabled is set"""
+    if not settings.content_host.host_pool.enabled:
+        yield None
+        return
+    pool = HostPool(
+        ContentHost,
+        size=settings.content_host.host_pool.size,
+        ttl=settings.content_host.host_pool.ttl,
+    )
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-def rhel_contenthost(request):
+def rhel_contenthost(request, content_host_pool):
     """A function-level fixture that provides a content host object parametrized"""
     # Request should be parametrized through pytest_fixtures.fixture_markers
     # unpack params dict
-    with Broker(**host_conf(request), host_class=ContentHost) as host:
-        yield host
+    conf = host_conf(request)
+    if content_host_pool is None:
+        with Broker(**conf, host_class=ContentHost) as host:
+            yield host
+        return
+    host = content_host_pool.acquire(conf)
+    yield host
+    # hosts of failed tests may be in any state, don't reuse them
+    report = getattr(request.node, 'report_call', None)
+    content_host_pool.release(host, conf, reusable=bool(report and report.passed))
 
 
 @pytest.fixture(scope='module')
@@ -118,7 +152,7 @@ def rhel9_contenthost(request):
 @pytest.fixture
 def content_hosts(request):
     """A function-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with HostPipeline([host_conf(request)] * 2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -126,7 +160,7 @@ def content_hosts(request):
 @pytest.fixture(scope='module')
 def mod_content_hosts(request):
     """A module-level fixture that provides two rhel content hosts object"""
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
+    with HostPipeline([host_conf(request)] * 2) as hosts:
         hosts[0].set_infrastructure_type('physical')
         yield hosts
 
@@ -175,12 +209,15 @@ def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
 @pytest.fixture
 def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv):
     request.param['no_containers'] = True
-    with Broker(**host_conf(request), host_class=ContentHost, _count=2) as hosts:
-        for host in hosts:
-            repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
-            host.register(
-                module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
-            )
+
+    def register(host):
+        repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
+        host.register(
+            module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
+        )
+
+    # hosts are checked out and registered concurrently
+    with HostPipeline([host_conf(request)] * 2, setup=register) as hosts:
         yield hosts
 
 
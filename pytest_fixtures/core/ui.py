@@ -2,12 +2,14 @@ from fauxfactory import gen_string
 import pytest
 from requests.exceptions import HTTPError
 
+from robottelo.config import settings
+from robottelo.host_helpers.ui_session_pool import UISessionPool
 from robottelo.hosts import Satellite
 from robottelo.logging import logger
 
 
 @pytest.fixture(scope='module')
-def ui_user(request, module_org, module_location, module_target_sat):
+def ui_user(request, module_org, module_location, module_target_sat, ui_session_pool):
     """Creates admin user with default org set to module org and shares that
     user for all tests in the same test module. User's login contains test
     module name as a prefix.
@@ -36,6 +38,9 @@ def ui_user(request, module_org, module_location, module_target_sat):
         user.role = module_target_sat.api.Role().search(query={'per_page': 'all'})
         user.update(['role'])
     yield user
+    if ui_session_pool is not None:
+        # the browsers of the user are not reused by the next modules, each has its own user
+        ui_session_pool.discard(module_target_sat.hostname, user.login)
     try:
         logger.debug('Deleting session user %r', user.login)
         user.delete(synchronous=False)
@@ -43,8 +48,39 @@ def ui_user(request, module_org, module_location, module_target_sat):
         logger.warning('Unable to delete session user: %s', str(err))
 
 
+@pytest.fixture(scope='session')
+def ui_session_pool():
+    """A session-level fixture that provides the pool of logged in UI sessions of this worker,
+    None unless ui.session_pool.enabled is set"""
+    if not settings.ui.session_pool.enabled:
+        yield None
+        return
+    if settings.ui.record_video:
+        # pooled browsers share their selenium session id, the video of a passed test would be
+        # cleaned up with the one of the following tests
+        logger.warning('UI session pool disabled, it is not supported with ui.record_video')
+        yield None
+        return
+    pool = UISessionPool(
+        restore_cookies=settings.ui.session_pool.restore_cookies,
+        max_uses=settings.ui.session_pool.max_uses,
+    )
+    yield pool
+    pool.close()
+
+
+def _ui_session(request, target_sat, test_name, ui_user, pool):
+    with target_sat.ui_session(test_name, ui_user.login, ui_user.password, pool=pool) as ui_session:
+        yield ui_session
+        if pool is not None:
+            # browsers of failed tests may be in any state, don't reuse them
+            report = getattr(request.node, 'report_call', None)
+            if not (report and report.passed):
+                ui_session.reusable = False
+
+
 @pytest.fixture
-def session(target_sat, test_name, ui_user, request):
+def session(target_sat, test_name, ui_user, request, ui_session_pool):
     """Session fixture which automatically initializes (but does not start!)
     airgun UI session and correctly passes current test name to it. Uses shared
     module user credentials to log in.
@@ -57,12 +93,11 @@ def session(target_sat, test_name, ui_user, request):
                 session.architecture.create({'name': 'bar'})
 
     """
-    with target_sat.ui_session(test_name, ui_user.login, ui_user.password) as session:
-        yield session
+    yield from _ui_session(request, target_sat, test_name, ui_user, ui_session_pool)
 
 
 @pytest.fixture
-def autosession(target_sat, test_name, ui_user, request):
+def autosession(target_sat, test_name, ui_user, request, ui_session_pool):
     """Session fixture which automatically initializes and starts airgun UI
     session and correctly passes current test name to it. Use it when you want
     to have a session started before test steps and closed after all of them,
@@ -76,8 +111,7 @@ def autosession(target_sat, test_name, ui_user, request):
             autosession.architecture.create({'name': 'bar'})
 
     """
-    with target_sat.ui_session(test_name, ui_user.login, ui_user.password) as started_session:
-        yield started_session
+    yield from _ui_session(request, target_sat, test_name, ui_user, ui_session_pool)
 
 
 @pytest.fixture(autouse=True)
@@ -1,9 +1,8 @@
 from collections import defaultdict
-import inspect
-import re
 
 import pytest
 
+from pytest_plugins.metadata_markers import get_metadata_index
 from robottelo.utils import slugify_component
 from robottelo.utils.issue_handlers import (
     add_workaround,
@@ -25,29 +24,6 @@ def pytest_collection_modifyitems(session, items, config):
     pytest.issue_data = generate_issue_collection(items, config)
 
 
-IS_OPEN = re.compile(
-    # To match `if is_open('SAT:123456'):`
-    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-NOT_IS_OPEN = re.compile(
-    # To match `if not is_open('SAT:123456'):`
-    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-COMPONENT = re.compile(
-    # To match :CaseComponent: FooBar
-    r"\s*:CaseComponent:\s*(?P<component>\S*)",
-    re.IGNORECASE,
-)
-
-IMPORTANCE = re.compile(
-    # To match :CaseImportance: Critical
-    r"\s*:CaseImportance:\s*(?P<importance>\S*)",
-    re.IGNORECASE,
-)
-
-
 def generate_issue_collection(items, config):  # pragma: no cover
     """Generates a dictionary with the usage of Issue blockers
 
@@ -93,6 +69,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
     deselect_data = {}  # a local cache for deselected tests
 
+    metadata_index = get_metadata_index(config)
+
     test_modules = set()
 
     # --- Build the issue marked usage collection ---
@@ -135,8 +113,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 deselect_data[item.location] = issue_key
 
         # Then take the workarounds using `is_open` helper.
-        source = inspect.getsource(item.function)
-        if 'is_open(' in source:
+        is_open_matches, not_is_open_matches = metadata_index.function_usages(item.function)
+        if is_open_matches or not_is_open_matches:
             kwargs = {
                 'filepath': filepath,
                 'lineno': lineno,
@@ -145,17 +123,15 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 'importance': importance_mark,
                 'component_mark': component_slug,
             }
-            add_workaround(collected_data, IS_OPEN.findall(source), 'is_open', **kwargs)
-            add_workaround(collected_data, NOT_IS_OPEN.findall(source), 'not is_open', **kwargs)
+            add_workaround(collected_data, is_open_matches, 'is_open', **kwargs)
+            add_workaround(collected_data, not_is_open_matches, 'not is_open', **kwargs)
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
     for test_module in test_modules:
-        module_source = inspect.getsource(test_module)
-        component_matches = COMPONENT.findall(module_source)
-        module_component = None
-        if component_matches:
-            module_component = component_matches[0]
-        if 'is_open(' in module_source:
+        module_component, is_open_matches, not_is_open_matches = metadata_index.module_usages(
+            test_module
+        )
+        if is_open_matches or not_is_open_matches:
             kwargs = {
                 'filepath': test_module.__file__,
                 'lineno': 1,
@@ -168,14 +144,14 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
             add_workaround(
                 collected_data,
-                IS_OPEN.findall(module_source),
+                is_open_matches,
                 'is_open',
                 validation=validation,
                 **kwargs,
             )
             add_workaround(
                 collected_data,
-                NOT_IS_OPEN.findall(module_source),
+                not_is_open_matches,
                 'not is_open',
                 validation=validation,
                 **kwargs,
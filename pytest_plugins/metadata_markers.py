@@ -1,14 +1,13 @@
 import datetime
-import inspect
-import re
 
 import pytest
 
 from robottelo.config import settings
 from robottelo.hosts import get_sat_rhel_version
 from robottelo.logging import collection_logger as logger
-from robottelo.utils import parse_comma_separated_list
+from robottelo.utils import host_facts, parse_comma_separated_list
 from robottelo.utils.issue_handlers.jira import are_any_jira_open
+from robottelo.utils.metadata_index import MetadataIndex
 
 FMT_XUNIT_TIME = '%Y-%m-%dT%H:%M:%S'
 IMPORTANCE_LEVELS = []
@@ -61,37 +60,31 @@ def pytest_configure(config):
         'verifies_issues: Verifies testimony token, use --verifies_issues to filter',
     ]:
         config.addinivalue_line("markers", marker)
+    if config.option.collectonly:
+        # collection only needs facts cached by an earlier session or the configuration
+        host_facts.set_offline()
 
 
-component_regex = re.compile(
-    # To match :CaseComponent: FooBar
-    r'\s*:CaseComponent:\s*(?P<component>\S*)',
-    re.IGNORECASE,
-)
+metadata_index_key = pytest.StashKey[MetadataIndex]()
 
-importance_regex = re.compile(
-    # To match :CaseImportance: Critical
-    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
-    re.IGNORECASE,
-)
 
-team_regex = re.compile(
-    # To match :Team: Rocket
-    r'\s*:Team:\s*(?P<team>\S*)',
-    re.IGNORECASE,
-)
+def get_metadata_index(config):
+    """Return the test module metadata index of this session
+
+    The index is persisted in the pytest cache directory, so that only the test modules changed
+    since the previous collection are parsed again.
+    """
+    if metadata_index_key not in config.stash:
+        cache = getattr(config, 'cache', None)  # None with -p no:cacheprovider
+        cache_file = cache.mkdir('robottelo') / 'metadata_index.json' if cache else None
+        config.stash[metadata_index_key] = MetadataIndex(cache_file)
+    return config.stash[metadata_index_key]
 
-blocked_by_regex = re.compile(
-    # To match :BlockedBy: SAT-32932
-    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
-    re.IGNORECASE,
-)
 
-verifies_regex = re.compile(
-    # To match :Verifies: SAT-32932
-    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
-    re.IGNORECASE,
-)
+def pytest_collection_finish(session):
+    """Persist the metadata index once all plugins are done with collection"""
+    if metadata_index_key in session.config.stash:
+        session.config.stash[metadata_index_key].save()
 
 
 def handle_verification_issues(item, verifies_marker, verifies_issues):
@@ -159,6 +152,7 @@ def pytest_collection_modifyitems(items, config):
     team = [a.lower() for a in (config.getoption('team') or '').split(',') if a != '']
     verifies_issues = config.getoption('verifies_issues')
     blocked_by = config.getoption('blocked_by')
+    metadata_index = get_metadata_index(config)
     logger.info('Processing test items to add testimony token markers')
     for item in items:
         item.user_properties.append(
@@ -170,34 +164,29 @@ def pytest_collection_modifyitems(items, config):
 
         # apply the marks for importance, component, and team
         # Find matches from docstrings starting at smallest scope
-        item_docstrings = [
-            d
-            for d in map(inspect.getdoc, (item.function, getattr(item, 'cls', None), item.module))
-            if d is not None
+        item_tokens = [
+            t
+            for t in map(
+                metadata_index.tokens, (item.function, getattr(item, 'cls', None), item.module)
+            )
+            if t is not None
         ]
         blocked_by_marks_to_add = []
         verifies_marks_to_add = []
-        for docstring in item_docstrings:
+        for tokens in item_tokens:
             item_mark_names = [m.name for m in item.iter_markers()]
             # Add marker starting at smallest docstring scope
             # only add the mark if it hasn't already been applied at a lower scope
-            doc_component = component_regex.findall(docstring)
-            if doc_component and 'component' not in item_mark_names:
-                item.add_marker(pytest.mark.component(doc_component[0].lower()))
-            doc_importance = importance_regex.findall(docstring)
-            if doc_importance and 'importance' not in item_mark_names:
-                item.add_marker(pytest.mark.importance(doc_importance[0].lower()))
-            doc_team = team_regex.findall(docstring)
-            if doc_team and 'team' not in item_mark_names:
-                item.add_marker(pytest.mark.team(doc_team[0].lower()))
-            doc_verifies = verifies_regex.findall(docstring)
-            if doc_verifies and 'verifies_issues' not in item_mark_names:
-                verifies_marks_to_add.extend(str(b.strip()) for b in doc_verifies[-1].split(','))
-            doc_blocked_by = blocked_by_regex.findall(docstring)
-            if doc_blocked_by and 'blocked_by' not in item_mark_names:
-                blocked_by_marks_to_add.extend(
-                    str(b.strip()) for b in doc_blocked_by[-1].split(',')
-                )
+            if tokens['component'] is not None and 'component' not in item_mark_names:
+                item.add_marker(pytest.mark.component(tokens['component'].lower()))
+            if tokens['importance'] is not None and 'importance' not in item_mark_names:
+                item.add_marker(pytest.mark.importance(tokens['importance'].lower()))
+            if tokens['team'] is not None and 'team' not in item_mark_names:
+                item.add_marker(pytest.mark.team(tokens['team'].lower()))
+            if tokens['verifies'] and 'verifies_issues' not in item_mark_names:
+                verifies_marks_to_add.extend(tokens['verifies'])
+            if tokens['blocked_by'] and 'blocked_by' not in item_mark_names:
+                blocked_by_marks_to_add.extend(tokens['blocked_by'])
         if blocked_by_marks_to_add:
             item.add_marker(pytest.mark.blocked_by(blocked_by_marks_to_add))
         if verifies_marks_to_add:
@@ -1,8 +1,12 @@
+import hashlib
+import json
+
 import pytest
 
 from robottelo.config import settings
 from robottelo.hosts import get_sat_version
 from robottelo.logging import logger
+from robottelo.utils.collection import filter_items
 from robottelo.utils.report_portal.portal import ReportPortal
 
 
@@ -28,6 +32,30 @@ def _validate_launch(launch):
         )
 
 
+def _test_name(name):
+    """Normalize a pytest node location or a RP test item name to a comparable name"""
+    return name.replace('::', '.')
+
+
+def _get_test_names(rp, config, launch, test_args):
+    """Return the names of the RP test items of a launch matching the test arguments
+
+    The names of finished launches are cached in the pytest cache directory by launch UUID, as
+    their test items don't change anymore.
+    """
+    cache = getattr(config, 'cache', None)  # None with -p no:cacheprovider
+    args_digest = hashlib.sha256(json.dumps(test_args, sort_keys=True).encode()).hexdigest()[:16]
+    key = f'robottelo/rerun_rp/{launch["uuid"]}-{args_digest}'
+    finished = launch['status'] not in ('IN_PROGRESS', 'INTERRUPTED')
+    if cache and finished and (names := cache.get(key, None)) is not None:
+        logger.debug(f'Using cached Report Portal tests of launch {launch["uuid"]}')
+        return names
+    names = [test['name'] for test in rp.get_tests(launch=launch, **test_args)]
+    if cache and finished:
+        cache.set(key, names)
+    return names
+
+
 def pytest_addoption(parser):
     """Add options for pytest to collect only failed/skipped and user tests"""
     help_text = f'''
@@ -84,7 +112,7 @@ def pytest_collection_modifyitems(items, config):
     ref_launch_uuid = config.getoption('rp_reference_launch_uuid', None) or config.getoption(
         'rp_rerun_of', None
     )
-    tests = []
+    test_names = set()
     if not any([fail_args, skip_arg, user_arg]):
         return
     rp = ReportPortal(rp_url=rp_url, rp_api_key=rp_api_key, rp_project=rp_project)
@@ -137,18 +165,12 @@ def pytest_collection_modifyitems(items, config):
     test_args['paths'] = config.args
     for ref_launch in ref_launches:
         _validate_launch(ref_launch)
-        tests.extend(rp.get_tests(launch=ref_launch, **test_args))
+        test_names.update(map(_test_name, _get_test_names(rp, config, ref_launch, test_args)))
     # remove inapplicable tests from the current test collection
-    deselected = [
-        i
-        for i in items
-        if f'{i.location[0]}.{i.location[2]}'.replace('::', '.')
-        not in [t['name'].replace('::', '.') for t in tests]
-    ]
-    selected = list(set(items) - set(deselected))
+    selected, deselected = filter_items(
+        items, config, lambda i: _test_name(f'{i.location[0]}.{i.location[2]}') in test_names
+    )
     logger.debug(
         f'Selected {len(selected)} and deselected {len(deselected)} tests based on latest/given-/ '
         'launch test results.'
     )
-    config.hook.pytest_deselected(items=deselected)
-    items[:] = selected
@@ -5,6 +5,7 @@ from fauxfactory import gen_string
 import pytest
 
 from robottelo.logging import logger
+from robottelo.utils.collection import split_items
 
 
 def pytest_addoption(parser):
@@ -63,7 +64,8 @@ def pytest_collection_modifyitems(items, config):
             'Modifying test collection based on --select-random-tests pytest option. '
             f'Tests collected: {len(items)}, Tests to select randomly: {select_random_tests}, Seed value: {random_seed}'
         )
-        deselected = [item for item in items if item not in selected]
+        chosen = set(selected)
+        _, deselected = split_items(items, chosen.__contains__)
         # selected will be empty if no filter option was passed, defaulting to full items list
         items[:] = selected if deselected else items
         config.hook.pytest_deselected(items=deselected)
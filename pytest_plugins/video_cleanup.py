@@ -1,3 +1,6 @@
+import queue
+import shlex
+import threading
 from urllib.parse import urlparse
 
 from box import Box
@@ -7,6 +10,12 @@ import pytest
 from robottelo.config import settings
 from robottelo.logging import logger
 
+VIDEO_DIR = '/var/www/html/videos'
+# session ids whose videos are removed by a single rm command
+BATCH_SIZE = 100
+# seconds the cleanup thread waits for more session ids before removing the queued ones
+FLUSH_INTERVAL = 60
+
 test_results = {}
 test_directories = [
     'tests/foreman/destructive',
@@ -16,15 +25,80 @@ test_directories = [
 ]
 
 
+class VideoCleaner:
+    """Remove the videos of sessions from the grid host, in batches from a background thread
+
+    Session ids are queued by :meth:`add` and removed by one ``rm`` command per ``batch_size``
+    ids, every ``flush_interval`` seconds or as soon as a batch is full, over a single ssh
+    connection kept open until :meth:`close`.
+    """
+
+    def __init__(self, hostname, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.hostname = hostname
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._wake = threading.Event()
+        self._closing = False
+        self._host = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='video-cleanup', daemon=True)
+        self._thread.start()
+
+    def add(self, session_id):
+        """Queue the removal of the videos of a session"""
+        self._queue.put(session_id)
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def _run(self):
+        while not self._closing:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Remove the videos of all the queued sessions"""
+        with self._lock:
+            session_ids = []
+            while not self._queue.empty():
+                session_ids.append(self._queue.get())
+            for start in range(0, len(session_ids), self.batch_size):
+                batch = session_ids[start : start + self.batch_size]
+                paths = ' '.join(shlex.quote(f'{VIDEO_DIR}/{session_id}') for session_id in batch)
+                try:
+                    if self._host is None:
+                        self._host = Host(hostname=self.hostname)
+                    self._host.execute(command=f'rm -rf {paths}')
+                except Exception as err:
+                    logger.warning(f"video cleanup of sessions {batch} failed: {err}")
+                    self._host = None
+                else:
+                    logger.info(f"video cleanup for {len(batch)} sessions is complete")
+
+    def close(self):
+        """Remove the videos of the sessions still queued and close the ssh connection"""
+        self._closing = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        if self._host is not None:
+            self._host.close()
+            self._host = None
+
+
+_cleaner = None
+
+
 def _clean_video(session_id, test):
+    global _cleaner
     if settings.ui.record_video:
-        logger.info(f"cleaning up video files for session: {session_id} and test: {test}")
+        logger.info(f"queueing video cleanup for session: {session_id} and test: {test}")
 
         if settings.ui.grid_url and session_id:
-            grid = urlparse(url=settings.ui.grid_url)
-            infra_grid = Host(hostname=grid.hostname)
-            infra_grid.execute(command=f'rm -rf /var/www/html/videos/{session_id}')
-            logger.info(f"video cleanup for session {session_id} is complete")
+            if _cleaner is None:
+                _cleaner = VideoCleaner(urlparse(url=settings.ui.grid_url).hostname)
+            _cleaner.add(session_id)
         else:
             logger.warning("missing grid_url or session_id. unable to clean video files.")
 
@@ -75,3 +149,9 @@ def pytest_runtest_makereport(item):
                 )
                 session_id = session_id_tuple[1] if session_id_tuple else None
                 _clean_video(session_id, item.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the videos still queued for cleanup"""
+    if _cleaner is not None:
+        _cleaner.close()
@@ -1,15 +1,88 @@
 """Generic base class for cli hammer commands."""
 
+from contextlib import contextmanager
+from functools import partial
 import re
+import time
 
-from wait_for import wait_for
+from box import Box
 
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer, hammer_shell
 from robottelo.config import settings
-from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
+from robottelo.exceptions import CLIBaseError, CLIDataBaseError, CLIError, CLIReturnCodeError
 from robottelo.logging import logger
-from robottelo.utils.ssh import get_client
+
+# seconds to wait for a new organization to be readable, and delays between two reads
+ORG_READY_TIMEOUT = 300
+ORG_READY_MIN_DELAY = 0.5
+ORG_READY_MAX_DELAY = 5
+
+
+class LazyRecord(Box):
+    """Output of a ``create`` command, completed by ``info`` when it is needed
+
+    The record is read with ``fetch`` the first time a field missing from the ``create`` output
+    is accessed, or the record is used as a whole, e.g. iterated or compared. Once read, it holds
+    the output of ``fetch`` only, as an eager ``create`` returns.
+    """
+
+    def __init__(self, *args, fetch=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, '_fetch', fetch)
+
+    def load(self):
+        """Read the whole record, if not done yet"""
+        fetch = self.__dict__.get('_fetch')
+        if fetch is None:
+            return False
+        object.__setattr__(self, '_fetch', None)
+        record = fetch()
+        if record:
+            # drop the fields of the create output only, e.g. its message
+            self.clear()
+            self.update(record)
+        return True
+
+    def __getitem__(self, item, _ignore_default=False):
+        try:
+            return super().__getitem__(item, _ignore_default)
+        except KeyError:
+            if self.load():
+                return super().__getitem__(item, _ignore_default)
+            raise
+
+    def __contains__(self, item):
+        return super().__contains__(item) or (self.load() and super().__contains__(item))
+
+    def get(self, key, default=None):
+        if not super().__contains__(key):
+            self.load()
+        return super().get(key, default)
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load()
+        return super().__len__()
+
+    def __eq__(self, other):
+        self.load()
+        return super().__eq__(other)
+
+    def keys(self):
+        self.load()
+        return super().keys()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def items(self):
+        self.load()
+        return super().items()
 
 
 class Base:
@@ -83,9 +156,15 @@ class Base:
         return cls.execute(cls._construct_command(options))
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, fetch='eager'):
         """
         Creates a new record using the arguments passed via dictionary.
+
+        :param fetch: how the new record is read back with ``info``:
+            ``eager`` reads it right away and returns the output of ``info``,
+            ``lazy`` returns a :class:`LazyRecord` with the output of ``create``, usually the id
+            and name, which reads the record the first time another field is accessed,
+            ``none`` returns the output of ``create`` only.
         """
 
         cls.command_sub = 'create'
@@ -96,29 +175,12 @@ class Base:
         result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
 
         # Extract new object ID if it was successfully created
-        if len(result) > 0 and 'id' in result[0]:
-            obj_id = result[0]['id']
-
-            # Fetch new object
-            # Some Katello obj require the organization-id for subcommands
-            info_options = {'id': obj_id}
-            if cls.command_requires_org:
-                if 'organization-id' not in options:
-                    tmpl = 'organization-id option is required for {0}.create'
-                    raise CLIError(tmpl.format(cls.__name__))
-                info_options['organization-id'] = options['organization-id']
-
-            # organization creation can take some time
-            if cls.command_base == 'organization':
-                new_obj, _ = wait_for(
-                    lambda: cls.info(info_options),
-                    timeout=300000,
-                    delay=5,
-                    silent_failure=True,
-                    handle_exception=True,
-                )
-            else:
-                new_obj = cls.info(info_options)
+        if fetch != 'none' and len(result) > 0 and 'id' in result[0]:
+            info_options = cls._created_info_options(result[0]['id'], options)
+            if fetch == 'lazy':
+                return LazyRecord(result[0], fetch=partial(cls._read_created, info_options))
+
+            new_obj = cls._read_created(info_options)
 
             # stdout should be a dictionary containing the object
             if len(new_obj) > 0:
@@ -126,6 +188,35 @@ class Base:
 
         return result
 
+    @classmethod
+    def _created_info_options(cls, obj_id, options):
+        """Options of ``info`` reading the record just created with ``options``"""
+        # Some Katello obj require the organization-id for subcommands
+        info_options = {'id': obj_id}
+        if cls.command_requires_org:
+            if 'organization-id' not in options:
+                tmpl = 'organization-id option is required for {0}.create'
+                raise CLIError(tmpl.format(cls.__name__))
+            info_options['organization-id'] = options['organization-id']
+        return info_options
+
+    @classmethod
+    def _read_created(cls, info_options):
+        """Read a record just created"""
+        if cls.command_base != 'organization':
+            return cls.info(info_options)
+        # organization creation can take some time, poll often at first
+        deadline = time.monotonic() + ORG_READY_TIMEOUT
+        delay = ORG_READY_MIN_DELAY
+        while True:
+            try:
+                return cls.info(info_options)
+            except CLIBaseError:
+                if time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, ORG_READY_MAX_DELAY)
+
     @classmethod
     def delete(cls, options=None, timeout=None):
         """Deletes existing record."""
@@ -190,39 +281,69 @@ class Base:
         else:
             user, password = cls._get_username_password(user, password)
         time_hammer = settings.performance.time_hammer
+        hostname = hostname or cls.hostname or settings.server.hostname
 
-        # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
-            'time -p' if time_hammer else '',
+        hammer_args = '-v {} {} {} {}'.format(
             f'-u {user}' if user else "--interactive no",
             f'-p {password}' if password else "",
             f'--output={output_format}' if output_format else "",
             command,
         )
-        response = ssh.command(
-            cmd,
-            hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
-        )
+        if hammer_shell.batch_active() and not time_hammer:
+            response = ssh.parse_output(
+                hammer_shell.get_shell(hostname).execute(
+                    hammer_args, settings.robottelo.locale, timeout=timeout
+                ),
+                output_format,
+            )
+        else:
+            # add time to measure hammer performance
+            cmd = 'LANG={} {} hammer {}'.format(
+                settings.robottelo.locale,
+                'time -p' if time_hammer else '',
+                hammer_args,
+            )
+            response = ssh.command(
+                cmd,
+                hostname=hostname,
+                output_format=output_format,
+                timeout=timeout,
+            )
         if return_raw_response:
             return response
         return cls._handle_response(response, ignore_stderr=ignore_stderr)
 
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """Run the hammer commands of the current thread through a persistent hammer server
+
+        The server is started on first use, one per Satellite for each worker, and reused by
+        later batches. Commands keep their individual status, output parsing and error mapping.
+        See :mod:`robottelo.cli.hammer_shell`.
+        """
+        hammer_shell.enter_batch()
+        try:
+            yield
+        finally:
+            hammer_shell.exit_batch()
+
     @classmethod
     def sm_execute(cls, command, hostname=None, timeout=None, **kwargs):
         """Executes the satellite-maintain cli commands on the server via ssh"""
         env_var = kwargs.get('env_var') or ''
-        client = get_client(hostname=hostname or cls.hostname)
-        return client.execute(f'{env_var} satellite-maintain {command}', timeout=timeout)
+        return ssh.command(
+            f'{env_var} satellite-maintain {command}',
+            hostname=hostname or cls.hostname,
+            timeout=timeout,
+        )
 
     @classmethod
     def exists(cls, options=None, search=None):
         """Search for an entity using the query ``search[0]="search[1]"``
 
         Will be used the ``list`` command with the ``--search`` option to do
-        the search.
+        the search, fetching a single row.
 
         If ``options`` argument already have a search key, then the ``search``
         argument will not be evaluated. Which allows different search query.
@@ -235,11 +356,8 @@ class Base:
         if search is not None and 'search' not in options:
             options.update({'search': f'{search[0]}=\\"{search[1]}\\"'})
 
-        result = cls.list(options)
-        if result:
-            result = result[0]
-
-        return result
+        # the first page of a single row is enough to tell
+        return next(cls.iter_list(options, per_page=1), [])
 
     @classmethod
     def info(cls, options=None, output_format=None, return_raw_response=None):
@@ -284,6 +402,28 @@ class Base:
 
         return cls.execute(cls._construct_command(options), output_format=output_format)
 
+    @classmethod
+    def iter_list(cls, options=None, per_page=1000):
+        """Iterate over the ``list`` rows, fetching them one page at a time
+
+        Pages are only fetched as the rows are consumed, so stopping the iteration early (e.g.
+        with ``any`` or ``next``) avoids listing every entity of a big Satellite.
+
+        :param options: options of the ``list`` command, ``page`` sets the first page.
+        :param int per_page: rows per page, unless ``per-page`` is given in ``options``.
+        :return: generator of the parsed rows.
+        """
+        options = dict(options or {})
+        options.setdefault('per-page', per_page)
+        page_size = int(options['per-page'])
+        page = int(options.pop('page', 1))
+        while True:
+            rows = cls.list({**options, 'page': page})
+            yield from rows
+            if len(rows) < page_size:
+                return
+            page += 1
+
     @classmethod
     def puppetclasses(cls, options=None):
         """
@@ -353,6 +493,15 @@ class Base:
 
         return Wrapper
 
+    @classmethod
+    def isolated(cls):
+        """Return a subclass with its own class level command state, e.g. ``command_sub``
+
+        Commands of the same entity running from several threads at once must each use their
+        own isolated class, as the command is built from attributes set on the class.
+        """
+        return type(cls.__name__, (cls,), {})
+
     @classmethod
     def _construct_command(cls, options=None):
         """Build a hammer cli command based on the options passed"""
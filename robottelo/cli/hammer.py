@@ -1,26 +1,41 @@
 """Helpers to interact with hammer command line utility."""
 
 import csv
+from functools import lru_cache
 import json
 import re
 
 from robottelo.logging import logger
 
+# info output patterns, see parse_info
+NUMBERED_VALUE = re.compile(r'\d+\)\s+(.+)$')
+NUMBERED_KEY = re.compile(r'(\d+)\)')
 
+
+@lru_cache(maxsize=4096)
 def _normalize(header):
     """Replace empty spaces with '-' and lower all chars"""
     return header.replace(' ', '-').lower()
 
 
+def _normalize_pairs(pairs):
+    """Build a dict with normalized keys from decoded JSON object pairs"""
+    return {_normalize(k): v for k, v in pairs}
+
+
 def parse_json(stdout):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
+
+    Keys are normalized and integers converted to strings while decoding, which gives the same
+    result as :func:`_normalize_obj` without walking the decoded objects again.
     """
     new_object_index = stdout.find('\n}\n{')
     if new_object_index > -1:
         stdout = stdout[new_object_index + 3 :]  # noqa: E203
-    parsed = json.loads(stdout)
-    return _normalize_obj(parsed)
+    return json.loads(
+        stdout, object_pairs_hook=_normalize_pairs, parse_int=lambda value: str(int(value))
+    )
 
 
 def _normalize_obj(obj):
@@ -43,8 +58,22 @@ def parse_csv(output):
 
     # Normalize the column names to use when generating the dictionary
     try:
-        keys = [_normalize(header) for header in next(csv.reader(output))]
-        return [value for value in csv.DictReader(output[1:], fieldnames=keys)]
+        reader = csv.reader(output)
+        keys = [_normalize(header) for header in next(reader)]
+        num_keys = len(keys)
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            value = dict(zip(keys, row, strict=False))
+            if len(row) != num_keys:
+                # same as csv.DictReader for rows with extra or missing values
+                if len(row) > num_keys:
+                    value[None] = row[num_keys:]
+                else:
+                    value.update(dict.fromkeys(keys[len(row) :]))
+            rows.append(value)
+        return rows
     except csv.Error as err:
         logger.error(f'Exception while parsing CSV output {output}: {err}')
         raise
@@ -186,13 +215,14 @@ def parse_info(output):
             # we are entering or leaving a second level from lower/upper levels
             # clear the second level key
             second_level_key = None
+        stripped = line.lstrip()
         if line.startswith(' '):  # sub-properties are indented
             # values are separated by ':' or '=>', but not by '::' which can be
             # entity name like 'test::params::keys'
-            if line.find(':') != -1 and line.find('::') == -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1 and len(line.lstrip().split(" =>", 1)) == 2:
-                key, value = line.lstrip().split(" =>", 1)
+            if ':' in line and '::' not in line:
+                key, value = stripped.split(":", 1)
+            elif '=>' in line and ' =>' in stripped:
+                key, value = stripped.split(" =>", 1)
             else:
                 key = value = None
 
@@ -206,12 +236,8 @@ def parse_info(output):
                 # Template
                 #  template1
                 #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
-
-                value = match.group(1)
+                match = NUMBERED_VALUE.match(stripped)
+                value = stripped if match is None else match.group(1)
 
                 # adding list to 1 level, for example:
                 # {'template': ['template1', 'template2']}
@@ -225,7 +251,7 @@ def parse_info(output):
                     # {'subscription-information':
                     #      {'registered-by-activation-keys': ['ak1', 'ak2']}
                     #  }
-                    last_key = list(contents[sub_prop].keys())[-1]
+                    last_key = next(reversed(contents[sub_prop]))
                     if not contents[sub_prop][last_key]:
                         contents[sub_prop][last_key] = [value]
                     else:
@@ -238,7 +264,7 @@ def parse_info(output):
                 #     URL:       /custom/4f84fc90-9ffa-...
                 #  2) Repo Name: puppet1
                 #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
+                starts_with_number = NUMBERED_KEY.match(key)
                 if starts_with_number:
                     # if this is a numbered list on level 2, do nothing - this script doesn't support it
                     if current_indent_level >= 2:
@@ -248,11 +274,11 @@ def parse_info(output):
                     if sub_num == 1:
                         contents[sub_prop] = []
                     # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
+                    key = NUMBERED_KEY.sub('', key)
                     # append empty dict to array
                     contents[sub_prop].append({})
 
-                key = key.lstrip().replace(' ', '-').lower()
+                key = _normalize(key.lstrip())
                 value = value.lstrip()
                 # add value to dictionary
                 if sub_num is not None:
@@ -280,8 +306,8 @@ def parse_info(output):
                         second_level_key = key
         else:
             sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
-            key = key.lstrip().replace(' ', '-').lower()
+            key, value = stripped.split(":", 1)
+            key = _normalize(key.lstrip())
             if value.lstrip() == '':  # 'key:' no value, new sub-property
                 sub_prop = key
                 contents[sub_prop] = {}
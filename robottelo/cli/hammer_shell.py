@@ -0,0 +1,199 @@
+"""Persistent hammer process for running many hammer commands without restarting Ruby.
+
+Every ``hammer`` invocation starts a new Ruby interpreter and loads all hammer plugins, which
+alone takes seconds on a Satellite. A :class:`HammerShell` starts a small Ruby server on the
+Satellite once per xdist worker. The server preloads hammer and forks a warm child for every
+command it receives, so each command keeps its own exit status, stdout and stderr while the gem
+loading is paid only once.
+
+Requests and responses travel through a pair of FIFOs in the server work directory, using plain
+commands over the pooled ssh connection of :mod:`robottelo.ssh`. Shell expansion of the hammer
+arguments is still done by bash on the Satellite, exactly as for a regular hammer call.
+
+Use it through :meth:`robottelo.cli.base.Base.batch`::
+
+    with target_sat.cli.Base.batch():
+        org = target_sat.cli_factory.make_org()
+        target_sat.cli_factory.make_product({'organization-id': org['id']})
+"""
+
+import atexit
+import json
+import threading
+from uuid import uuid4
+
+from broker.helpers import Result
+
+from robottelo import ssh
+from robottelo.logging import logger
+
+# exit status of the request command when the server is gone and must be restarted
+SERVER_UNAVAILABLE = 254
+
+SERVER_SCRIPT = r"""
+require 'json'
+require 'tempfile'
+
+workdir, hammer_bin, idle_timeout = ARGV[0], ARGV[1], ARGV[2].to_i
+# load hammer and its plugins once, forked commands then skip the gem loading
+%w[hammer_cli hammer_cli_foreman hammer_cli_katello].each do |lib|
+  begin
+    require lib
+  rescue LoadError
+    nil
+  end
+end
+last_request = Time.now
+Thread.new do
+  loop do
+    sleep 10
+    exit!(0) if Time.now - last_request > idle_timeout
+  end
+end
+loop do
+  argv = File.binread(File.join(workdir, 'in')).split("\0")
+  last_request = Time.now
+  out, err = Tempfile.new('stdout'), Tempfile.new('stderr')
+  pid = fork do
+    $stdout.reopen(out)
+    $stderr.reopen(err)
+    $0 = 'hammer'
+    ARGV.replace(argv)
+    load hammer_bin
+  end
+  Process.wait(pid)
+  response = {
+    status: $?.exitstatus || 255,
+    stdout: File.read(out.path).scrub,
+    stderr: File.read(err.path).scrub,
+  }
+  File.write(File.join(workdir, 'out'), JSON.generate(response))
+  out.close!
+  err.close!
+  last_request = Time.now
+end
+"""
+
+
+class HammerShellError(Exception):
+    """Raised when the hammer server can not be started or reached."""
+
+
+class HammerShell:
+    """A long-lived hammer server on a single Satellite.
+
+    :param str hostname: the Satellite running the server.
+    :param int idle_timeout: seconds without a request after which the server exits by itself.
+    :param int request_timeout: seconds to wait for the server to accept a request.
+    """
+
+    def __init__(self, hostname, idle_timeout=1800, request_timeout=60):
+        self.hostname = hostname
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.workdir = f'/tmp/robottelo-hammer-{uuid4().hex}'
+        self._lock = threading.Lock()
+        self._running = False
+
+    def _run(self, command, timeout=None):
+        """Run ``command`` over the pooled connection, a broken connection is discarded"""
+        return ssh.command(command, hostname=self.hostname, timeout=timeout)
+
+    def start(self, locale):
+        """Upload the server script and start the server in the background"""
+        workdir = self.workdir
+        result = self._run(
+            f'rm -rf {workdir} && mkdir -p {workdir} && mkfifo {workdir}/in {workdir}/out && '
+            f"cat > {workdir}/server.rb <<'EOF'\n{SERVER_SCRIPT}\nEOF\n"
+            f'LANG={locale} setsid nohup ruby {workdir}/server.rb {workdir} '
+            f'"$(command -v hammer)" {self.idle_timeout} '
+            f'> {workdir}/server.log 2>&1 < /dev/null & echo $! > {workdir}/pid'
+        )
+        if result.status != 0:
+            raise HammerShellError(
+                f'Failed to start hammer server on {self.hostname}:\n{result.stderr}'
+            )
+        logger.debug(f'Started hammer server in {workdir} on {self.hostname}')
+        self._running = True
+
+    def stop(self):
+        """Stop the server and remove its work directory"""
+        if self._running:
+            self._running = False
+            self._run(f'kill "$(cat {self.workdir}/pid)" 2>/dev/null; rm -rf {self.workdir}')
+
+    def _request(self, hammer_args, timeout=None):
+        workdir = self.workdir
+        return self._run(
+            f'kill -0 "$(cat {workdir}/pid 2>/dev/null)" 2>/dev/null || exit {SERVER_UNAVAILABLE}\n'
+            f'timeout {self.request_timeout} sh -c \'printf "%s\\0" "$@" > "$0"\' '
+            f'{workdir}/in {hammer_args} || exit {SERVER_UNAVAILABLE}\n'
+            f'cat {workdir}/out',
+            timeout=timeout,
+        )
+
+    def execute(self, hammer_args, locale, timeout=None):
+        """Run one hammer command through the server
+
+        :param str hammer_args: everything that follows ``hammer`` on a regular command line.
+        :param str locale: value of ``LANG`` the server is started with.
+        :return: a result with the ``status``, ``stdout`` and ``stderr`` of the hammer command.
+        """
+        with self._lock:
+            if not self._running:
+                self.start(locale)
+            try:
+                response = self._request(hammer_args, timeout=timeout)
+            except ssh.SSH_CONNECTION_ERRORS as err:
+                # the connection was discarded, the request is sent again over a new one
+                logger.warning(f'Connection to the hammer server on {self.hostname} lost: {err}')
+                response = Result(status=SERVER_UNAVAILABLE, stdout='', stderr=str(err))
+            if response.status == SERVER_UNAVAILABLE:
+                logger.warning(f'Hammer server on {self.hostname} is gone, restarting it')
+                self.stop()
+                self.start(locale)
+                response = self._request(hammer_args, timeout=timeout)
+            if response.status != 0:
+                raise HammerShellError(
+                    f'Hammer server on {self.hostname} failed to answer:\n{response.stderr}'
+                )
+        return Result(**json.loads(response.stdout))
+
+
+_shells = {}
+_shells_lock = threading.Lock()
+_batch = threading.local()
+
+
+def get_shell(hostname):
+    """Return the hammer server of this worker for ``hostname``, creating it when missing"""
+    with _shells_lock:
+        if hostname not in _shells:
+            _shells[hostname] = HammerShell(hostname)
+        return _shells[hostname]
+
+
+def batch_active():
+    """Whether hammer commands of the current thread should go through the hammer server"""
+    return getattr(_batch, 'depth', 0) > 0
+
+
+def enter_batch():
+    _batch.depth = getattr(_batch, 'depth', 0) + 1
+
+
+def exit_batch():
+    _batch.depth -= 1
+
+
+@atexit.register
+def stop_all():
+    """Stop every hammer server started by this worker"""
+    with _shells_lock:
+        shells = list(_shells.values())
+        _shells.clear()
+    for shell in shells:
+        try:
+            shell.stop()
+        except Exception as err:  # the satellite may be gone already
+            logger.debug(f'Failed to stop hammer server on {shell.hostname}: {err}')
@@ -35,6 +35,8 @@ VALIDATORS = dict(
         Validator('server.port', default=443),
         Validator('server.ssh_username', default='root'),
         Validator('server.ssh_password', default=None),
+        Validator('server.ssh_client.pooled', default=True, is_type_of=bool),
+        Validator('server.ssh_client.pool_idle_timeout', default=300, is_type_of=int),
         Validator('server.verify_ca', default=False),
         Validator(
             'server.network_type',
@@ -50,6 +52,9 @@ VALIDATORS = dict(
             cast=NetworkType,
             default=NetworkType.IPV4.value,
         ),
+        Validator('content_host.host_pool.enabled', default=False, is_type_of=bool),
+        Validator('content_host.host_pool.size', default=1, is_type_of=int),
+        Validator('content_host.host_pool.ttl', default=1800, is_type_of=int),
     ],
     subscription=[
         Validator('subscription.rhn_username', must_exist=True),
@@ -260,6 +265,10 @@ VALIDATORS = dict(
         Validator('jira.issue_status', default=["Testing", "Release Pending"]),
         Validator('jira.cache_file', default='jira_status_cache.json'),
         Validator('jira.cache_ttl_days', default=7, is_type_of=int),
+        Validator('jira.cache_sync_minutes', default=60, is_type_of=int),
+        Validator('jira.chunk_size', default=100, is_type_of=int),
+        Validator('jira.max_workers', default=4, is_type_of=int),
+        Validator('jira.requests_per_second', default=5, cast=float),
     ],
     ldap=[
         Validator(
@@ -275,6 +284,13 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
+    manifest=[
+        Validator('manifest.pool.enabled', default=False, is_type_of=bool),
+        Validator('manifest.pool.backend', default='manifester', is_in=['manifester', 'local']),
+        Validator('manifest.pool.size', default=2, is_type_of=int),
+        Validator('manifest.pool.recycle', default=False, is_type_of=bool),
+        Validator('manifest.pool.categories', default=[], is_type_of=list),
+    ],
     mcp=[
         Validator(
             'foreman_mcp.username',
@@ -435,6 +451,14 @@ VALIDATORS = dict(
             cast=lambda x: list(map(str, x)),
         ),
         Validator('robottelo.shared_resource_wait', default=60, cast=float),
+        Validator(
+            'robottelo.shared_resource_backend',
+            default='file',
+            is_in=['file', 'redis', 'socket'],
+        ),
+        Validator('robottelo.host_facts.cache_file', default='host_facts_cache.json'),
+        Validator('robottelo.host_facts.ttl', default=0, is_type_of=int),
+        Validator('robottelo.host_facts.offline', default=False, is_type_of=bool),
     ],
     shared_function=[
         Validator('shared_function.storage', is_in=('file', 'redis'), default='file'),
@@ -448,6 +472,11 @@ VALIDATORS = dict(
         Validator('shared_function.call_retries', default=2),
         Validator('shared_function.redis_password', default=None),
     ],
+    ui=[
+        Validator('ui.session_pool.enabled', default=False, is_type_of=bool),
+        Validator('ui.session_pool.restore_cookies', default=False, is_type_of=bool),
+        Validator('ui.session_pool.max_uses', default=0, is_type_of=int),
+    ],
     upgrade=[
         Validator('upgrade.capsule_ak', must_exist=True),
     ],
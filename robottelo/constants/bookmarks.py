@@ -0,0 +1,36 @@
+"""Bookmark constants that need nailgun, exposed lazily by :mod:`robottelo.constants`"""
+
+from nailgun import entities
+
+BOOKMARK_ENTITIES_SELECTION = [
+    {
+        'name': 'ActivationKey',
+        'controller': 'katello_activation_keys',
+        'session_name': 'activationkey',
+        'old_ui': True,
+    },
+    {'name': 'Errata', 'controller': 'katello_errata', 'session_name': 'errata', 'old_ui': True},
+    {
+        'name': 'UserGroup',
+        'controller': 'usergroups',
+        'setup': entities.UserGroup,
+        'session_name': 'usergroup',
+    },
+    {
+        'name': 'PartitionTable',
+        'controller': 'ptables',
+        'setup': entities.PartitionTable,
+        'session_name': 'partitiontable',
+    },
+    {
+        'name': 'Product',
+        'controller': 'katello_products',
+        'session_name': 'product',
+        'old_ui': True,
+    },
+    {
+        'name': 'ProvisioningTemplate',
+        'controller': 'provisioning_templates',
+        'session_name': 'provisioningtemplate',
+    },
+]
@@ -0,0 +1,5 @@
+"""Provisioning constants that need nailgun, exposed lazily by :mod:`robottelo.constants`"""
+
+from nailgun import entities
+
+OPERATING_SYSTEMS = entities._OPERATING_SYSTEMS
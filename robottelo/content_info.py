@@ -1,12 +1,34 @@
 """Miscellaneous content helper functions"""
 
+import bz2
+from concurrent.futures import ThreadPoolExecutor
+import lzma
 import os
 import re
+import threading
+from urllib.parse import urljoin
+from xml.etree.ElementTree import ParseError, XMLPullParser
+import zlib
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from robottelo import ssh
 from robottelo.exceptions import CLIReturnCodeError
+from robottelo.logging import logger
+
+# concurrent requests of the directory listing crawler, also the size of the session pool
+CRAWL_WORKERS = 8
+# bytes read at once when streaming repository metadata
+CHUNK_SIZE = 1024 * 1024
+
+REPO_NS = '{http://linux.duke.edu/metadata/repo}'
+COMMON_NS = '{http://linux.duke.edu/metadata/common}'
+
+_session = None
+_session_lock = threading.Lock()
+# repomd.xml contents by url, revalidated with their ETag or Last-Modified headers
+_repomd_cache = {}
 
 
 def get_repo_files(repo_path, extension='rpm', hostname=None):
@@ -33,30 +55,170 @@ def get_repo_files(repo_path, extension='rpm', hostname=None):
     return sorted(repo_file for repo_file in result.stdout.splitlines() if repo_file)
 
 
-def get_repo_files_urls_by_url(url, extension='rpm'):
-    """Returns a list of URLs of repo files (for example rpms) in a specific repository
-    published at some URL.
+def get_session():
+    """Return the HTTP session shared by the repository inspection helpers"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.verify = False
+            adapter = HTTPAdapter(pool_connections=CRAWL_WORKERS, pool_maxsize=CRAWL_WORKERS)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+    return _session
+
+
+def _get_listing_links(url):
+    """Returns the links of an HTML directory listing, parent directory excluded"""
+    result = get_session().get(url)
+    if result.status_code != 200:
+        raise requests.HTTPError(f'{url} is not accessible')
+    return re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', result.text)
+
+
+def crawl_repo_files_urls(url, extension='rpm'):
+    """Returns a list of URLs of repo files by crawling the HTML directory listings of a repo.
+
+    The ``Packages/<letter>/`` directories are listed concurrently.
+
     :param url: URL where the repo or CV is published
     :param extension: extension of searched files. Defaults to 'rpm'
-    :return:  list representing package URLs
+    :return:  list representing file URLs
     """
     if not url.endswith('/'):
         url += '/'
+    links = _get_listing_links(url)
+    if 'Packages/' not in links:
+        return sorted(f'{url}{link}' for link in links if extension in link)
 
-    result = requests.get(url, verify=False)
-    if result.status_code != 200:
-        raise requests.HTTPError(f'{url} is not accessible')
+    subs = [
+        f'{url}Packages/{link}' for link in _get_listing_links(f'{url}Packages/') if '/' in link
+    ]
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+        listings = executor.map(_get_listing_links, subs)
+        return sorted(
+            f'{sub}{link}'
+            for sub, links in zip(subs, listings, strict=True)
+            for link in links
+            if extension in link
+        )
 
-    links = re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', result.text)
-    if 'Packages/' not in links:
-        files = sorted(line for line in links if extension in line)
-        return [f'{url}{file}' for file in files]
 
-    files = []
-    subs = get_repo_files_urls_by_url(f'{url}Packages/', extension='/')
-    for sub in subs:
-        files.extend(get_repo_files_urls_by_url(sub, extension))
-    return sorted(files)
+def get_repomd_files(repo_url):
+    """Returns the metadata files listed by the repomd file of a repository
+
+    :param repo_url: the 'Published_At' link of a repo
+    :return: dict of metadata type, e.g. 'primary', to a dict with its ``location``, ``checksum``,
+        ``checksum_type`` and ``size``
+    """
+    parser = XMLPullParser(events=('end',))
+    parser.feed(get_repomd(repo_url))
+    files = {}
+    for _, element in parser.read_events():
+        if element.tag != f'{REPO_NS}data':
+            continue
+        checksum = element.find(f'{REPO_NS}checksum')
+        size = element.findtext(f'{REPO_NS}size')
+        files[element.get('type')] = {
+            'location': element.find(f'{REPO_NS}location').get('href'),
+            'checksum': checksum.text if checksum is not None else None,
+            'checksum_type': checksum.get('type') if checksum is not None else None,
+            'size': int(size) if size else None,
+        }
+    return files
+
+
+def _stream_metadata(url):
+    """Yields the decompressed content of a repository metadata file, chunk by chunk"""
+    if url.endswith('.gz'):
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    elif url.endswith('.xz'):
+        decompressor = lzma.LZMADecompressor()
+    elif url.endswith('.bz2'):
+        decompressor = bz2.BZ2Decompressor()
+    elif url.endswith('.xml'):
+        decompressor = None
+    else:
+        raise ValueError(f'Unsupported compression of repository metadata {url}')
+    with get_session().get(url, stream=True) as result:
+        if result.status_code != 200:
+            raise requests.HTTPError(f'{url} is not accessible')
+        for chunk in result.raw.stream(CHUNK_SIZE, decode_content=False):
+            yield decompressor.decompress(chunk) if decompressor else chunk
+    if hasattr(decompressor, 'flush'):
+        yield decompressor.flush()
+
+
+def iter_repo_packages(repo_url):
+    """Yields the packages of a repository, read from its streamed primary metadata
+
+    :param repo_url: the 'Published_At' link of a repo
+    :return: generator of dicts with the package ``name``, ``arch``, ``version``, ``release``,
+        ``epoch``, ``location``, ``url``, ``checksum``, ``checksum_type`` and ``size``
+    """
+    repo_url = repo_url.rstrip('/') + '/'
+    primary = get_repomd_files(repo_url).get('primary')
+    if primary is None:
+        raise ValueError(f'primary metadata not found in repomd file of {repo_url}')
+    parser = XMLPullParser(events=('start', 'end'))
+    root = None
+    for data in _stream_metadata(urljoin(repo_url, primary['location'])):
+        parser.feed(data)
+        for event, element in parser.read_events():
+            if event == 'start':
+                root = element if root is None else root
+                continue
+            if element.tag != f'{COMMON_NS}package':
+                continue
+            version = element.find(f'{COMMON_NS}version')
+            checksum = element.find(f'{COMMON_NS}checksum')
+            location = element.find(f'{COMMON_NS}location')
+            base = location.get('{http://www.w3.org/XML/1998/namespace}base', repo_url)
+            yield {
+                'name': element.findtext(f'{COMMON_NS}name'),
+                'arch': element.findtext(f'{COMMON_NS}arch'),
+                'epoch': version.get('epoch'),
+                'version': version.get('ver'),
+                'release': version.get('rel'),
+                'location': location.get('href'),
+                'url': urljoin(base, location.get('href')),
+                'checksum': checksum.text,
+                'checksum_type': checksum.get('type'),
+                'size': int(element.find(f'{COMMON_NS}size').get('package')),
+            }
+            # the parsed packages are not needed anymore, keep the memory flat
+            root.remove(element)
+
+
+def get_repo_files_urls_by_url(url, extension='rpm'):
+    """Returns a list of URLs of repo files (for example rpms) in a specific repository
+    published at some URL.
+
+    Packages of yum repositories are read from the repository metadata, other files are found by
+    crawling the HTML directory listings.
+
+    :param url: URL where the repo or CV is published
+    :param extension: extension of searched files. Defaults to 'rpm'
+    :return:  list representing package URLs
+    """
+    if extension == 'rpm':
+        try:
+            return sorted(
+                package['url']
+                for package in iter_repo_packages(url)
+                if extension in package['location']
+            )
+        except (
+            requests.HTTPError,
+            ParseError,
+            ValueError,
+            zlib.error,
+            lzma.LZMAError,
+            EOFError,
+            OSError,
+        ) as err:
+            logger.debug(f'Crawling {url}, its repository metadata is not usable: {err}')
+    return crawl_repo_files_urls(url, extension)
 
 
 def get_repo_files_by_url(url, extension='rpm'):
@@ -72,14 +234,30 @@ def get_repo_files_by_url(url, extension='rpm'):
 def get_repomd(repo_url):
     """Fetches content of the repomd file of a repository
 
+    The content is cached and revalidated with a conditional request, so an unchanged repomd file
+    is not downloaded again.
+
     :param repo_url: the 'Published_At' link of a repo
     :return: string with repomd content
     """
-    repomd_path = 'repodata/repomd.xml'
-    result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
+    url = f'{repo_url.rstrip("/")}/repodata/repomd.xml'
+    headers = {}
+    if cached := _repomd_cache.get(url):
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+    result = get_session().get(url, headers=headers)
+    if result.status_code == 304 and cached:
+        return cached['text']
     if result.status_code != 200:
-        raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
-
+        raise requests.HTTPError(f'{url} is not accessible')
+    if result.headers.get('ETag') or result.headers.get('Last-Modified'):
+        _repomd_cache[url] = {
+            'etag': result.headers.get('ETag'),
+            'last_modified': result.headers.get('Last-Modified'),
+            'text': result.text,
+        }
     return result.text
 
 
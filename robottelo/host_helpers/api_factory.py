@@ -3,6 +3,7 @@ It is not meant to be used directly, but as part of a robottelo.hosts.Satellite
 example: my_satellite.api_factory.api_method()
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 import socket
@@ -21,6 +22,10 @@ from robottelo.constants import (
 )
 from robottelo.exceptions import APIResponseError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.host_helpers.task_waiter import backoff_delays
+
+# entities created at the same time by make_many
+MAX_WORKERS = 8
 
 
 class APIFactory:
@@ -30,6 +35,22 @@ class APIFactory:
         self._satellite = satellite
         self.__dict__.update(initiate_repo_helpers(self._satellite))
 
+    def make_many(self, entity, count, overrides=None, max_workers=MAX_WORKERS):
+        """Create ``count`` entities of the same kind concurrently
+
+        :param str entity: name of the nailgun entity class, e.g. ``Organization``
+        :param overrides: fields of all the entities, or a list with the fields of each
+        :param int max_workers: entities created at the same time
+        :return: list of the created entities, in the order of ``overrides``
+        """
+        if overrides is None or isinstance(overrides, dict):
+            overrides = [overrides or {}] * count
+        if len(overrides) != count:
+            raise ValueError(f'Expected {count} overrides, got {len(overrides)}')
+        entity_cls = getattr(self._satellite.api, entity)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda fields: entity_cls(**fields).create(), overrides))
+
     def make_http_proxy(self, org, http_proxy_type, use_ip=False):
         """
         Creates HTTP proxy.
@@ -435,52 +456,51 @@ class APIFactory:
         :param int from_when: Epoch Time (seconds in UTC) to limit number of returned tasks to investigate.
         :param int search_rate: Delay between searches.
         :param int max_tries: How many times search should be executed.
-        :param int poll_rate: Delay between the end of one task check-up and
-                the start of the next check-up. Parameter for
-                ``nailgun.entities.ForemanTask.poll()`` method.
+        :param int poll_rate: Deprecated and ignored, the Satellite ``task_waiter`` adapts
+                the delay between task check-ups.
         :param int poll_timeout: Maximum number of seconds to wait until timing out.
-                Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
-        :return: Relevant errata applicability task.
+        :return: Relevant finished errata applicability tasks.
         :raises: ``AssertionError``. If not tasks were found for given host until timeout.
         """
         assert isinstance(host_id, int), 'Param host_id have to be int'
         assert isinstance(from_when, int), 'Param from_when have to be int'
         now = int(time.time())
         assert from_when <= now, 'Param from_when have to be epoch time in the past'
-        for _ in range(max_tries):
-            now = int(time.time())
-            # Format epoch time for search, one second prior margin of safety
-            timestamp = datetime.fromtimestamp(from_when - 1).strftime('%m-%d-%Y %H:%M:%S')
-            # Long format to match search: ex. 'January 03, 2024 at 03:08:08 PM'
-            long_format = datetime.strptime(timestamp, '%m-%d-%Y %H:%M:%S').strftime(
-                '%B %d, %Y at %I:%M:%S %p'
+        # Format epoch time for search, one second prior margin of safety
+        timestamp = datetime.fromtimestamp(from_when - 1).strftime('%m-%d-%Y %H:%M:%S')
+        # Long format to match search: ex. 'January 03, 2024 at 03:08:08 PM'
+        long_format = datetime.strptime(timestamp, '%m-%d-%Y %H:%M:%S').strftime(
+            '%B %d, %Y at %I:%M:%S %p'
+        )
+        search_query = (
+            '( label = Actions::Katello::Applicability::Hosts::BulkGenerate OR'
+            ' label = Actions::Katello::Host::UploadPackageProfile ) AND'
+            f' started_at >= "{long_format}" '
+        )
+
+        def host_task(task):
+            return (
+                task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
+                and 'host_ids' in task.input
+                and host_id in task.input['host_ids']
+            ) or (
+                task.label == 'Actions::Katello::Host::UploadPackageProfile'
+                and 'host' in task.input
+                and host_id == task.input['host']['id']
             )
-            search_query = (
-                '( label = Actions::Katello::Applicability::Hosts::BulkGenerate OR'
-                ' label = Actions::Katello::Host::UploadPackageProfile ) AND'
-                f' started_at >= "{long_format}" '
+
+        try:
+            return self._satellite.task_waiter.wait_for_tasks(
+                search_query,
+                search_rate=search_rate,
+                max_tries=max_tries,
+                poll_timeout=poll_timeout,
+                task_filter=host_task,
             )
-            tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
-            tasks_finished = 0
-            for task in tasks:
-                if (
-                    task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
-                    and 'host_ids' in task.input
-                    and host_id in task.input['host_ids']
-                ) or (
-                    task.label == 'Actions::Katello::Host::UploadPackageProfile'
-                    and 'host' in task.input
-                    and host_id == task.input['host']['id']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-            if tasks_finished > 0:
-                break
-            time.sleep(search_rate)
-        else:
+        except AssertionError as err:
             raise AssertionError(
                 f'No task was found using query " {search_query} " for host id: {host_id}'
-            )
+            ) from err
 
     def register_host_and_needed_setup(
         self,
@@ -757,6 +777,7 @@ class APIFactory:
         ).stdout.splitlines()[0]
         # Set the Timeout value
         timeup = time.time() + int(timeout) * 60
+        delays = backoff_delays(max_delay=10)
         # Search Filter to filter out the task based on backend-id and sync action
         filtered_req = {
             'criteria': {
@@ -795,4 +816,4 @@ class APIFactory:
                         f"Pulp task with repo_id {repo_backend_id} error or not found: "
                         f"'{req.json().get('error')}'"
                     )
-            time.sleep(2)
+            time.sleep(next(delays))
@@ -1,8 +1,4 @@
-from datetime import UTC, datetime, timedelta
-import time
-
 from box import Box
-from dateutil.parser import parse
 
 from robottelo import ssh
 from robottelo.config import settings
@@ -12,7 +8,6 @@ from robottelo.constants import (
     PUPPET_COMMON_INSTALLER_OPTS,
 )
 from robottelo.enums import NetworkType
-from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 
 
@@ -45,30 +40,28 @@ class CapsuleInfo:
         poll_timeout=None,
         must_succeed=True,
     ):
-        """Search for tasks by specified search query and poll them to ensure that
-        task has finished.
+        """Search for tasks by specified search query and wait for all of them to finish.
+
+        Found tasks are watched by the Satellite ``task_waiter``, which checks all of them with
+        a single search per tick and returns as soon as the last one has finished.
 
         :param search_query: Search query that will be passed to API call.
         :param search_rate: Delay between searches.
         :param max_tries: How many times search should be executed.
-        :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for ``sat.api.ForemanTask.poll()`` method.
+        :param poll_rate: Deprecated and ignored, the delay between task check-ups adapts
+            to the task progress.
         :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``sat.api.ForemanTask.poll()`` method.
         :param must_succeed: Assert success result on finished task.
-        :return: List of ``sat.api.ForemanTask`` entities.
+        :return: List of finished ``sat.api.ForemanTask`` entities.
         :raises: ``AssertionError``. If not tasks were found until timeout.
         """
-        for _ in range(max_tries):
-            tasks = self.satellite.api.ForemanTask().search(query={'search': search_query})
-            if tasks:
-                for task in tasks:
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout, must_succeed=must_succeed)
-                break
-            time.sleep(search_rate)
-        else:
-            raise AssertionError(f"No task was found using query '{search_query}'")
-        return tasks
+        return self.satellite.task_waiter.wait_for_tasks(
+            search_query,
+            search_rate=search_rate,
+            max_tries=max_tries,
+            poll_timeout=poll_timeout,
+            must_succeed=must_succeed,
+        )
 
     def wait_for_sync(self, start_time=None, timeout=600):
         """Wait for capsule sync to finish and assert success.
@@ -87,62 +80,15 @@ class CapsuleInfo:
 
         :return:
             list of polled finished tasks that were in-progress from `active_sync_tasks`.
+
+        To wait for several capsules, use ``Satellite.wait_for_capsules_sync`` instead of calling
+        this method for each of them.
         """
-        # Fetch initial capsule sync status
-        logger.info(f"Waiting for capsule {self.hostname} sync to finish ...")
-        sync_status = self.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
-        # Current UTC time for start_time, if not provided
-        if start_time is None:
-            start_time = datetime.now(UTC).replace(microsecond=0)
-        # 1s margin of safety for rounding
-        start_time = (
-            (start_time - timedelta(seconds=1))
-            .replace(microsecond=0)
-            .strftime('%Y-%m-%d %H:%M:%S UTC')
+        report = self.satellite.wait_for_capsules_sync(
+            [self], start_time=start_time, timeout=timeout
         )
-        # Assert presence of recent sync activity:
-        #   one or more ongoing sync tasks for the capsule,
-        #   Or, capsule's last_sync_time is on or after start_time
-        assert len(sync_status['active_sync_tasks']) or (
-            parse(sync_status['last_sync_time']) >= parse(start_time)
-        ), (
-            f"No active or recent sync found for capsule {self.hostname}."
-            f" `active_sync_tasks` was empty: {sync_status['active_sync_tasks']},"
-            f" and the `last_sync_time`: {sync_status['last_sync_time']},"
-            f" was prior to the `start_time`: {start_time}."
-        )
-        sync_tasks = []
-        # Poll and verify succeeds, any active sync task from initial status.
-        logger.info(f"Active tasks: {sync_status['active_sync_tasks']}")
-        for task in sync_status['active_sync_tasks']:
-            sync_tasks.append(self.satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout))
-            logger.info(f"Active sync task :id {task['id']} succeeded.")
-
-        # Fetch updated capsule status (expect no ongoing sync)
-        logger.info(f"Querying updated sync status from capsule {self.hostname}.")
-        updated_status = self.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
-        # Last sync task end time is the same as capsule's last sync time.
-        assert parse(updated_status['last_sync_time']) == parse(
-            updated_status['last_sync_task']['ended_at']
-        ), f"`last_sync_time` does not match final task's end time. Capsule: {self.hostname}"
-
-        # Total time taken is not negative (sync prior to start_time),
-        # and did not exceed timeout.
-        assert (
-            timedelta(seconds=0)
-            <= parse(updated_status['last_sync_time']) - parse(start_time)
-            <= timedelta(seconds=timeout)
-        ), (
-            f"No recent sync task(s) were found for capsule: {self.hostname}, or task(s) timed out."
-            f" `last_sync_time`: ({updated_status['last_sync_time']}) was prior to `start_time`: ({start_time})"
-            f" or exceeded timeout ({timeout}s)."
-        )
-        # No failed or active tasks remaining
-        assert len(updated_status['last_failed_sync_tasks']) == 0
-        assert len(updated_status['active_sync_tasks']) == 0
-
         # return any polled sync tasks, that were initially in-progress
-        return sync_tasks
+        return report[self.hostname].tasks
 
     def get_published_repo_url(self, org, prod, repo, lce=None, cv=None):
         """Forms url of a repo or CV published on a Satellite or Capsule.
@@ -183,12 +129,14 @@ class CapsuleInfo:
         if not path:
             path = f'{PULP_ARTIFACT_DIR}{checksum[0:2]}/{checksum[2:]}'
 
-        res = self.execute(f'stat --format %s {path}')
-        if res.status:
+        stat, sha256sum, file = self.execute_many(
+            [f'stat --format %s {path}', f'sha256sum {path}', f'file {path}']
+        )
+        if stat.status:
             raise FileNotFoundError(f'Artifact not found: {path}')
-        size = int(res.stdout)
-        real_sum = self.execute(f'sha256sum {path}').stdout.split()[0]
-        info = self.execute(f'file {path}').stdout.strip().split(': ')[1]
+        size = int(stat.stdout)
+        real_sum = sha256sum.stdout.split()[0]
+        info = file.stdout.strip().split(': ')[1]
 
         return Box(path=path, size=size, sum=real_sum, info=info)
 
@@ -0,0 +1,183 @@
+"""
+Wait for the content sync of several capsules at once.
+
+:meth:`robottelo.host_helpers.capsule_mixins.CapsuleInfo.wait_for_sync` used to read the sync
+status of one capsule and poll each of its active tasks one after another, so tests with several
+capsules, e.g. load balanced ones, waited for every capsule in turn. Here the sync statuses of all
+capsules are read concurrently, all their active tasks are watched by the single search loop of
+the Satellite ``task_waiter``, and the checks of every capsule are gathered in one report.
+
+example:
+    report = satellite.wait_for_capsules_sync([capsule_1, capsule_2], start_time=timestamp)
+    tasks = report[capsule_1.hostname].tasks
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import time
+
+from dateutil.parser import parse
+from nailgun.entity_mixins import TaskTimedOutError
+
+from robottelo.logging import logger
+
+# capsule sync statuses read at the same time
+MAX_WORKERS = 8
+
+
+@dataclass
+class CapsuleSyncStatus:
+    """Sync status of one capsule, before and after its active tasks finished
+
+    ``problems`` lists the failed checks, the sync succeeded if it is empty.
+    """
+
+    hostname: str
+    initial: dict = None
+    updated: dict = None
+    tasks: list = field(default_factory=list)
+    problems: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.problems
+
+
+class CapsuleSyncReport(dict):
+    """:class:`CapsuleSyncStatus` of each capsule, by hostname"""
+
+    @property
+    def problems(self):
+        return [
+            f'{status.hostname}: {problem}'
+            for status in self.values()
+            for problem in status.problems
+        ]
+
+    @property
+    def ok(self):
+        return not self.problems
+
+    def assert_success(self):
+        """:raises: ``AssertionError`` listing the failed checks of all capsules"""
+        assert self.ok, 'Capsule sync verification failed:\n' + '\n'.join(self.problems)
+
+
+def _format_start_time(start_time):
+    if start_time is None:
+        start_time = datetime.now(UTC)
+    # 1s margin of safety for rounding
+    return (
+        (start_time - timedelta(seconds=1)).replace(microsecond=0).strftime('%Y-%m-%d %H:%M:%S UTC')
+    )
+
+
+def check_initial_status(status, start_time):
+    """Check there is an active or a recent sync: a sync task is running, or the capsule's
+    ``last_sync_time`` is on or after ``start_time``
+    """
+    sync_status = status.initial
+    if sync_status['active_sync_tasks']:
+        return
+    last_sync_time = sync_status['last_sync_time']
+    if last_sync_time is None or parse(last_sync_time) < parse(start_time):
+        status.problems.append(
+            'No active or recent sync found.'
+            f' `active_sync_tasks` was empty: {sync_status["active_sync_tasks"]},'
+            f' and the `last_sync_time`: {last_sync_time},'
+            f' was prior to the `start_time`: {start_time}.'
+        )
+
+
+def check_updated_status(status, start_time, timeout):
+    """Check the sync finished after ``start_time``, within ``timeout`` seconds, and no sync
+    task failed or is still active
+    """
+    sync_status = status.updated
+    last_sync_time = sync_status['last_sync_time']
+    if last_sync_time is None:
+        status.problems.append('`last_sync_time` is not set, the capsule was never synced.')
+    else:
+        ended_at = sync_status['last_sync_task']['ended_at']
+        if parse(last_sync_time) != parse(ended_at):
+            status.problems.append(
+                f"`last_sync_time` ({last_sync_time}) does not match final task's end time"
+                f' ({ended_at}).'
+            )
+        if not (
+            timedelta(seconds=0)
+            <= parse(last_sync_time) - parse(start_time)
+            <= timedelta(seconds=timeout)
+        ):
+            status.problems.append(
+                f'`last_sync_time`: ({last_sync_time}) was prior to `start_time`: ({start_time})'
+                f' or exceeded timeout ({timeout}s).'
+            )
+    if sync_status['last_failed_sync_tasks']:
+        failed = [task['id'] for task in sync_status['last_failed_sync_tasks']]
+        status.problems.append(f'Failed sync tasks: {failed}.')
+    if sync_status['active_sync_tasks']:
+        active = [task['id'] for task in sync_status['active_sync_tasks']]
+        status.problems.append(f'Sync tasks still active: {active}.')
+
+
+def wait_for_capsules_sync(
+    satellite, capsules, start_time=None, timeout=600, must_succeed=True, max_workers=MAX_WORKERS
+):
+    """Wait for the content sync of ``capsules`` to finish and check it succeeded
+
+    The checks are those of ``CapsuleInfo.wait_for_sync``, done for every capsule.
+
+    :param satellite: the Satellite whose ``task_waiter`` watches the sync tasks.
+    :param capsules: capsule hosts with a ``nailgun_capsule``.
+    :param start_time: UTC datetime to compare the capsules' ``last_sync_time`` against.
+        Default: None (current UTC).
+    :param timeout: maximum seconds for the active tasks and queries to finish.
+    :param must_succeed: raise if any check of any capsule failed.
+    :return: :class:`CapsuleSyncReport`
+    :raises: ``AssertionError`` listing the failed checks of all capsules.
+    """
+    start_time = _format_start_time(start_time)
+    statuses = [CapsuleSyncStatus(capsule.hostname) for capsule in capsules]
+    logger.info(f'Waiting for capsules {[s.hostname for s in statuses]} sync to finish ...')
+
+    def get_sync(capsule):
+        return capsule.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for status, sync_status in zip(statuses, executor.map(get_sync, capsules), strict=True):
+            status.initial = sync_status
+            check_initial_status(status, start_time)
+
+        # the active tasks of all capsules are polled by the same searches
+        waiter = satellite.task_waiter
+        task_sets = [
+            waiter.watch([task['id'] for task in status.initial['active_sync_tasks']])
+            for status in statuses
+        ]
+        deadline = time.monotonic() + timeout
+        for status, task_set in zip(statuses, task_sets, strict=True):
+            logger.info(f'Active tasks of {status.hostname}: {sorted(task_set.task_ids)}')
+            try:
+                status.tasks = waiter.result(
+                    task_set, timeout=max(deadline - time.monotonic(), 0), must_succeed=False
+                )
+            except TaskTimedOutError as err:
+                status.problems.append(str(err))
+                continue
+            for task in status.tasks:
+                if task.result != 'success':
+                    status.problems.append(
+                        f'Sync task {task.id} ({task.label}) finished with result {task.result}.'
+                    )
+
+        # updated statuses, no sync is expected to be ongoing
+        for status, sync_status in zip(statuses, executor.map(get_sync, capsules), strict=True):
+            status.updated = sync_status
+            check_updated_status(status, start_time, timeout)
+
+    report = CapsuleSyncReport((status.hostname, status) for status in statuses)
+    if must_succeed:
+        report.assert_success()
+    return report
@@ -4,6 +4,7 @@ It is not meant to be used directly, but as part of a robottelo.hosts.Satellite
 example: my_satellite.cli_factory.make_org()
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 from functools import lru_cache, partial
 import inspect
@@ -27,13 +28,17 @@ from fauxfactory import (
 )
 
 from robottelo import constants
+from robottelo.cli.base import Base, LazyRecord
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
 
+# entities created at the same time by make_many
+MAX_WORKERS = 8
 
-def create_object(cli_object, options, values=None, credentials=None, timeout=None):
+
+def create_object(cli_object, options, values=None, credentials=None, timeout=None, fetch='eager'):
     """
     Creates <object> with dictionary of arguments.
 
@@ -42,6 +47,8 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
         create
     :param dict values: Custom values to override default ones.
     :param list|tuple credentials: Username and password for non-default user.
+    :param str fetch: How the new record is read back, see ``Base.create``. Entities which
+        override ``create`` without a ``fetch`` argument are always read right away.
     :raise robottelo.host_helpers.cli_factory.CLIFactoryError: Raise an exception if object
         cannot be created.
     :rtype: dict
@@ -52,7 +59,10 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
     if credentials:
         cli_object = cli_object.with_user(*credentials)
     try:
-        result = cli_object.create(options, timeout)
+        if 'fetch' in inspect.signature(cli_object.create).parameters:
+            result = cli_object.create(options, timeout, fetch=fetch)
+        else:
+            result = cli_object.create(options, timeout)
     except CLIReturnCodeError as err:
         # If the object is not created, raise exception, stop the show.
         raise CLIFactoryError(
@@ -61,6 +71,8 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
     # Sometimes we get a list with a dictionary and not a dictionary.
     if isinstance(result, list) and len(result) > 0:
         result = result[0]
+    if isinstance(result, LazyRecord):
+        return result
     return Box(result)
 
 
@@ -299,11 +311,46 @@ class CLIFactory:
     @lru_cache
     def _find_entity_class(self, entity_name):
         entity_name = entity_name.replace('_', '').lower()
-        for name, class_obj in self._satellite.cli.__dict__.items():
+        for name in self._satellite.cli.entity_names():
             if entity_name == name.lower():
-                return class_obj
+                return getattr(self._satellite.cli, name)
         return None
 
+    def make_many(self, entity, count, overrides=None, fields=None, max_workers=MAX_WORKERS):
+        """Create ``count`` entities of the same kind concurrently
+
+        Entities with default fields in ``ENTITY_FIELDS`` are created from several threads, each
+        with its own isolated CLI class. Entities with a dedicated make method are created one
+        after another through the persistent hammer server, see ``Base.batch``.
+
+        :param str entity: the entity name of its make method, e.g. ``org`` for ``make_org``
+        :param overrides: options of all the entities, or a list with the options of each
+        :param fields: fields needed from the new records. The records missing any of them
+            are read with ``info`` right away, concurrently, the others on first access of
+            a field missing from the ``create`` output, see ``LazyRecord``.
+        :param int max_workers: entities created at the same time
+        :return: list of the new records, in the order of ``overrides``
+        """
+        if overrides is None or isinstance(overrides, dict):
+            overrides = [overrides or {}] * count
+        if len(overrides) != count:
+            raise CLIFactoryError(f'Expected {count} overrides, got {len(overrides)}')
+        # default values are generated here, make_<entity> evaluates them on each access
+        makers = [getattr(self, f'make_{entity}') for _ in range(count)]
+        if not isinstance(makers[0], partial):
+            with self._satellite.cli.Base.batch():
+                return [make(dict(values)) for make, values in zip(makers, overrides, strict=True)]
+
+        def create(make, values):
+            cli_object, options = make.args
+            record = create_object(cli_object.isolated(), options, dict(values), fetch='lazy')
+            for name in fields or ():
+                record.get(name)
+            return record
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(create, makers, overrides))
+
     def make_content_credential(self, options=None):
         """Creates a content credential.
 
@@ -445,7 +492,7 @@ class CLIFactory:
         if not options.get('operatingsystem') and not options.get('operatingsystem-id'):
             try:
                 options['operatingsystem-id'] = self._satellite.cli.OperatingSys.list(
-                    {'search': 'name="RedHat" AND (major="7" OR major="8")'}
+                    {'search': 'name="RedHat" AND (major="7" OR major="8")', 'per-page': 1}
                 )[0]['id']
             except IndexError:
                 options['operatingsystem-id'] = self.make_os(
@@ -462,6 +509,7 @@ class CLIFactory:
                     {
                         'operatingsystem': options.get('operatingsystem'),
                         'operatingsystem-id': options.get('operatingsystem-id'),
+                        'per-page': 1,
                     }
                 )[0]['id']
             except IndexError:
@@ -500,9 +548,8 @@ class CLIFactory:
         args = {'name': gen_alphanumeric()}
 
         if options is None or 'url' not in options:
-            newport = self._satellite.available_capsule_port
             try:
-                with self._satellite.default_url_on_new_port(9090, newport) as url:
+                with self._satellite.default_url_on_new_port(9090) as url:
                     args['url'] = url
                     return create_object(self._satellite.cli.Proxy, args, options)
             except CapsuleTunnelError as err:
@@ -588,6 +635,7 @@ class CLIFactory:
             'activation_key': self._satellite.cli.ActivationKey.info({'id': ak_id}),
         }
 
+    @Base.batch()
     def setup_org_for_a_custom_repo(self, options=None):
         """Sets up Org for the given custom repo by:
 
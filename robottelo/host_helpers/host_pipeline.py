@@ -0,0 +1,130 @@
+"""
+Check out and set up several content hosts concurrently.
+
+Every host goes through the same stages: Broker checkout, wait for its SSH connection, the host
+``setup`` and an optional setup function, e.g. registration and repository enablement. Each host
+runs through all its stages in its own worker, so the stages of different hosts overlap instead
+of waiting for one host after another.
+
+example:
+    with HostPipeline([conf, conf], setup=lambda host: host.register(...)) as hosts:
+        ...
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from broker import Broker
+
+from robottelo.exceptions import ContentHostError
+from robottelo.logging import logger
+
+# hosts checked out and set up at the same time
+MAX_WORKERS = 8
+
+
+@dataclass
+class HostSetupResult:
+    """Outcome of the pipeline for one host configuration
+
+    ``stage`` is the last stage the host reached, the one which failed if ``error`` is set.
+    """
+
+    conf: dict
+    host: object = None
+    stage: str = None
+    error: Exception = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class HostPipeline:
+    """Check out and set up one host per configuration, concurrently
+
+    :param host_confs: Broker checkout arguments of each host, e.g. from ``host_conf(request)``
+    :param setup: function called with each host once it is reachable
+    :param host_class: class of the hosts, defaults to ``robottelo.hosts.ContentHost``
+    :param max_workers: hosts processed at the same time
+    :param connection_timeout: seconds to wait for the SSH connection of each host
+    """
+
+    def __init__(
+        self,
+        host_confs,
+        setup=None,
+        host_class=None,
+        max_workers=MAX_WORKERS,
+        connection_timeout=180,
+    ):
+        if host_class is None:
+            from robottelo.hosts import ContentHost
+
+            host_class = ContentHost
+        self.host_confs = list(host_confs)
+        self.setup = setup
+        self.host_class = host_class
+        self.max_workers = max(1, min(max_workers, len(self.host_confs)))
+        self.connection_timeout = connection_timeout
+        self.results = []
+
+    @property
+    def hosts(self):
+        """Hosts which went through all the stages"""
+        return [result.host for result in self.results if result.ok]
+
+    def _process(self, conf):
+        result = HostSetupResult(conf=conf, stage='checkout')
+        try:
+            result.host = Broker(**conf, host_class=self.host_class).checkout()
+            result.stage = 'connect'
+            result.host.wait_for_connection(timeout=self.connection_timeout)
+            result.stage = 'setup'
+            result.host.setup()
+            if self.setup:
+                self.setup(result.host)
+        except Exception as err:  # reported in the results, not to stop the other hosts
+            logger.warning(f'Host {result.host or conf} failed at {result.stage}: {err}')
+            result.error = err
+        return result
+
+    def run(self):
+        """Check out and set up all the hosts
+
+        :return: list of ``HostSetupResult``, in the order of ``host_confs``
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            self.results = list(executor.map(self._process, self.host_confs))
+        return self.results
+
+    def _release(self, host):
+        try:
+            host.teardown()
+        except Exception as err:  # the host is checked in anyway
+            logger.warning(f'Failed to tear down host {host}: {err}')
+        # like Broker's context manager, hosts kept by the test stay checked out
+        if not getattr(host, '_skip_context_checkin', False):
+            Broker(hosts=[host]).checkin()
+
+    def checkin(self):
+        """Tear down and check in all the checked out hosts"""
+        hosts = [result.host for result in self.results if result.host is not None]
+        if hosts:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._release, hosts))
+        self.results = []
+
+    def __enter__(self):
+        """Return the hosts, all hosts are checked in if any of them failed"""
+        self.run()
+        if failed := [result for result in self.results if not result.ok]:
+            self.checkin()
+            errors = '; '.join(f'{result.stage}: {result.error}' for result in failed)
+            raise ContentHostError(
+                f'{len(failed)} of {len(self.host_confs)} hosts failed: {errors}'
+            ) from failed[0].error
+        return self.hosts
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.checkin()
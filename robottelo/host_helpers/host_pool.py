@@ -0,0 +1,170 @@
+"""
+Warm pool of checked out content hosts, kept by each xdist worker.
+
+Hosts are keyed by their Broker checkout arguments, e.g. the result of ``host_conf(request)``,
+so a host is only handed out for the same distro, version, network and container/vm choice.
+Once a host is handed out, hosts of the same configuration are checked out in the background
+until ``size`` of them are idle again. A host given back after a test is torn down
+(unregistered), reset, and kept only if its installed packages and repository files did not
+change since its checkout. Hosts idle for longer than ``ttl`` seconds are checked in.
+"""
+
+from collections import defaultdict
+import json
+import threading
+import time
+
+from broker import Broker
+
+from robottelo.logging import logger
+
+# fingerprint of what a test may leave behind on a host
+FINGERPRINT_COMMAND = '{ rpm -qa | sort; ls -1 /etc/yum.repos.d; } | sha256sum'
+
+
+class HostPool:
+    """Pool of checked out hosts, handed out to tests and recycled when they stay clean
+
+    :param host_class: class of the hosts, e.g. ``robottelo.hosts.ContentHost``
+    :param size: idle hosts kept ready per host configuration
+    :param ttl: seconds an idle host is kept before it is checked in
+    """
+
+    def __init__(self, host_class, size=1, ttl=1800):
+        self.host_class = host_class
+        self.size = size
+        self.ttl = ttl
+        self._idle = defaultdict(list)
+        self._fingerprints = {}
+        self._refills = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def key(conf):
+        return json.dumps(conf, sort_keys=True, default=str)
+
+    def fingerprint(self, host):
+        return host.execute(FINGERPRINT_COMMAND).stdout.split()[0]
+
+    def _checkout(self, conf):
+        host = Broker(**conf, host_class=self.host_class).checkout()
+        try:
+            host.setup()
+            self._fingerprints[id(host)] = self.fingerprint(host)
+        except Exception:
+            self._checkin(host, teardown=False)
+            raise
+        return host
+
+    def _checkin(self, host, teardown=True):
+        self._fingerprints.pop(id(host), None)
+        if teardown:
+            try:
+                host.teardown()
+            except Exception as err:  # the host is checked in anyway
+                logger.warning(f'Failed to tear down pooled host {host}: {err}')
+        if getattr(host, '_skip_context_checkin', False):
+            # kept checked out, e.g. by upgrade tests for the tests after the upgrade
+            logger.debug(f'Not checking in pooled host {host}, _skip_context_checkin is set')
+            return
+        try:
+            Broker(hosts=[host]).checkin()
+        except Exception as err:
+            logger.warning(f'Failed to check in pooled host {host}: {err}')
+
+    def _expire(self):
+        """Check in the hosts idle for longer than ``ttl``"""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for key, entries in self._idle.items():
+                expired.extend(host for host, since in entries if now - since >= self.ttl)
+                self._idle[key] = [
+                    (host, since) for host, since in entries if now - since < self.ttl
+                ]
+        for host in expired:
+            logger.debug(f'Checking in pooled host {host}, idle for more than {self.ttl}s')
+            self._checkin(host)
+
+    def _fill(self, key, conf):
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle[key]) >= self.size:
+                    return
+            try:
+                host = self._checkout(conf)
+            except Exception as err:
+                logger.warning(f'Failed to check out a host for the pool: {err}')
+                return
+            with self._lock:
+                if not self._closed:
+                    self._idle[key].append((host, time.monotonic()))
+                    continue
+            self._checkin(host)
+
+    def _refill(self, key, conf):
+        """Check out hosts in the background until ``size`` of them are idle"""
+        with self._lock:
+            if self._closed or self.size < 1:
+                return
+            if (thread := self._refills.get(key)) and thread.is_alive():
+                return
+            thread = threading.Thread(target=self._fill, args=(key, conf), daemon=True)
+            self._refills[key] = thread
+        thread.start()
+
+    def acquire(self, conf):
+        """Return a host for the checkout arguments, an idle one if there is any"""
+        self._expire()
+        key = self.key(conf)
+        with self._lock:
+            host = self._idle[key].pop(0)[0] if self._idle[key] else None
+        if host is None:
+            host = self._checkout(conf)
+        else:
+            logger.debug(f'Using pooled host {host}')
+        self._refill(key, conf)
+        return host
+
+    def is_clean(self, host):
+        """Return True if the host is unregistered and its packages and repos are unchanged"""
+        return not host.subscribed and self.fingerprint(host) == self._fingerprints.get(id(host))
+
+    def release(self, host, conf, reusable=True):
+        """Give a host back to the pool after a test
+
+        :param host: the host returned by ``acquire``
+        :param conf: the checkout arguments given to ``acquire``
+        :param reusable: False to check in the host anyway, e.g. when the test failed
+
+        Hosts with ``_skip_context_checkin`` set are neither recycled nor checked in.
+        """
+        key = self.key(conf)
+        if getattr(host, '_skip_context_checkin', False):
+            reusable = False
+        if reusable and not self._closed:
+            try:
+                host.teardown()
+                host.setup()
+                clean = self.is_clean(host)
+            except Exception as err:
+                logger.warning(f'Failed to reset pooled host {host}: {err}')
+                clean = False
+            if clean:
+                with self._lock:
+                    if not self._closed and len(self._idle[key]) < self.size:
+                        self._idle[key].append((host, time.monotonic()))
+                        return
+            self._checkin(host, teardown=False)
+            return
+        self._checkin(host)
+
+    def close(self):
+        """Check in all the idle hosts, hosts being checked out are checked in when ready"""
+        with self._lock:
+            self._closed = True
+            hosts = [host for entries in self._idle.values() for host, _ in entries]
+            self._idle.clear()
+        for host in hosts:
+            self._checkin(host)
@@ -0,0 +1,134 @@
+"""
+Lease ports of the fake capsule range of a Satellite, across xdist workers.
+
+Fake capsules and tunnels need a free port of ``fake_capsules.port_range`` on the Satellite.
+Picking a random port among the ports ``ss`` does not list lets two workers pick the same one
+before either opens it. Leases are recorded in a json file shared by the workers of the run and
+guarded by an flock, so a leased port is never handed out twice until it is released. One
+``ss`` snapshot is reused for all leases taken within ``snapshot_ttl`` seconds.
+
+example:
+    with satellite.port_leases.lease() as port:
+        ...
+"""
+
+import contextlib
+import json
+import os
+from pathlib import Path
+import random
+import threading
+import time
+
+from robottelo.cli.proxy import CapsuleTunnelError
+from robottelo.logging import logger
+from robottelo.utils import file_lock, pid_alive, write_atomic
+
+# seconds an ss snapshot of the used ports is reused for
+SNAPSHOT_TTL = 30
+# seconds a worker waits for another worker updating the leases
+LOCK_TIMEOUT = 60
+
+
+def parse_port_range(port_range):
+    """Return the range of ports of a ``'9091-9190'`` string or a tuple of two ports"""
+    if isinstance(port_range, str):
+        port_range = tuple(port_range.split('-'))
+    if isinstance(port_range, tuple | list) and len(port_range) == 2:
+        return range(int(port_range[0]), int(port_range[1]))
+    raise TypeError(
+        f'Expected type of port_range is a tuple of 2 elements, got {type(port_range)} instead'
+    )
+
+
+def parse_used_ports(output):
+    """Return the set of ports listed one per line, other lines are ignored"""
+    return {int(line) for line in output.split() if line.isdigit()}
+
+
+class PortLeases:
+    """This class is part of a mixin and not to be used directly. See robottelo.hosts.Satellite
+
+    :param satellite: the Satellite whose ports are leased.
+    :param port_range: range of leased ports, see :func:`parse_port_range`.
+    :param store: path of the json file recording the leases.
+    :param snapshot_ttl: seconds an ``ss`` snapshot of the used ports is reused for.
+    """
+
+    def __init__(self, satellite, port_range, store, snapshot_ttl=SNAPSHOT_TTL):
+        self._satellite = satellite
+        self.ports = parse_port_range(port_range)
+        self.store = Path(store)
+        self.lock_file = self.store.with_name(f'{self.store.name}.lock')
+        self.snapshot_ttl = snapshot_ttl
+        self._snapshot = None
+        self._snapshot_time = None
+        self._lock = threading.Lock()
+
+    def used_ports(self, refresh=False):
+        """Return the ports of the range in use on the Satellite, from a recent ``ss`` snapshot"""
+        with self._lock:
+            if (
+                refresh
+                or self._snapshot is None
+                or time.monotonic() - self._snapshot_time > self.snapshot_ttl
+            ):
+                result = self._satellite.execute(
+                    f'ss -tnaH sport ge {self.ports[0]} sport le {self.ports[-1]}'
+                    " | awk '{n=split($4, p, \":\"); print p[n]}' | sort -u"
+                )
+                if result.stderr:
+                    raise CapsuleTunnelError(
+                        f'Failed to create ssh tunnel: Error getting port status: {result.stderr}'
+                    )
+                self._snapshot = parse_used_ports(result.stdout)
+                self._snapshot_time = time.monotonic()
+            return self._snapshot
+
+    def _read(self):
+        """Return the leases of running processes, by port"""
+        try:
+            leases = json.loads(self.store.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {port: lease for port, lease in leases.items() if pid_alive(lease['pid'])}
+
+    def available(self):
+        """Return the ports neither used on the Satellite nor leased"""
+        leased = {int(port) for port in self._read()}
+        return sorted(set(self.ports) - self.used_ports() - leased)
+
+    def acquire(self):
+        """Lease a free port, until :meth:`release` is called or this process exits
+
+        :raises: ``CapsuleTunnelError`` when no port is available
+        """
+        with file_lock(self.lock_file, timeout=LOCK_TIMEOUT):
+            leases = self._read()
+            free = set(self.ports) - self.used_ports() - {int(port) for port in leases}
+            if not free:
+                raise CapsuleTunnelError(
+                    'Failed to create ssh tunnel: No more ports available for mapping'
+                )
+            port = random.choice(sorted(free))
+            leases[str(port)] = {'pid': os.getpid(), 'time': time.time()}
+            write_atomic(self.store, json.dumps(leases))
+        logger.debug(f'Leased port {port} of {self._satellite.hostname}')
+        return port
+
+    def release(self, port):
+        """Release a leased port"""
+        with file_lock(self.lock_file, timeout=LOCK_TIMEOUT):
+            leases = self._read()
+            leases.pop(str(port), None)
+            write_atomic(self.store, json.dumps(leases))
+        logger.debug(f'Released port {port} of {self._satellite.hostname}')
+
+    @contextlib.contextmanager
+    def lease(self):
+        """Lease a free port for the duration of the context"""
+        port = self.acquire()
+        try:
+            yield port
+        finally:
+            self.release(port)
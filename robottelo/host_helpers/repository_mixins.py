@@ -7,6 +7,7 @@ import inspect
 import sys
 
 from robottelo import constants
+from robottelo.cli.base import Base
 from robottelo.config import settings
 from robottelo.exceptions import (
     DistroNotSupportedError,
@@ -405,7 +406,7 @@ class GenericRHRepository(BaseRepository):
             raise ValueError('Can not handle Custom repository with url not supplied')
         if self.cdn:
             data = self.data
-            if not self.satellite.cli.Repository.list(
+            if not self.satellite.cli.Repository.exists(
                 {
                     'organization-id': organization_id,
                     'name': data['repository'],
@@ -722,11 +723,12 @@ class RepositoryCollection:
         """Check if an organization has a manifest, an organization has manifest if one of it's
         subscriptions have the account defined.
         """
-        subscriptions = self.satellite.cli.Subscription.list(
-            {'organization-id': organization_id}, per_page=False
+        subscriptions = self.satellite.cli.Subscription.iter_list(
+            {'organization-id': organization_id}, per_page=100
         )
         return any(bool(sub['account']) for sub in subscriptions)
 
+    @Base.batch()
     def setup_content(
         self,
         org_id,
@@ -1,6 +1,5 @@
 import contextlib
 from functools import lru_cache
-import json
 import os
 import random
 import re
@@ -9,10 +8,10 @@ from urllib.request import urlopen
 
 from broker.hosts import Host
 from fauxfactory import gen_string
-import requests
 from wait_for import TimedOutError, wait_for
 import yaml
 
+from robottelo import content_info
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import robottelo_tmp_dir, settings
 from robottelo.constants import (
@@ -23,10 +22,14 @@ from robottelo.constants import (
 )
 from robottelo.enums import NetworkType
 from robottelo.exceptions import CLIReturnCodeError, NoManifestProvidedError
+from robottelo.host_helpers import capsule_sync
 from robottelo.host_helpers.api_factory import APIFactory
 from robottelo.host_helpers.cli_factory import CLIFactory
+from robottelo.host_helpers.port_lease import PortLeases
+from robottelo.host_helpers.task_waiter import TaskWaiter
 from robottelo.host_helpers.ui_factory import UIFactory
 from robottelo.logging import logger
+from robottelo.utils import usage_report
 from robottelo.utils.installer import InstallerCommand
 
 
@@ -77,24 +80,7 @@ class ContentInfo:
         :param extension: extension of searched files. Defaults to 'rpm'
         :return:  list representing rpm package names
         """
-        if not url.endswith('/'):
-            url += '/'
-
-        result = requests.get(url, verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{url} is not accessible')
-
-        links = re.findall(r'(?<=href=").*?(?=">)', result.text)
-
-        if 'Packages/' not in links:
-            return sorted(line for line in links if extension in line)
-
-        files = []
-        subs = self.get_repo_files_by_url(f'{url}Packages/', extension='/')
-        for sub in subs:
-            files.extend(self.get_repo_files_by_url(f'{url}Packages/{sub}', extension))
-
-        return sorted(files)
+        return content_info.get_repo_files_by_url(url, extension)
 
     def get_repomd(self, repo_url):
         """Fetches content of the repomd file of a repository
@@ -102,12 +88,7 @@ class ContentInfo:
         :param repo_url: the 'Published_At' link of a repo
         :return: string with repomd content
         """
-        repomd_path = 'repodata/repomd.xml'
-        result = requests.get(f'{repo_url}/{repomd_path}', verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{repo_url}/{repomd_path} is not accessible')
-
-        return result.text
+        return content_info.get_repomd(repo_url)
 
     def get_repomd_revision(self, repo_url):
         """Fetches a revision of a repository.
@@ -116,11 +97,26 @@ class ContentInfo:
         :return: string containing repository revision
         :rtype: str
         """
-        match = re.search('(?<=<revision>).*?(?=</revision>)', self.get_repomd(repo_url))
-        if not match:
-            raise ValueError(f'<revision> not found in repomd file of {repo_url}')
-
-        return match.group(0)
+        return content_info.get_repomd_revision(repo_url)
+
+    def wait_for_capsules_sync(self, capsules, start_time=None, timeout=600, must_succeed=True):
+        """Wait for the content sync of several capsules concurrently and check it succeeded.
+
+        The active sync tasks of all capsules are watched by the ``task_waiter`` and the
+        checks of ``Capsule.wait_for_sync`` are reported for all capsules at once.
+
+        :param capsules: list of capsule hosts
+        :param start_time: UTC datetime to compare the capsules' last_sync_time against.
+            Default: None (current UTC).
+        :param timeout: maximum seconds for active task(s) and queries to finish.
+        :param must_succeed: raise if the sync of any capsule could not be verified.
+        :return: ``CapsuleSyncReport``, the sync status and polled tasks of each capsule
+            by hostname.
+        :raises: ``AssertionError`` listing the failed checks of all capsules.
+        """
+        return capsule_sync.wait_for_capsules_sync(
+            self, capsules, start_time=start_time, timeout=timeout, must_succeed=must_succeed
+        )
 
     def checksum_by_url(self, url, sum_type='md5sum'):
         """Returns desired checksum of a file, accessible via URL. Useful when you want
@@ -135,12 +131,16 @@ class ContentInfo:
             reached or calculation was not successful).
         """
         filename = url.split('/')[-1]
-        result = self.execute(f'wget -q --spider {url}')
-        if result.status != 0:
+        results = self.execute_many(
+            [
+                f'wget -q --spider {url}',
+                f'wget -qO - {url} | tee {filename} | {sum_type} | awk \'{{print $1}}\'',
+            ],
+            stop_on_error=True,
+        )
+        if results[0].status != 0:
             raise AssertionError(f'Failed to get `{filename}` from `{url}`.')
-        return self.execute(
-            f'wget -qO - {url} | tee {filename} | {sum_type} | awk \'{{print $1}}\''
-        ).stdout.strip()
+        return results[1].stdout.strip()
 
     def upload_manifest(self, org_id, manifest=None, interface='API', timeout=None):
         """Upload a manifest using the requested interface.
@@ -210,87 +210,97 @@ class ContentInfo:
         # removes metadata filename
         return os.path.dirname(re.sub(rf'.*{PULP_EXPORT_DIR}', PULP_IMPORT_DIR, export_message))
 
-    def get_reported_value(self, report_key):
+    @property
+    def usage_report(self):
+        """Snapshot of ``satellite-maintain report generate``, generated on first lookup
+
+        Call ``usage_report.refresh()`` after changing the state the report is expected to show.
+        """
+        if not getattr(self, '_usage_report', None):
+
+            def generate():
+                result = self.execute('satellite-maintain report generate')
+                assert result.status == 0, 'report failed'
+                return usage_report.parse_report(result.stdout)
+
+            self._usage_report = usage_report.ReportSnapshot(generate)
+        return self._usage_report
+
+    @property
+    def condensed_usage_report(self):
+        """Snapshot of ``satellite-maintain report condense``, generated on first lookup"""
+        if not getattr(self, '_condensed_usage_report', None):
+
+            def generate():
+                result = self.cli.SatelliteMaintainReport.condense()
+                assert result.status == 0, 'report failed'
+                return usage_report.parse_condensed_report(result.stdout)
+
+            self._condensed_usage_report = usage_report.ReportSnapshot(generate)
+        return self._condensed_usage_report
+
+    def get_reported_value(self, report_key, refresh=False):
         """
-        Runs satellite-maintain report generate and extracts the value for a given key
+        Extracts the value for a given key from the satellite-maintain report
+
+        :param report_key: the key, or a part of it, ignoring case
+        :param refresh: generate the report again instead of using the snapshot
         """
-        result = self.execute(f'satellite-maintain report generate | grep -i "{report_key}"')
-        assert result.status == 0, 'report failed or key not found'
-        return "".join(result.stdout.split(":", 1)[1].split())
+        values = self.usage_report.refresh() if refresh else self.usage_report.values
+        value = usage_report.find_value(values, report_key)
+        assert value is not None, 'report failed or key not found'
+        return "".join(value.split())
 
-    def get_reported_condensed_value(self, report_key):
+    def get_reported_condensed_value(self, report_key, refresh=False):
         """
-        Runs satellite-maintain report condense and extracts the value for a given key
+        Extracts the value for a given key from the satellite-maintain condensed report
+
+        :param report_key: the key
+        :param refresh: generate the report again instead of using the snapshot
         """
-        result = self.cli.SatelliteMaintainReport.condense()
-        assert result.status == 0, 'report failed'
-        report = "{" + result.stdout.strip().split("{")[1]
-        return json.loads(report)[report_key]
+        report = self.condensed_usage_report
+        return (report.refresh() if refresh else report.values)[report_key]
 
 
 class SystemInfo:
     """Things that needs access to satellite shell for gaining satellite system configuration"""
 
     @property
-    def available_capsule_port(self):
-        """returns a list of unused ports dedicated for fake capsules on satellite.
+    def port_leases(self):
+        """Leases of the fake capsule ports, shared by the workers of the run"""
+        if not getattr(self, '_port_leases', None):
+            self._port_leases = PortLeases(
+                self,
+                settings.fake_capsules.port_range,
+                robottelo_tmp_dir / f'port_leases_{self.hostname}.json',
+            )
+        return self._port_leases
 
-        This calls an ss command on the server prompting for a port range. ss
-        returns a list of ports which have a PID assigned (a list of ports
-        which are already used). This function then subtracts unavailable ports
-        from the other ones and returns one of available ones randomly.
+    @property
+    def available_capsule_port(self):
+        """returns a random unused port dedicated for fake capsules on satellite.
 
-        :param port_pool: A list of ports used for fake capsules (for RHEL7+: don't
-            forget to set a correct selinux context before otherwise you'll get
-            Connection Refused error)
+        Ports in use on the server, according to a recent ss snapshot, and ports leased by
+        ``port_leases`` are excluded. The port is not reserved, prefer leasing one with
+        ``port_leases.lease()`` or ``default_url_on_new_port``.
 
         :return: Random available port from interval <9091, 9190>.
         :rtype: int
         """
-        port_pool_range = settings.fake_capsules.port_range
-        if isinstance(port_pool_range, str):
-            port_pool_range = tuple(port_pool_range.split('-'))
-        if isinstance(port_pool_range, tuple) and len(port_pool_range) == 2:
-            port_pool = range(int(port_pool_range[0]), int(port_pool_range[1]))
-        else:
-            raise TypeError(
-                'Expected type of port_range is a tuple of 2 elements,'
-                f'got {type(port_pool_range)} instead'
-            )
-        # returns a list of strings
-        ss_cmd = self.execute(
-            f"ss -tnaH sport ge {port_pool[0]} sport le {port_pool[-1]}"
-            " | awk '{n=split($4, p, \":\"); print p[n]}' | sort -u"
-        )
-        if ss_cmd.stderr:
-            raise CapsuleTunnelError(
-                f'Failed to create ssh tunnel: Error getting port status: {ss_cmd.stderr}'
-            )
-        # converts a List of strings to a List of integers
-        try:
-            print(ss_cmd)
-            used_ports = map(
-                int, [val for val in ss_cmd.stdout.splitlines()[:-1] if val != 'Cannot stat file ']
-            )
-
-        except ValueError:
-            raise CapsuleTunnelError(
-                f'Failed parsing the port numbers from stdout: {ss_cmd.stdout.splitlines()[:-1]}'
-            ) from None
         try:
-            # take the list of available ports and return randomly selected one
-            return random.choice([port for port in port_pool if port not in used_ports])
+            return random.choice(self.port_leases.available())
         except IndexError:
             raise CapsuleTunnelError(
                 'Failed to create ssh tunnel: No more ports available for mapping'
             ) from None
 
     @contextlib.contextmanager
-    def default_url_on_new_port(self, oldport, newport):
+    def default_url_on_new_port(self, oldport, newport=None):
         """Creates context where the default capsule is forwarded on a new port
 
         :param int oldport: Port to be forwarded.
-        :param int newport: New port to be used to forward `oldport`.
+        :param int newport: New port to be used to forward `oldport`. By default a port is
+            leased from ``port_leases`` for the duration of the context.
 
         :return: A string containing the new capsule URL with port.
         :rtype: str
@@ -328,14 +338,17 @@ class SystemInfo:
                     # Something failed, so raise an exception.
                     raise CapsuleTunnelError(f'Starting ncat failed: {err}') from e
 
-        ncat_pid = start_ncat()
-        try:
-            forward_url = f'https://{self.hostname}:{newport}'
-            logger.debug(f'Yielding capsule forward port url: {forward_url}')
-            yield forward_url
-        finally:
-            logger.debug(f'Killing ncat pid: {ncat_pid}')
-            self.execute(f'kill {ncat_pid.pop()}')
+        with contextlib.ExitStack() as stack:
+            if newport is None:
+                newport = stack.enter_context(self.port_leases.lease())
+            ncat_pid = start_ncat()
+            try:
+                forward_url = f'https://{self.hostname}:{newport}'
+                logger.debug(f'Yielding capsule forward port url: {forward_url}')
+                yield forward_url
+            finally:
+                logger.debug(f'Killing ncat pid: {ncat_pid}')
+                self.execute(f'kill {ncat_pid.pop()}')
 
     def validate_pulp_filepath(
         self,
@@ -441,6 +454,12 @@ class Factories:
             self._api_factory = APIFactory(self)
         return self._api_factory
 
+    @property
+    def task_waiter(self):
+        if not getattr(self, '_task_waiter', None):
+            self._task_waiter = TaskWaiter(self)
+        return self._task_waiter
+
     @lru_cache
     def ui_factory(self, session):
         return UIFactory(self, session=session)
@@ -0,0 +1,235 @@
+"""
+Waiting engine for foreman tasks, shared by everything that waits on tasks of one Satellite.
+It is not meant to be used directly, but as part of a robottelo.hosts.Satellite instance
+example: my_satellite.task_waiter.wait_for_ids([task_id])
+
+All pending task ids of all waiting callers are checked with a single ForemanTask search per
+tick from one background thread. The delay between ticks starts short and grows exponentially
+while nothing changes, and every caller is woken up as soon as the last of its tasks finishes.
+A failed search is retried after the same delays, the callers only fail after several failed
+searches in a row or when they time out.
+"""
+
+import threading
+import time
+
+from nailgun import entity_mixins
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
+from robottelo.logging import logger
+
+# foreman task states in which a task does not progress anymore, same as nailgun ``poll``
+FINISHED_STATES = ('paused', 'stopped')
+# failed searches in a row after which the waiting callers fail
+MAX_SEARCH_ERRORS = 5
+
+
+def backoff_delays(min_delay=0.5, max_delay=15, factor=1.5):
+    """Yield exponentially growing delays, from ``min_delay`` up to ``max_delay``"""
+    delay = min_delay
+    while True:
+        yield delay
+        delay = min(delay * factor, max_delay)
+
+
+class TaskSet:
+    """A set of foreman tasks a single caller waits for.
+
+    :param list task_ids: ids of the watched tasks.
+    """
+
+    def __init__(self, task_ids):
+        self.task_ids = {str(task_id) for task_id in task_ids}
+        self.tasks = {}
+        self.error = None
+        self.done = threading.Event()
+
+    def update(self, task):
+        """Record a finished task, wake the caller up when it was the last one"""
+        self.tasks[str(task.id)] = task
+        if len(self.tasks) == len(self.task_ids):
+            self.done.set()
+
+    def fail(self, error):
+        self.error = error
+        self.done.set()
+
+
+class TaskWaiter:
+    """This class is part of a mixin and not to be used directly. See robottelo.hosts.Satellite
+
+    :param satellite: the Satellite whose foreman tasks are watched.
+    :param min_delay: seconds between the first searches for task states.
+    :param max_delay: maximum seconds between two searches while tasks are still running.
+    :param max_errors: failed searches in a row after which the waiting callers fail.
+    """
+
+    def __init__(self, satellite, min_delay=0.5, max_delay=15, max_errors=MAX_SEARCH_ERRORS):
+        self._satellite = satellite
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_errors = max_errors
+        self._watched = {}  # task id -> list of TaskSet waiting for it
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def _search(self, task_ids):
+        return self._satellite.api.ForemanTask().search(
+            query={'search': f'id ^ ({",".join(task_ids)})', 'per_page': len(task_ids)}
+        )
+
+    def _run(self):
+        """Poll all watched tasks at once until no caller waits anymore"""
+        delays = backoff_delays(self.min_delay, self.max_delay)
+        errors = 0
+        while True:
+            with self._cond:
+                task_ids = sorted(self._watched)
+                if not task_ids:
+                    self._thread = None
+                    return
+            try:
+                tasks = self._search(task_ids)
+            except Exception as err:
+                errors += 1
+                logger.warning(
+                    f'Failed to search foreman tasks {task_ids} ({errors}/{self.max_errors}): {err}'
+                )
+                with self._cond:
+                    if errors >= self.max_errors:
+                        for task_sets in self._watched.values():
+                            for task_set in task_sets:
+                                task_set.fail(err)
+                        self._watched.clear()
+                        errors = 0
+                    else:
+                        self._cond.wait(timeout=next(delays))
+                continue
+            errors = 0
+            finished = [task for task in tasks if task.state in FINISHED_STATES]
+            with self._cond:
+                for task in finished:
+                    for task_set in self._watched.pop(str(task.id), []):
+                        task_set.update(task)
+                if finished:
+                    # something moved, check again soon
+                    delays = backoff_delays(self.min_delay, self.max_delay)
+                # sleep, but wake up early when new tasks are watched
+                self._cond.wait(timeout=next(delays))
+
+    def watch(self, task_ids):
+        """Start watching ``task_ids`` and return the :class:`TaskSet` to wait on"""
+        task_set = TaskSet(task_ids)
+        if not task_set.task_ids:
+            task_set.done.set()
+            return task_set
+        with self._cond:
+            for task_id in task_set.task_ids:
+                self._watched.setdefault(task_id, []).append(task_set)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'task-waiter-{self._satellite.hostname}', daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return task_set
+
+    def _unwatch(self, task_set):
+        with self._cond:
+            for task_id in task_set.task_ids:
+                task_sets = self._watched.get(task_id, [])
+                if task_set in task_sets:
+                    task_sets.remove(task_set)
+                if not task_sets:
+                    self._watched.pop(task_id, None)
+
+    def result(self, task_set, timeout=None, must_succeed=True):
+        """Block until every task of ``task_set`` has finished
+
+        :param timeout: maximum seconds to wait, defaults to nailgun ``TASK_TIMEOUT``.
+        :param must_succeed: raise ``TaskFailedError`` if a task did not succeed.
+        :return: list of finished ``ForemanTask`` entities, in the order of their ids.
+        :raises: ``TaskTimedOutError`` if the tasks did not finish in time.
+        """
+        timeout = entity_mixins.TASK_TIMEOUT if timeout is None else timeout
+        if not task_set.done.wait(timeout):
+            self._unwatch(task_set)
+            pending = sorted(task_set.task_ids - set(task_set.tasks))
+            raise TaskTimedOutError(
+                f'Timed out polling tasks {pending}, exceeded {timeout} seconds', pending[0]
+            )
+        if task_set.error:
+            raise task_set.error
+        tasks = sorted(task_set.tasks.values(), key=lambda task: task.id)
+        if must_succeed:
+            for task in tasks:
+                if task.result != 'success':
+                    raise TaskFailedError(
+                        f'Task {task.id} ({task.label}) finished with result {task.result}',
+                        task.id,
+                    )
+        return tasks
+
+    def wait_for_ids(self, task_ids, timeout=None, must_succeed=True):
+        """Wait for the tasks with the given ids to finish
+
+        :return: list of finished ``ForemanTask`` entities.
+        """
+        return self.result(self.watch(task_ids), timeout=timeout, must_succeed=must_succeed)
+
+    def wait_for_many(self, task_id_sets, timeout=None, must_succeed=True):
+        """Wait concurrently for several sets of tasks, all polled by the same searches
+
+        :param list task_id_sets: list of task id lists.
+        :return: list of finished ``ForemanTask`` entity lists, one per given set.
+        """
+        task_sets = [self.watch(task_ids) for task_ids in task_id_sets]
+        deadline = time.monotonic() + (entity_mixins.TASK_TIMEOUT if timeout is None else timeout)
+        return [
+            self.result(
+                task_set,
+                timeout=max(deadline - time.monotonic(), 0),
+                must_succeed=must_succeed,
+            )
+            for task_set in task_sets
+        ]
+
+    def search(self, search_query, search_rate=1, max_tries=10, task_filter=None):
+        """Search tasks by ``search_query`` until at least one is found
+
+        :param search_query: Search query that will be passed to API call.
+        :param search_rate: Delay between searches.
+        :param max_tries: How many times search should be executed.
+        :param task_filter: Optional callable to select relevant tasks from the search results.
+        :return: List of found ``ForemanTask`` entities.
+        :raises: ``AssertionError``. If no tasks were found after ``max_tries`` searches.
+        """
+        for attempt in range(max_tries):
+            tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
+            if task_filter:
+                tasks = [task for task in tasks if task_filter(task)]
+            if tasks:
+                return tasks
+            if attempt < max_tries - 1:
+                time.sleep(search_rate)
+        raise AssertionError(f"No task was found using query '{search_query}'")
+
+    def wait_for_tasks(
+        self,
+        search_query,
+        search_rate=1,
+        max_tries=10,
+        poll_timeout=None,
+        must_succeed=True,
+        task_filter=None,
+    ):
+        """Search tasks by ``search_query`` and wait for all of them to finish
+
+        :return: List of finished ``ForemanTask`` entities.
+        """
+        tasks = self.search(
+            search_query, search_rate=search_rate, max_tries=max_tries, task_filter=task_filter
+        )
+        return self.wait_for_ids(
+            [task.id for task in tasks], timeout=poll_timeout, must_succeed=must_succeed
+        )
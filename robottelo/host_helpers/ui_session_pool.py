@@ -0,0 +1,230 @@
+"""
+Pool of logged in airgun UI sessions, reused by the tests of a worker.
+
+Starting a browser on the selenium grid and logging in takes longer than most UI test steps.
+The pool keeps the browsers of the finished tests, keyed by Satellite hostname and user, and
+hands them to the next test of the same user after resetting their state: local and session
+storage are cleared and the browser navigates back to the dashboard. With ``restore_cookies``,
+new browsers of a user that logged in before are authenticated by restoring the cookies of that
+login instead of going through the login form.
+
+Pooled sessions are started and closed by the pool, entering and exiting them in a test is
+a no-op. A test logging in with other values, e.g. ``session(user=...)``, gets a new session of
+its own instead. Sessions of failed tests are closed, not reused, and the idle sessions of a
+user are closed by :meth:`UISessionPool.discard` when the user is deleted. Pooled browsers share
+a single selenium session id across tests, so the pool is not used when UI videos are recorded.
+
+example:
+    pool = UISessionPool()
+    with pool.session(satellite, 'test_foo', 'admin', 'changeme') as session:
+        session.architecture.create({'name': 'bar'})
+    pool.close()
+"""
+
+from contextlib import ExitStack, contextmanager, suppress
+from functools import partial
+import threading
+from urllib.parse import urljoin
+
+from robottelo.logging import logger
+
+RESET_SCRIPT = 'window.localStorage.clear(); window.sessionStorage.clear();'
+
+
+class PooledSession:
+    """An airgun Session lent by a :class:`UISessionPool` to a single test
+
+    Attributes not defined here are the ones of the wrapped session. Calling it to log in with
+    other values, e.g. ``session(user=...)``, switches the test to a new session of its own
+    started on enter, made by ``new_session``, while the pooled browser is left untouched.
+
+    :param session: the started airgun Session.
+    :param key: the Satellite hostname and the user of the session.
+    :param password: the password of the user.
+    :param stack: the ExitStack closing the session.
+    :param url: the base url of the Satellite.
+    :param new_session: makes a session of the Satellite from the Session arguments.
+    """
+
+    def __init__(self, session, key, password, stack, url, new_session):
+        self._pooled = session
+        self._session = session
+        self.key = key
+        self._password = password
+        self._stack = stack
+        self._url = url
+        self._new_session = new_session
+        self._entered = False
+        self.reusable = True
+        self.uses = 0
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def __enter__(self):
+        if self._session is not self._pooled:
+            self._session.__enter__()
+            self._entered = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._entered:
+            self._entered = False
+            return self._session.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            self.reusable = False
+        return None
+
+    def __call__(self, user=None, password=None, url=None, login=None, **kwargs):
+        """Log in with other values in a new session, or navigate the pooled one to ``url``"""
+        if user is not None or password is not None or login is not None or kwargs:
+            self._session = self._new_session(
+                session_name=self._pooled.name,
+                user=user or self.key[1],
+                password=password or self._password,
+                url=url,
+                login=True if login is None else login,
+                **kwargs,
+            )
+        elif url is not None:
+            self.selenium.get(urljoin(self._url, url))
+        return self
+
+    @property
+    def selenium(self):
+        return self._pooled.browser.selenium
+
+    def reset(self, testname):
+        """Clear the browser storage and navigate to the dashboard for the test ``testname``"""
+        self._pooled.name = testname
+        self.selenium.execute_script(RESET_SCRIPT)
+        self.selenium.get(self._url)
+        self.reusable = True
+
+    def detach(self):
+        """End the session the test switched to, if any"""
+        if self._entered:
+            self.__exit__(None, None, None)
+        self._session = self._pooled
+
+    def close(self):
+        with suppress(Exception):
+            self._stack.close()
+
+
+class UISessionPool:
+    """Logged in airgun sessions of this worker, by Satellite hostname and user
+
+    :param restore_cookies: authenticate new browsers of a user that logged in before with the
+        cookies of that login instead of logging in.
+    :param max_uses: tests a browser is used for before it is closed, 0 for no limit.
+    :param session_class: class of the sessions, ``airgun.session.Session`` by default.
+    """
+
+    def __init__(self, restore_cookies=False, max_uses=0, session_class=None):
+        self.restore_cookies = restore_cookies
+        self.max_uses = max_uses
+        self._session_class = session_class
+        self._idle = {}
+        self._cookies = {}
+        self._lock = threading.Lock()
+
+    def _open(self, satellite, key, testname, password):
+        """Start a browser for ``key``, logged in or authenticated with the cookies of ``key``"""
+        if self._session_class is None:
+            from airgun.session import Session
+
+            self._session_class = Session
+        cookies = self._cookies.get(key) if self.restore_cookies else None
+        stack = ExitStack()
+        try:
+            session = stack.enter_context(
+                self._session_class(
+                    session_name=testname,
+                    user=key[1],
+                    password=password,
+                    hostname=satellite.hostname,
+                    login=not cookies,
+                )
+            )
+            pooled = PooledSession(
+                session,
+                key,
+                password,
+                stack,
+                satellite.url,
+                partial(self._session_class, hostname=satellite.hostname),
+            )
+            if cookies:
+                logger.debug(f'Restoring the UI session cookies of {key[1]} on {key[0]}')
+                pooled.selenium.get(satellite.url)
+                for cookie in cookies:
+                    pooled.selenium.add_cookie(cookie)
+                pooled.selenium.get(satellite.url)
+                if '/users/login' in pooled.selenium.current_url:
+                    # the login of the cookies expired, log in again
+                    del self._cookies[key]
+                    stack.close()
+                    return self._open(satellite, key, testname, password)
+            else:
+                self._cookies[key] = pooled.selenium.get_cookies()
+        except Exception:
+            stack.close()
+            raise
+        return pooled
+
+    def acquire(self, satellite, testname, user, password):
+        """Return a session of ``user`` on ``satellite``, reset for the test ``testname``"""
+        key = (satellite.hostname, user)
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+            if pooled is None:
+                pooled = self._open(satellite, key, testname, password)
+                break
+            try:
+                pooled.reset(testname)
+                break
+            except Exception as err:
+                logger.warning(f'Discarding the UI session of {user} on {key[0]}: {err}')
+                pooled.close()
+        pooled.uses += 1
+        return pooled
+
+    def release(self, pooled):
+        """Return a session to the pool, or close it if it is not reusable"""
+        pooled.detach()
+        if not pooled.reusable or (self.max_uses and pooled.uses >= self.max_uses):
+            pooled.close()
+            return
+        with self._lock:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+
+    @contextmanager
+    def session(self, satellite, testname, user, password):
+        """A session of ``user`` on ``satellite`` for the duration of the context"""
+        pooled = self.acquire(satellite, testname, user, password)
+        try:
+            yield pooled
+        except Exception:
+            pooled.reusable = False
+            raise
+        finally:
+            self.release(pooled)
+
+    def discard(self, hostname, user):
+        """Close the idle sessions of ``user`` on ``hostname``, e.g. once the user is deleted"""
+        with self._lock:
+            idle = self._idle.pop((hostname, user), [])
+            self._cookies.pop((hostname, user), None)
+        for pooled in idle:
+            pooled.close()
+
+    def close(self):
+        """Close all the idle sessions"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for sessions in idle.values():
+            for pooled in sessions:
+                pooled.close()
@@ -10,6 +10,7 @@ import json
 from pathlib import Path, PurePath
 import random
 import re
+import sys
 from tempfile import NamedTemporaryFile
 import time
 from urllib.parse import urljoin, urlparse, urlunsplit
@@ -18,13 +19,11 @@ import apypie
 from box import Box
 from broker import Broker
 from broker.hosts import Host
-from dynaconf.vendor.box.exceptions import BoxKeyError
 from fauxfactory import gen_alpha, gen_string
 from nailgun import entities
 from packaging.version import Version
 import pytest
 import requests
-from ssh2.exceptions import AuthenticationError
 from wait_for import TimedOutError, wait_for
 from wrapanapi.entities.vm import VmState
 import yaml
@@ -69,7 +68,7 @@ from robottelo.host_helpers import (
     SatelliteMixins,
 )
 from robottelo.logging import logger
-from robottelo.utils import validate_ssh_pub_key
+from robottelo.utils import batch_exec, host_facts, validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
 from robottelo.utils.installer import InstallerCommand
 
@@ -93,14 +92,82 @@ def lru_sat_ready_rhel(rhel_ver):
     return Broker(**deploy_args, host_class=Satellite).checkout()
 
 
+@lru_cache
+def _cli_entity_classes(prefix=''):
+    """Return the robottelo cli classes from modules in robottelo/cli/, scanned once per process
+
+    :param str prefix: only scan modules whose name starts with this prefix.
+    """
+    classes = {}
+    for file in sorted(Path(__file__).parent.joinpath('cli').iterdir()):
+        if file.suffix == '.py' and not file.name.startswith('_') and file.name.startswith(prefix):
+            cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
+            for name, obj in cli_module.__dict__.items():
+                try:
+                    if Base in obj.mro():
+                        classes[name] = obj
+                except (AttributeError, TypeError):
+                    # not everything has an mro method, we don't care about them
+                    pass
+    return classes
+
+
+@lru_cache
+def _api_entity_classes():
+    """Return all nailgun entity classes, collected once per process"""
+    from nailgun import entities as _entities  # use a private import
+    from nailgun.entity_mixins import Entity
+
+    classes = {}
+    for name, obj in _entities.__dict__.items():
+        try:
+            if Entity in obj.mro():
+                classes[name] = obj
+        except (AttributeError, TypeError):
+            # not everything has an mro method, we don't care about them
+            pass
+    return classes
+
+
+class _EntityNamespace:
+    """Namespace of entity classes bound to a single host.
+
+    Classes are looked up in a registry shared by all hosts and bound to the host on first
+    attribute access only, the bound class is then cached as an instance attribute.
+
+    :param dict classes: mapping of entity names to their unbound classes.
+    :param callable bind: ``bind(name, cls)`` returning the host-bound copy of ``cls``.
+    """
+
+    def __init__(self, classes, bind):
+        self._classes = classes
+        self._bind = bind
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            cls = self._classes[name]
+        except KeyError:
+            raise AttributeError(f'{name} is not a known entity') from None
+        bound = self._bind(name, cls)
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return sorted({*super().__dir__(), *self._classes})
+
+    def entity_names(self):
+        """Return the names of all entities available in this namespace"""
+        return list(self._classes)
+
+
 def get_sat_version():
-    """Try to read sat_version from envvar SATELLITE_VERSION
-    if not available fallback to ssh connection to get it."""
+    """Try to read sat_version from the Satellite host facts, read once per session
+    if not available fallback to robottelo configuration."""
 
-    try:
-        sat_version = Satellite().version
-    except (AuthenticationError, ContentHostError, BoxKeyError) as err:
-        logger.warning('Failed to get Satellite version: %s', err)
+    if not (sat_version := host_facts.get_host_facts().get('sat_version')):
+        logger.warning('Failed to get Satellite version from Satellite host facts')
         if sat_version := str(settings.server.version.get('release')) == 'stream':
             sat_version = str(settings.robottelo.get('satellite_version'))
         if not sat_version:
@@ -109,20 +176,26 @@ def get_sat_version():
 
 
 def get_sat_rhel_version():
-    """Try to read rhel_version from Satellite host
+    """Try to read rhel_version from the Satellite host facts, read once per session
     if not available fallback to robottelo configuration."""
 
-    try:
-        return Satellite().os_version
-    except (AuthenticationError, ContentHostError, BoxKeyError) as err:
-        logger.warning('Failed to get RHEL version from Satellite: %s', err)
-        if hasattr(settings.server.version, 'rhel_version'):
-            rhel_version = str(settings.server.version.rhel_version)
-        elif hasattr(settings.robottelo, 'rhel_version'):
-            rhel_version = settings.robottelo.rhel_version
+    if rhel_version := host_facts.get_host_facts().get('rhel_version'):
+        return Version(rhel_version)
+    logger.warning('Failed to get RHEL version from Satellite host facts')
+    if hasattr(settings.server.version, 'rhel_version'):
+        rhel_version = str(settings.server.version.rhel_version)
+    elif hasattr(settings.robottelo, 'rhel_version'):
+        rhel_version = settings.robottelo.rhel_version
     return Version(rhel_version)
 
 
+def get_sat_fips_enabled():
+    """Try to read FIPS state from the Satellite host facts, read once per session
+    if not available assume FIPS is disabled."""
+
+    return host_facts.get_host_facts().get('fips', False)
+
+
 class ContentHost(Host, ContentHostMixins):
     run = Host.execute
     default_timeout = settings.server.ssh_client.command_timeout
@@ -240,16 +313,36 @@ class ContentHost(Host, ContentHostMixins):
         ipv4, *ipv6 = self.execute('hostname -I').stdout.split()
         return ipv4
 
+    def execute_many(self, commands, timeout=None, stop_on_error=False):
+        """Run several commands with a single remote execution
+
+        :param list commands: the shell commands to run, in order
+        :param timeout: timeout of the whole execution
+        :param bool stop_on_error: don't run the commands after the first failing one, their
+            results are then missing from the returned list
+        :return: list of results with ``status``, ``stdout`` and ``stderr``, one per command run
+        """
+        return batch_exec.execute_many(self, commands, timeout=timeout, stop_on_error=stop_on_error)
+
+    @cached_property
+    def _release_probe(self):
+        """Results of the commands identifying the OS of the host, read in one execution"""
+        commands = ['cat /etc/os-release', 'cat /etc/redhat-release', 'uname -m']
+        return dict(zip(commands, self.execute_many(commands), strict=True))
+
     @cached_property
     def arch(self):
-        return self.get_facts().get('lscpu.architecture') or self.execute('uname -m').stdout.strip()
+        return (
+            self.get_facts().get('lscpu.architecture')
+            or self._release_probe['uname -m'].stdout.strip()
+        )
 
     @cached_property
     def _redhat_release(self):
         """Process redhat-release file for distro and version information
         This is a fallback for when /etc/os-release is not available
         """
-        result = self.execute('cat /etc/redhat-release')
+        result = self._release_probe['cat /etc/redhat-release']
         if result.status != 0:
             raise ContentHostError(f'Not able to cat /etc/redhat-release "{result.stderr}"')
         match = re.match(r'(?P<NAME>.+) release (?P<major>\d+)(.(?P<minor>\d+))?', result.stdout)
@@ -279,7 +372,7 @@ class ContentHost(Host, ContentHostMixins):
         """Process os-release file for distro and version information"""
         facts = {}
         regex = r'^(["\'])(.*)(\1)$'
-        result = self.execute('cat /etc/os-release')
+        result = self._release_probe['cat /etc/os-release']
         if result.status != 0:
             logger.info(
                 f'Not able to cat /etc/os-release "{result.stderr}", '
@@ -1913,27 +2006,12 @@ class Capsule(ContentHost, CapsuleMixins):
     @property
     def cli(self):
         """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+        if not getattr(self, '_cli', None):
+            # create a copy of the class and set our hostname as a class attribute
+            self._cli = _EntityNamespace(
+                _cli_entity_classes(prefix='sm_'),
+                lambda name, cls: type(name, (cls,), {'hostname': self.hostname}),
+            )
         return self._cli
 
     def enable_satellite_or_capsule_module_for_rhel8(self):
@@ -1997,9 +2075,9 @@ class Satellite(Capsule, SatelliteMixins):
         self.port = kwargs.get('port', settings.server.port)
         kwargs.setdefault('net_type', settings.server.network_type)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # entity namespaces are populated lazily on first access
+        self._api = None
+        self._cli = None
         self._apidoc = None
         self.record_property = None
 
@@ -2011,7 +2089,8 @@ class Satellite(Capsule, SatelliteMixins):
 
         pip_main(['uninstall', '-y', 'nailgun'])
         pip_main(['install', f'https://github.com/SatelliteQE/nailgun/archive/{new_version}.zip'])
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
+        _api_entity_classes.cache_clear()
         to_clear = [k for k in sys.modules if 'nailgun' in k]
         [sys.modules.pop(k) for k in to_clear]
 
@@ -2019,39 +2098,31 @@ class Satellite(Capsule, SatelliteMixins):
     def api(self):
         """Import all nailgun entities and wrap them under self.api"""
         if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+            from nailgun.config import ServerConfig
+
+            # set the server configuration to point to this satellite
+            self.nailgun_cfg = ServerConfig(
+                auth=(settings.server.admin_username, settings.server.admin_password),
+                url=f'{self.url}',
+                verify=settings.server.verify_ca,
+            )
+
+            def inject_config(name, cls):
+                """inject a nailgun server config into the init of nailgun entity classes"""
+                import functools
+
+                #  create a copy of the class and inject our server config into the __init__
+                return type(
+                    name,
+                    (cls,),
+                    {
+                        '__init__': functools.partialmethod(
+                            cls.__init__, server_config=self.nailgun_cfg
+                        )
+                    },
+                )
+
+            self._api = _EntityNamespace(_api_entity_classes(), inject_config)
         return self._api
 
     @property
@@ -2071,30 +2142,18 @@ class Satellite(Capsule, SatelliteMixins):
     def cli(self):
         """Import all robottelo cli entities and wrap them under self.cli"""
         if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+            # create a copy of the class and set our hostname as a class attribute
+            self._cli = _EntityNamespace(
+                _cli_entity_classes(),
+                lambda name, cls: type(
+                    name,
+                    (cls,),
+                    {
+                        'hostname': self.hostname,
+                        'omitting_credentials': self.omitting_credentials,
+                    },
+                ),
+            )
         return self._cli
 
     @contextmanager
@@ -2102,48 +2161,59 @@ class Satellite(Capsule, SatelliteMixins):
         change = not self.omitting_credentials  # if not already set to omit
         if change:
             self.omitting_credentials = True
-            # if CLI is already created
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = True
+            # update the cli classes bound already, the others are bound with the new value
+            self._set_cli_omitting_credentials(True)
         yield
         if change:
             self.omitting_credentials = False
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = False
+            self._set_cli_omitting_credentials(False)
+
+    def _set_cli_omitting_credentials(self, value):
+        if self._cli:
+            for obj in self._cli.__dict__.values():
+                with contextlib.suppress(
+                    AttributeError, TypeError
+                ):  # not everything has an mro method, we don't care about them
+                    if Base in obj.mro():
+                        obj.omitting_credentials = value
 
     @contextmanager
-    def ui_session(self, testname=None, user=None, password=None, url=None, login=True):
-        """Initialize an airgun Session object and store it as self.ui_session"""
+    def ui_session(self, testname=None, user=None, password=None, url=None, login=True, pool=None):
+        """Initialize an airgun Session object and store it as self.ui_session
+
+        :param pool: a :class:`robottelo.host_helpers.ui_session_pool.UISessionPool` to take
+            a logged in session from, used unless ``url`` is set, ``login`` is False or UI
+            videos are recorded.
+        """
 
         from airgun.session import Session
 
         def get_caller():
-            import inspect
-
-            for frame in inspect.stack():
-                if frame.function.startswith('test_'):
-                    return frame.function
+            # walk the frames only, inspect.stack() reads the source of each of them
+            frame = sys._getframe(1)
+            while frame is not None:
+                if frame.f_code.co_name.startswith('test_'):
+                    return frame.f_code.co_name
+                frame = frame.f_back
             return None
 
-        try:
-            with Session(
-                session_name=testname or get_caller(),
-                user=user or settings.server.admin_username,
-                password=password or settings.server.admin_password,
+        user = user or settings.server.admin_username
+        password = password or settings.server.admin_password
+        testname = testname or get_caller()
+        # pooled browsers share their selenium session id, hence their video
+        if pool is not None and login and url is None and not settings.ui.record_video:
+            session = pool.session(self, testname, user, password)
+        else:
+            session = Session(
+                session_name=testname,
+                user=user,
+                password=password,
                 url=url,
                 hostname=self.hostname,
                 login=login,
-            ) as ui_session:
+            )
+        try:
+            with session as ui_session:
                 yield ui_session
         finally:
             if self.record_property is not None and settings.ui.record_video:
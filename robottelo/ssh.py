@@ -1,6 +1,152 @@
 """Utility module to handle the shared ssh connection."""
 
+import atexit
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+
+from ssh2.exceptions import SocketDisconnectError, SocketRecvError, SocketSendError
+
 from robottelo.cli import hammer
+from robottelo.logging import logger
+
+# errors raised by a pooled connection that went stale while it was idle
+SSH_CONNECTION_ERRORS = (
+    ConnectionError,
+    EOFError,
+    SocketDisconnectError,
+    SocketRecvError,
+    SocketSendError,
+)
+
+
+@dataclass
+class _PoolEntry:
+    client: object
+    last_used: float = field(default_factory=time.monotonic)
+    # time of the last command known to have gone through, see SSHClientPool.succeeded
+    last_ok: float = field(default_factory=time.monotonic)
+
+
+class SSHClientPool:
+    """Per-process pool of reusable ssh clients.
+
+    Clients are keyed by ``(hostname, username, password, port, net_type)`` and by the calling
+    thread, so an ssh session is never shared between threads. Since every xdist worker is its
+    own process, this gives one pool per worker; the pool is dropped when a forked child first
+    touches it.
+
+    :param int idle_timeout: seconds after which an unused client is closed and evicted.
+    :param int health_check_interval: seconds since the last successful command after which
+        a client is probed with a no-op command before being handed out again.
+    """
+
+    def __init__(self, idle_timeout=300, health_check_interval=60):
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def _check_pid(self):
+        """Forget clients inherited from a parent process, their sockets are not ours."""
+        if self._pid != os.getpid():
+            self._clients = {}
+            self._pid = os.getpid()
+
+    @staticmethod
+    def _close(client):
+        try:
+            client.close()
+        except Exception as err:  # closing a dead session may fail in any way
+            logger.debug(f'Failed to close pooled ssh client {client}: {err}')
+
+    def _is_healthy(self, client):
+        """Probe the client with a no-op command, a broken session fails or returns non-zero"""
+        if getattr(client, '_session', None) is None:
+            return True  # not connected yet, the session will be created on first use
+        try:
+            return client.execute('true').status == 0
+        except Exception:
+            return False
+
+    def evict_idle(self):
+        """Close and drop every client that was not used for ``idle_timeout`` seconds"""
+        now = time.monotonic()
+        for key, entry in list(self._clients.items()):
+            if now - entry.last_used > self.idle_timeout:
+                logger.debug(f'Evicting idle ssh client for {key[1]}@{key[0]}')
+                self._close(self._clients.pop(key).client)
+
+    def acquire(self, key, factory):
+        """Return the pooled client for ``key``, creating it with ``factory`` when missing
+
+        :param tuple key: ``(hostname, username, password, port, net_type)`` of the connection.
+        :param callable factory: zero-argument callable returning a new client.
+        """
+        key = (*key, threading.get_ident())
+        with self._lock:
+            self._check_pid()
+            self.evict_idle()
+            entry = self._clients.get(key)
+        if entry is not None and time.monotonic() - entry.last_ok > self.health_check_interval:
+            if self._is_healthy(entry.client):
+                entry.last_ok = time.monotonic()
+            else:
+                logger.debug(
+                    f'Pooled ssh client for {key[1]}@{key[0]} failed health check, reconnecting'
+                )
+                self.discard(entry.client)
+                entry = None
+        if entry is None:
+            entry = _PoolEntry(factory())
+            with self._lock:
+                self._clients[key] = entry
+        entry.last_used = time.monotonic()
+        return entry.client
+
+    def succeeded(self, client):
+        """Record that a command of ``client`` went through, its connection is alive"""
+        with self._lock:
+            for entry in self._clients.values():
+                if entry.client is client:
+                    entry.last_ok = time.monotonic()
+
+    def discard(self, client):
+        """Close ``client`` and remove it from the pool
+
+        :return: True if the client was pooled, False otherwise.
+        """
+        with self._lock:
+            keys = [key for key, entry in self._clients.items() if entry.client is client]
+            for key in keys:
+                del self._clients[key]
+        if keys:
+            self._close(client)
+        return bool(keys)
+
+    def close_all(self):
+        """Close every pooled client"""
+        with self._lock:
+            entries, self._clients = list(self._clients.values()), {}
+        for entry in entries:
+            self._close(entry.client)
+
+
+_pool = SSHClientPool()
+atexit.register(_pool.close_all)
+
+
+def _pooling_enabled():
+    from robottelo.config import settings
+
+    ssh_client = settings.server.ssh_client
+    _pool.idle_timeout = ssh_client.get('pool_idle_timeout', _pool.idle_timeout)
+    return ssh_client.get('pooled', True)
 
 
 def get_client(
@@ -9,23 +155,38 @@ def get_client(
     password=None,
     port=22,
     net_type=None,
+    pooled=False,
 ):
     """Returns a host object that provides an ssh connection
 
     Processes ssh credentials in the order: password, key_filename, ssh_key
     Config validation enforces one of the three must be set in settings.server
+
+    :param bool pooled: reuse a connected client from the per-worker pool instead of creating
+        a new one, unless pooling is disabled with ``settings.server.ssh_client.pooled``.
     """
     from robottelo.config import settings
     from robottelo.hosts import ContentHost
 
-    return ContentHost(
-        hostname=hostname or settings.server.hostname,
-        username=username or settings.server.ssh_username,
-        password=password or settings.server.ssh_password,
-        port=port or settings.server.ssh_client.port,
-        # TODO(ogajduse): we better get rid of the ssh module entirely
-        net_type=net_type or settings.server.network_type,
-    )
+    hostname = hostname or settings.server.hostname
+    username = username or settings.server.ssh_username
+    port = port or settings.server.ssh_client.port
+    # TODO(ogajduse): we better get rid of the ssh module entirely
+    net_type = net_type or settings.server.network_type
+    password = password or settings.server.ssh_password
+
+    def factory():
+        return ContentHost(
+            hostname=hostname,
+            username=username,
+            password=password,
+            port=port,
+            net_type=net_type,
+        )
+
+    if pooled and _pooling_enabled():
+        return _pool.acquire((hostname, username, password, port, str(net_type)), factory)
+    return factory()
 
 
 def command(
@@ -37,6 +198,7 @@ def command(
     timeout=None,
     port=22,
     net_type=None,
+    pooled=True,
 ):
     """Executes SSH command(s) on remote hostname.
 
@@ -46,16 +208,42 @@ def command(
     :param str output_format: json, csv or None
     :param int timeout: Time to wait for the ssh command to finish.
     :param connection_timeout: Time to wait for establishing the connection.
+    :param bool pooled: Run the command over a pooled connection. A pooled connection failing
+        before the command is sent is replaced, one failing after that is discarded and the
+        error raised, the command may have run already.
     """
-    client = get_client(
-        hostname=hostname,
-        username=username,
-        password=password,
-        port=port,
-        net_type=net_type,
-    )
-    result = client.execute(cmd, timeout=timeout)
+    client_kwargs = {
+        'hostname': hostname,
+        'username': username,
+        'password': password,
+        'port': port,
+        'net_type': net_type,
+        'pooled': pooled,
+    }
+    client = get_client(**client_kwargs)
+    try:
+        # open the session first, a failure to connect is the only one safe to retry
+        if getattr(client, '_session', True) is None:
+            client.connect()
+    except SSH_CONNECTION_ERRORS as err:
+        if not _pool.discard(client):
+            raise
+        logger.warning(f'Pooled ssh connection to {client.hostname} failed ({err}), reconnecting')
+        client = get_client(**client_kwargs)
+    try:
+        result = client.execute(cmd, timeout=timeout)
+    except SSH_CONNECTION_ERRORS:
+        _pool.discard(client)
+        raise
+    _pool.succeeded(client)
+    return parse_output(result, output_format)
 
+
+def parse_output(result, output_format=None):
+    """Parse the stdout of a successful hammer ``result`` in place and return the result
+
+    :param str output_format: json, csv or None
+    """
     if output_format and result.status == 0:
         if output_format == 'csv':
             result.stdout = hammer.parse_csv(result.stdout) if result.stdout else {}
@@ -1,7 +1,12 @@
 # General utility functions which does not fit into other util modules OR
 # Independent utility functions that doesn't need separate module
 import base64
+from contextlib import contextmanager
+import fcntl
+import os
+from pathlib import Path
 import re
+import time
 
 from cryptography.hazmat.backends import default_backend as crypto_default_backend
 from cryptography.hazmat.primitives import serialization as crypto_serialization
@@ -66,3 +71,53 @@ def parse_comma_separated_list(option_value):
             return False
         return [item.strip() for item in option_value.split(',')]
     return None
+
+
+def pid_alive(pid):
+    """Return whether a process of this machine with the given pid is running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+@contextmanager
+def file_lock(path, shared=False, timeout=None):
+    """Hold an flock of ``path``, created if missing, for the duration of the context
+
+    Unlike broker's FileLock, the lock is taken atomically and released if the process dies.
+    Locks are held per open file, so they also exclude the threads of a process.
+
+    :param shared: take a shared lock, held by several processes at a time
+    :param timeout: seconds to wait for the lock, None to wait until it is released
+    :raises: ``TimeoutError`` if the lock is not acquired within ``timeout``
+    """
+    operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    with open(path, 'a') as lock_file:
+        if timeout is None:
+            fcntl.flock(lock_file, operation)
+        else:
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    fcntl.flock(lock_file, operation | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError as err:
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f'Timed out waiting for the lock of {path}') from err
+                    time.sleep(0.05)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def write_atomic(path, text):
+    """Write ``text`` to a temporary file replacing ``path``, readers never see a partial file"""
+    path = Path(path)
+    tmp_file = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    tmp_file.write_text(text)
+    tmp_file.replace(path)
@@ -0,0 +1,74 @@
+"""Run several shell commands on a host in a single remote execution
+
+Every command runs in its own subshell of one bash script, its status, stdout and stderr are
+printed base64 encoded on a single line prefixed with a random token, so the output of the
+commands can't be mistaken for the framing.
+"""
+
+import base64
+import shlex
+from uuid import uuid4
+
+from broker.helpers import Result
+
+
+def build_script(commands, token, stop_on_error=False):
+    """Return a bash script running the commands and printing their framed results
+
+    :param list commands: the shell commands to run, in order
+    :param str token: prefix of the result lines
+    :param bool stop_on_error: don't run the commands after the first failing one
+    """
+    lines = ['__out=$(mktemp) && __err=$(mktemp) || exit 1']
+    for command in commands:
+        lines += [
+            '(',
+            command,
+            ') >"$__out" 2>"$__err" </dev/null',
+            '__rc=$?',
+            f'printf "{token} %s %s %s\\n" "$__rc" "$(base64 -w0 "$__out")" "$(base64 -w0 "$__err")"',
+        ]
+        if stop_on_error:
+            lines.append('[ "$__rc" -eq 0 ] || { rm -f "$__out" "$__err"; exit 0; }')
+    lines.append('rm -f "$__out" "$__err"')
+    return '\n'.join(lines)
+
+
+def parse_output(result, token):
+    """Return the results framed in the output of a script built by :func:`build_script`
+
+    :param result: the result of the script execution
+    :param str token: prefix of the result lines
+    :return: list of ``broker.helpers.Result`` with ``status``, ``stdout`` and ``stderr``
+    :raises RuntimeError: if the script itself failed
+    """
+    results = []
+    for line in result.stdout.splitlines():
+        if not line.startswith(f'{token} '):
+            continue
+        _, status, stdout, stderr = line.split(' ')
+        results.append(
+            Result(
+                status=int(status),
+                stdout=base64.b64decode(stdout).decode('utf-8', errors='replace'),
+                stderr=base64.b64decode(stderr).decode('utf-8', errors='replace'),
+            )
+        )
+    if result.status != 0:
+        raise RuntimeError(f'Batch execution failed with status {result.status}: {result.stderr}')
+    return results
+
+
+def execute_many(host, commands, timeout=None, stop_on_error=False):
+    """Run the commands on the host with a single execution
+
+    :param host: a host with an ``execute`` method, e.g. ``robottelo.hosts.ContentHost``
+    :param list commands: the shell commands to run, in order
+    :param timeout: timeout of the whole execution, see ``execute``
+    :param bool stop_on_error: don't run the commands after the first failing one, their results
+        are then missing from the returned list
+    :return: list of ``broker.helpers.Result``, one per command run
+    """
+    token = f'__result_{uuid4().hex}'
+    script = build_script(commands, token, stop_on_error=stop_on_error)
+    return parse_output(host.execute(f'bash -c {shlex.quote(script)}', timeout=timeout), token)
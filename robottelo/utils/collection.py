@@ -0,0 +1,32 @@
+"""Helpers for pytest plugins filtering the test collection"""
+
+
+def split_items(items, keep):
+    """Split test items in the selected and the deselected ones, keeping their order
+
+    Filters should be O(1) lookups, e.g. ``names.__contains__`` with precomputed sets of names, as
+    they are called for every collected item.
+
+    :param items: the collected test items
+    :param keep: function returning True for the items to select
+    :return: tuple of the selected items and the deselected items
+    """
+    selected, deselected = [], []
+    for item in items:
+        (selected if keep(item) else deselected).append(item)
+    return selected, deselected
+
+
+def filter_items(items, config, keep):
+    """Keep only the selected test items in the collection and report the deselected ones
+
+    :param items: the collected test items, modified in place
+    :param config: the pytest config
+    :param keep: function returning True for the items to select
+    :return: tuple of the selected items and the deselected items
+    """
+    selected, deselected = split_items(items, keep)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    return selected, deselected
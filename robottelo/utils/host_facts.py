@@ -0,0 +1,128 @@
+"""Facts about the configured Satellite, read once per test session
+
+Helpers like :func:`robottelo.hosts.get_sat_rhel_version` are called at collection time by every
+xdist worker, and used to ssh to the Satellite each time. The facts are now read with a single
+connection by the first worker that needs them and shared with the other workers through a json
+file keyed by hostname. An unreachable Satellite is recorded too, so the connection timeout is
+paid only once per session.
+
+In offline mode, e.g. for ``--collect-only`` runs, the Satellite is never contacted: facts cached
+by a previous session are used if there are any, otherwise callers fall back to configuration.
+"""
+
+import json
+import os
+from pathlib import Path
+import time
+
+from broker.exceptions import BrokerError
+from broker.helpers import FileLock
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils import write_atomic
+
+# seconds a worker waits for another worker reading the facts
+LOCK_TIMEOUT = 300
+
+_facts = {}
+_offline = False
+
+
+def set_offline(offline=True):
+    """Never contact the Satellite to read its facts in this process"""
+    global _offline
+    _offline = offline
+
+
+def is_offline():
+    return _offline or settings.robottelo.host_facts.offline
+
+
+def _session_id():
+    # shared by all xdist workers of the same run, unique per run
+    return os.environ.get('PYTEST_XDIST_TESTRUNUID', str(os.getpid()))
+
+
+def _read(cache_file):
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _fetch(hostname):
+    """Read the facts from the Satellite
+
+    Facts failing to be read are left out, an empty dict is returned if it can't be reached.
+    """
+    from robottelo.hosts import Satellite
+    from robottelo.ssh import SSH_CONNECTION_ERRORS
+
+    probes = {
+        'rhel_version': lambda satellite: str(satellite.os_version),
+        'sat_version': lambda satellite: satellite.version,
+        'fips': lambda satellite: bool(satellite.is_fips_enabled()),
+    }
+    facts = {}
+    try:
+        satellite = Satellite(hostname)
+    except Exception as err:
+        logger.warning(f'Failed to read facts of Satellite {hostname}: {err}')
+        return facts
+    for name, probe in probes.items():
+        try:
+            facts[name] = probe(satellite)
+        except (OSError, *SSH_CONNECTION_ERRORS) as err:
+            # unreachable, the other probes would wait for the connection timeout again
+            logger.warning(f'Failed to read facts of Satellite {hostname}: {err}')
+            break
+        except Exception as err:  # authentication and parsing errors of this fact only
+            logger.warning(f'Failed to read the {name} fact of Satellite {hostname}: {err}')
+    return facts
+
+
+def get_host_facts(hostname=None):
+    """Return the facts of the Satellite, reading them at most once per session
+
+    :param str hostname: the Satellite, defaults to ``settings.server.hostname``.
+    :return: dict with ``rhel_version``, ``sat_version`` and ``fips`` keys, or an empty dict
+        when the facts are not available.
+    """
+    hostname = hostname or settings.server.hostname
+    if hostname in _facts:
+        return _facts[hostname]
+    cache_file = Path(settings.robottelo.host_facts.cache_file)
+    ttl = settings.robottelo.host_facts.ttl
+
+    def cached():
+        entry = _read(cache_file).get(hostname)
+        if entry and (
+            is_offline()
+            or entry['session'] == _session_id()
+            or time.time() - entry['timestamp'] < ttl
+        ):
+            return entry['facts']
+        return None
+
+    if (facts := cached()) is None:
+        if is_offline():
+            logger.debug(f'Offline mode, no cached facts for Satellite {hostname}')
+            return {}
+        try:
+            # only one worker connects, the others wait for its result
+            with FileLock(cache_file, timeout=LOCK_TIMEOUT):
+                if (facts := cached()) is None:
+                    facts = _fetch(hostname)
+                    data = _read(cache_file)
+                    data[hostname] = {
+                        'facts': facts,
+                        'session': _session_id(),
+                        'timestamp': time.time(),
+                    }
+                    write_atomic(cache_file, json.dumps(data))
+        except BrokerError as err:  # a stale lock left by a killed process
+            logger.warning(f'Failed to lock {cache_file}: {err}')
+            facts = _fetch(hostname)
+    _facts[hostname] = facts
+    return facts
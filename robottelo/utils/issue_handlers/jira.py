@@ -1,7 +1,11 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import json
+import math
+import os
 from pathlib import Path
 import re
+import threading
 import time
 
 import pytest
@@ -16,12 +20,21 @@ from robottelo.constants import (
     JIRA_WONTFIX_RESOLUTIONS,
 )
 from robottelo.logging import logger
+from robottelo.utils import file_lock, write_atomic
 
 # match any version as in `sat-6.14.x` or `sat-6.13.0` or `6.13.9`
 # The .version group being a `d.d` string that can be casted to Version()
 VERSION_RE = re.compile(r'(?:sat-)*?(?P<version>\d\.\d)\.\w*')
 
-common_jira_fields = ['key', 'summary', 'status', 'labels', 'resolution', 'fixVersions']
+common_jira_fields = [
+    'key',
+    'summary',
+    'status',
+    'labels',
+    'resolution',
+    'fixVersions',
+    'updated',
+]
 
 mapped_response_fields = {
     'key': "{obj_name}['key']",
@@ -30,6 +43,7 @@ mapped_response_fields = {
     'labels': "{obj_name}['fields']['labels']",
     'resolution': "{obj_name}['fields']['resolution']['name'] if {obj_name}['fields']['resolution'] else ''",
     'fixVersions': "[ver['name'] for ver in {obj_name}['fields']['fixVersions']] if {obj_name}['fields']['fixVersions'] else []",
+    'updated': "{obj_name}['fields'].get('updated')",
     # Custom Field - SFDC Cases Counter
     'customfield_12313440': "{obj_name}['fields']['customfield_12313440']",
 }
@@ -41,21 +55,55 @@ class JiraStatusCache:
     efficient retrieval and storage of issue statuses. The cache is
     periodically cleaned to remove expired entries based on a configurable
     time-to-live (TTL) value.
+
+    The cache is stored as a json snapshot in ``jira.cache_file`` and a journal of json lines
+    next to it. ``save`` only appends the entries updated since the previous save to the journal,
+    so xdist workers can save concurrently, and the journal is merged into the snapshot once it
+    grows bigger than the snapshot. ``sync`` refreshes the issues changed in Jira since the last
+    sync with a query on the ``updated`` field, instead of fetching all the expired issues again.
     """
 
+    # seconds to wait for another process syncing or compacting the cache
+    lock_timeout = 300
+
     def __init__(self):
         self.cache_file = Path(settings.jira.cache_file)
+        self.journal_file = self.cache_file.with_name(f"{self.cache_file.name}.journal")
+        # held to sync the cache and to merge the journal into the snapshot
+        self.lock_file = self.cache_file.with_name(f"{self.cache_file.name}.lock")
+        # held shared by appends and exclusive to swap the journal, see _compact
+        self.journal_lock_file = self.cache_file.with_name(f"{self.cache_file.name}.journal.lock")
         self.cache_ttl_days = settings.jira.cache_ttl_days
+        self.synced = None
+        self._pending = {}
         self.cache = self._load_cache()
 
-    def _load_cache(self):
+    def _read_files(self, journal_file=None):
+        """Return the issues and the last sync time stored in the snapshot and the journal"""
+        issues, synced = {}, None
         if self.cache_file.exists():
-            logger.debug(f"Loading Jira cache from {self.cache_file}")
             data = json.loads(self.cache_file.read_text())
-            self._clean_expired_entries(data)
-            cache = data.get("issues", {})
-            logger.debug(f"Loaded {len(cache)} entries from Jira cache")
-            return cache
+            issues, synced = data.get("issues", {}), data.get("synced")
+        journal_file = journal_file or self.journal_file
+        if journal_file.exists():
+            for line in journal_file.read_text().splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:  # line being written by another process
+                    continue
+                if "synced" in record:
+                    synced = max(synced or 0, record["synced"])
+                else:
+                    issues[record["key"]] = record["entry"]
+        return issues, synced
+
+    def _load_cache(self):
+        if self.cache_file.exists() or self.journal_file.exists():
+            logger.debug(f"Loading Jira cache from {self.cache_file}")
+            issues, self.synced = self._read_files()
+            self._clean_expired_entries({"issues": issues})
+            logger.debug(f"Loaded {len(self.cache)} entries from Jira cache")
+            return self.cache
         logger.debug("Jira cache file does not exist, using empty cache")
         return {}
 
@@ -70,24 +118,101 @@ class JiraStatusCache:
         return results
 
     def update(self, issue_id, data):
-        self.cache[issue_id] = {"data": data, "timestamp": time.time()}
+        entry = {"data": data, "timestamp": time.time(), "updated": data.get("updated")}
+        self.cache[issue_id] = self._pending[issue_id] = entry
 
     def update_many(self, issues_data):
         for issue_id, data in issues_data.items():
             self.update(issue_id, data)
 
     def save(self):
-        logger.debug(f"Saving {len(self.cache)} entries to Jira cache file")
-        self.cache_file.write_text(json.dumps({"issues": self.cache}))
+        if not self._pending:
+            return
+        logger.debug(f"Saving {len(self._pending)} entries to Jira cache journal")
+        self._append({"key": issue_id, "entry": entry} for issue_id, entry in self._pending.items())
+        self._pending = {}
+        snapshot_size = self.cache_file.stat().st_size if self.cache_file.exists() else 0
+        if self.journal_file.stat().st_size > snapshot_size:
+            try:
+                with file_lock(self.lock_file, timeout=self.lock_timeout):
+                    self._compact()
+            except TimeoutError as err:
+                logger.warning(f"Failed to compact the Jira cache: {err}")
+
+    def _append(self, records):
+        # a single write to a file opened in append mode is not interleaved with others
+        lines = "".join(f"{json.dumps(record)}\n" for record in records)
+        with file_lock(self.journal_lock_file, shared=True), self.journal_file.open("a") as journal:
+            journal.write(lines)
+
+    def _compact(self):
+        """Merge the journal into the snapshot, the caller must hold the cache lock"""
+        if not self.journal_file.exists():
+            return
+        # new entries are appended to a new journal while this one is merged, the appends to
+        # this one are complete once the exclusive lock is held
+        journal_file = self.journal_file.with_name(f"{self.journal_file.name}.{os.getpid()}")
+        with file_lock(self.journal_lock_file):
+            self.journal_file.replace(journal_file)
+        issues, synced = self._read_files(journal_file)
+        write_atomic(self.cache_file, json.dumps({"issues": issues, "synced": synced}))
+        journal_file.unlink()
+        logger.debug(f"Compacted Jira cache journal into {len(issues)} entries")
+
+    def sync(self, fields=None):
+        """Refresh the cached issues changed in Jira since the last sync
+
+        Nothing is done if the cache was synced less than ``jira.cache_sync_minutes`` ago, e.g.
+        by another xdist worker.
+
+        :param fields: List of fields to be retrieved for the changed issues
+        :type fields: list
+        :returns: the keys of the refreshed issues
+        :rtype: list
+        """
+        try:
+            with file_lock(self.lock_file, timeout=self.lock_timeout):
+                issues, self.synced = self._read_files()
+                self.cache = {**issues, **self.cache}
+                now = time.time()
+                last_sync = self.synced or min(
+                    (entry.get("timestamp", 0) for entry in self.cache.values()), default=now
+                )
+                if not self.cache or now - last_sync < settings.jira.cache_sync_minutes * 60:
+                    return []
+                # relative dates avoid any timezone mismatch with the Jira server
+                minutes = math.ceil((now - last_sync) / 60) + 1
+                logger.debug(f"Refreshing Jira issues updated in the last {minutes} minutes")
+                issues = fetch_jira_issues(
+                    list(self.cache),
+                    fields or common_jira_fields,
+                    jql_filter=f'updated >= "-{minutes}m"',
+                )
+                for issue in issues:
+                    data = sanitized_issue_data(issue, fields or common_jira_fields)
+                    self.update(data["key"], data)
+                self._append(
+                    [
+                        *({"key": key, "entry": entry} for key, entry in self._pending.items()),
+                        {"synced": now},
+                    ]
+                )
+                self._pending = {}
+                self.synced = now
+                return [issue["key"] for issue in issues]
+        except (TimeoutError, TimedOutError, requests.exceptions.RequestException) as err:
+            logger.warning(f"Failed to refresh the Jira cache: {err}")
+            return []
 
     def _clean_expired_entries(self, data):
         now = time.time()
         ttl = self.cache_ttl_days * 86400
         old_count = len(data.get("issues", {}))
+        # entries unchanged at the last sync are as fresh as the sync
         self.cache = {
             key: value
             for key, value in data.get("issues", {}).items()
-            if now - value.get("timestamp", 0) <= ttl
+            if now - max(value.get("timestamp", 0), self.synced or 0) <= ttl
         }
         logger.debug(f"Cleaned expired cache entries: {old_count} → {len(self.cache)}")
 
@@ -96,6 +221,47 @@ class JiraStatusCache:
 jira_cache = JiraStatusCache()
 
 
+class TokenBucket:
+    """Thread safe token bucket limiting the rate of requests to the Jira API.
+
+    :param rate: tokens added per second, i.e. the sustained rate of requests
+    :param capacity: maximum number of tokens, i.e. the burst of requests allowed
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.updated:
+                    elapsed = now - self.updated
+                    self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    delay = (1 - self.tokens) / self.rate
+                else:  # paused
+                    delay = self.updated - now
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Drop all the tokens and don't refill the bucket for the given seconds"""
+        with self._lock:
+            self.tokens = 0
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+jira_rate_limiter = TokenBucket(settings.jira.requests_per_second)
+
+
 def sanitized_issue_data(issue, out_fields):
     """fetches the value for all the given fields from a given jira issue
 
@@ -231,6 +397,8 @@ def collect_data_jira(collected_data, cached_data):  # pragma: no cover
     """
     # Load persistent cache if available
     if not cached_data:
+        if settings.jira.api_key:
+            jira_cache.sync()
         issue_ids = [item for item in collected_data if item.startswith('SAT-')]
         cached_data = {
             issue_id: {'data': data['data']}
@@ -244,35 +412,52 @@ def collect_data_jira(collected_data, cached_data):  # pragma: no cover
         )
         or []
     )
+    # If Jira is CLOSED/DUPLICATE collect the duplicate
+    collect_dupes(jira_data, collected_data, cached_data=cached_data)
     for data in jira_data:
-        # If Jira is CLOSED/DUPLICATE collect the duplicate
-        collect_dupes(data, collected_data, cached_data=cached_data)
-
         jira_key = data['key']
         data["is_open"] = is_open_jira(jira_key, data)
         collected_data[jira_key]['data'] = data
 
 
-def collect_dupes(jira, collected_data, cached_data=None):  # pragma: no cover
-    """Recursively find for duplicates
+def collect_dupes(jiras, collected_data, cached_data=None):  # pragma: no cover
+    """Find the duplicates of the given issues, one level of duplicates at a time
 
-    :param jira: Jira response from Jira REST API
-    :type jira: dict
+    The duplicates of every level are fetched from Jira REST API in a single batch.
+
+    :param jiras: Jira responses from Jira REST API
+    :type jiras: list
     :param collected_data: dict with Jira issues collected by pytest
     :type collected_data: dict
     :param cached_data: Cached data previously loaded from API
     :type cached_data: dict
     """
     cached_data = cached_data or {}
-    if jira.get('resolution') == 'Duplicate':
-        # Collect duplicates
-        jira['dupe_data'] = get_single_jira(jira.get('dupe_of'), cached_data=cached_data)
-        dupe_key = jira['dupe_of']
-        # Store Duplicate also in the main collection for caching
-        if dupe_key not in collected_data:
-            collected_data[dupe_key]['data'] = jira['dupe_data']
-            collected_data[dupe_key]['is_dupe'] = True
-            collect_dupes(jira['dupe_data'], collected_data, cached_data)
+    level = jiras
+    while level:
+        dupes = [
+            jira for jira in level if jira.get('resolution') == 'Duplicate' and jira.get('dupe_of')
+        ]
+        dupe_keys = list(dict.fromkeys(jira['dupe_of'].strip() for jira in dupes))
+        dupe_data = {
+            key: cached_data[key]['data']
+            for key in dupe_keys
+            if cached_data.get(key, {}).get('data')
+        }
+        if missing := [key for key in dupe_keys if key not in dupe_data]:
+            try:
+                dupe_data.update({data['key']: data for data in get_data_jira(missing) or []})
+            except TimedOutError:
+                logger.warning(f"Failed to fetch data for {missing} after retries. Using default.")
+        level = []
+        for jira in dupes:
+            dupe_key = jira['dupe_of'].strip()
+            jira['dupe_data'] = dupe_data.get(dupe_key) or get_default_jira(dupe_key)
+            # Store Duplicate also in the main collection for caching
+            if dupe_key not in collected_data:
+                collected_data[dupe_key]['data'] = jira['dupe_data']
+                collected_data[dupe_key]['is_dupe'] = True
+                level.append(jira['dupe_data'])
 
 
 # --- API Calls ---
@@ -281,21 +466,28 @@ def collect_dupes(jira, collected_data, cached_data=None):  # pragma: no cover
 CACHED_RESPONSES = defaultdict(dict)
 
 
-def get_jira(jql, fields=None):
+def get_jira(jql, fields=None, start_at=0, max_results=None):
     """Accepts the jql to retrieve the data from Jira for the given fields
 
     :param jql: The query for retrieving the issue(s) details from jira
     :type jql: str
     :param fields: The custom fields in query to retrieve the data for
     :type fields: list
+    :param start_at: Index of the first issue to return
+    :type start_at: int
+    :param max_results: Maximum number of issues to return, capped by the server
+    :type max_results: int
     :returns: Jira object of response after status check
     :rtype: dict
     """
-    params = {"jql": jql}
+    params = {"jql": jql, "startAt": start_at}
     if fields:
         params.update({"fields": ",".join(fields)})
+    if max_results:
+        params.update({"maxResults": max_results})
 
     def _make_request():
+        jira_rate_limiter.acquire()
         try:
             response = requests.get(
                 f"{settings.jira.url}/rest/api/latest/search/",
@@ -307,6 +499,11 @@ def get_jira(jql, fields=None):
         except requests.exceptions.HTTPError as err:
             if err.response.status_code == 429:
                 logger.warning("Hit Jira API rate limit (429). Will retry after wait period.")
+                try:
+                    retry_after = float(err.response.headers.get("Retry-After", 20))
+                except ValueError:
+                    retry_after = 20
+                jira_rate_limiter.pause(retry_after)
             raise
 
     try:
@@ -322,6 +519,53 @@ def get_jira(jql, fields=None):
         raise
 
 
+def search_jira(jql, fields=None, page_size=None):
+    """Retrieve all the issues matching the jql, following the pagination of the results
+
+    :param jql: The query for retrieving the issue(s) details from jira
+    :type jql: str
+    :param fields: The custom fields in query to retrieve the data for
+    :type fields: list
+    :param page_size: Number of issues requested per page
+    :type page_size: int
+    :returns: List of issues
+    :rtype: list of dict
+    """
+    issues = []
+    while True:
+        page = get_jira(jql, fields, start_at=len(issues), max_results=page_size).json()
+        page_issues = page.get('issues') or []
+        issues.extend(page_issues)
+        if not page_issues or len(issues) >= page.get('total', 0):
+            return issues
+
+
+def fetch_jira_issues(issue_ids, fields=None, jql_filter=None):
+    """Retrieve the given issues in chunks of ``jira.chunk_size`` ids, fetched concurrently
+
+    :param issue_ids: Jira issue ids to get data for
+    :type issue_ids: list
+    :param fields: The custom fields in query to retrieve the data for
+    :type fields: list
+    :param jql_filter: Additional jql condition the issues must match
+    :type jql_filter: str
+    :returns: List of issues
+    :rtype: list of dict
+    """
+    chunk_size = settings.jira.chunk_size
+    chunks = [issue_ids[i : i + chunk_size] for i in range(0, len(issue_ids), chunk_size)]
+
+    def fetch_chunk(chunk):
+        jql = ' OR '.join([f"id = {issue_id}" for issue_id in chunk])
+        if jql_filter:
+            jql = f"({jql}) AND {jql_filter}"
+        return search_jira(jql, fields, page_size=chunk_size)
+
+    max_workers = max(1, min(settings.jira.max_workers, len(chunks)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [issue for issues in executor.map(fetch_chunk, chunks) for issue in issues]
+
+
 def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no cover
     """Get a list of marked Jira data and query Jira REST API.
 
@@ -382,14 +626,13 @@ def get_data_jira(issue_ids, cached_data=None, jira_fields=None):  # pragma: no
     for field in ('is_open', 'version'):
         assert field not in jira_fields
 
-    # Generate jql
     if isinstance(remaining_issues, str):
         remaining_issues = [issue_id.strip() for issue_id in remaining_issues.split(',')]
-    jql = ' OR '.join([f"id = {issue_id}" for issue_id in remaining_issues])
-    response = get_jira(jql, jira_fields)
-    data = response.json().get('issues')
+    data = fetch_jira_issues(remaining_issues, jira_fields)
     # Clean the data, only keep the required info.
     fetched_data = [sanitized_issue_data(issue, jira_fields) for issue in data if issue is not None]
+    if missing := set(remaining_issues) - {issue['key'] for issue in fetched_data}:
+        logger.warning(f"Jira API did not return {missing}")
 
     # Update cache with new data
     for issue in fetched_data:
@@ -0,0 +1,266 @@
+"""
+Pool of subscription manifests allocated ahead of the tests, shared by the xdist workers.
+
+Allocating a manifest with Manifester takes minutes and the RHSM API is rate limited, while
+most manifest fixtures only need any manifest of a ``manifest_category``. A
+:class:`ManifestPool` keeps ``size`` manifests per category allocated by a background thread
+and leases them to the workers of the run through a json file guarded by an flock. Released
+manifests are deleted, or put back in the pool when ``recycle`` is enabled and the manifest was
+removed from the organizations it was imported to, see :attr:`PooledManifest.recyclable`.
+
+Manifests are allocated and deleted by a backend: :class:`ManifesterBackend` for RHSM and
+:class:`LocalManifestBackend`, a stand-in writing placeholder files to run the pool offline.
+
+example:
+    pool = ManifestPool(ManifesterBackend(), robottelo_tmp_dir / 'manifest_pool.json')
+    with pool.manifest('golden_ticket') as manifest:
+        satellite.upload_manifest(org.id, manifest.content)
+    pool.close()
+"""
+
+from contextlib import contextmanager
+from functools import cached_property
+import json
+import os
+from pathlib import Path
+import threading
+import uuid
+import zipfile
+
+from manifester import Manifester
+
+from robottelo.config import settings
+from robottelo.logging import logger
+from robottelo.utils import file_lock, pid_alive, write_atomic
+
+# manifests kept allocated per category
+POOL_SIZE = 2
+# seconds a worker waits for another worker updating the pool
+LOCK_TIMEOUT = 60
+# seconds between two checks of the pool by the background thread
+REFILL_INTERVAL = 60
+
+
+class ManifesterBackend:
+    """Allocate manifests of the categories of ``settings.manifest`` with Manifester"""
+
+    def allocate(self, category):
+        """Allocate and export a manifest
+
+        :return: dict of the allocation uuid, the path and the name of the manifest file
+        """
+        manifester = Manifester(manifest_category=settings.manifest.get(category))
+        try:
+            manifest = manifester.get_manifest()
+        except Exception:
+            manifester.delete_subscription_allocation()
+            raise
+        return {'uuid': manifest.uuid, 'path': str(manifest.path), 'name': str(manifest.name)}
+
+    def delete(self, category, record):
+        Manifester(
+            manifest_category=settings.manifest.get(category)
+        ).delete_subscription_allocation(uuid=record['uuid'])
+
+
+class LocalManifestBackend:
+    """Stand-in backend writing placeholder manifests to ``directory``, no RHSM involved"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def allocate(self, category):
+        allocation_uuid = str(uuid.uuid4())
+        name = f'{category}-{allocation_uuid[:8]}_manifest.zip'
+        with zipfile.ZipFile(self.directory / name, 'w') as manifest:
+            manifest.writestr('consumer.json', json.dumps({'uuid': allocation_uuid}))
+        return {'uuid': allocation_uuid, 'path': str(self.directory / name), 'name': name}
+
+    def delete(self, category, record):
+        Path(record['path']).unlink(missing_ok=True)
+
+
+class PooledManifest:
+    """A manifest leased from a :class:`ManifestPool`, with the attributes of a Manifester one
+
+    :param category: the manifest category it was allocated for.
+    :param record: dict of the allocation uuid, the path and the name of the manifest file.
+    :param recycle: whether the pool recycles it, once removed from its organizations.
+    """
+
+    def __init__(self, category, record, recycle=False):
+        self.category = category
+        self.record = record
+        self.uuid = record['uuid']
+        self.path = Path(record['path'])
+        self.name = Path(record['name'])
+        self.recycle = recycle
+        # set by the user of the manifest after removing it from its organizations
+        self.recyclable = False
+
+    @cached_property
+    def content(self):
+        return self.path.read_bytes()
+
+
+class ManifestPool:
+    """Manifests allocated in the background and leased to the workers of the run
+
+    :param backend: allocates and deletes the manifests, see :class:`ManifesterBackend`.
+    :param store: path of the json file recording the pool, shared by the workers.
+    :param size: manifests kept allocated per category, for all the workers.
+    :param recycle: put recyclable manifests back in the pool instead of deleting them.
+    :param categories: categories to allocate manifests of before they are requested.
+    """
+
+    def __init__(self, backend, store, size=POOL_SIZE, recycle=False, categories=()):
+        self.backend = backend
+        self.store = Path(store)
+        self.size = size
+        self.recycle = recycle
+        self._categories = set(categories)
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread = None
+        self._lock = threading.Lock()
+        with self._state() as state:
+            state['workers'].append(os.getpid())
+
+    @contextmanager
+    def _state(self):
+        """The pool state, written back at the end of the context
+
+        Leases of exited processes are dropped and their manifests deleted. The background
+        thread and the workers are excluded by a thread lock and an flock of the store.
+        """
+        orphans = []
+        lock_file = self.store.with_name(f'{self.store.name}.lock')
+        with self._lock, file_lock(lock_file, timeout=LOCK_TIMEOUT):
+            try:
+                state = json.loads(self.store.read_text())
+            except (OSError, ValueError):
+                state = {'workers': [], 'categories': {}}
+            state['workers'] = [pid for pid in state['workers'] if pid_alive(pid)]
+            for category, entry in state['categories'].items():
+                entry['allocating'] = [pid for pid in entry['allocating'] if pid_alive(pid)]
+                for allocation_uuid, lease in list(entry['leased'].items()):
+                    if not pid_alive(lease['pid']):
+                        orphans.append((category, entry['leased'].pop(allocation_uuid)['record']))
+            yield state
+            write_atomic(self.store, json.dumps(state))
+        for category, record in orphans:
+            self._delete(category, record)
+
+    @staticmethod
+    def _entry(state, category):
+        return state['categories'].setdefault(
+            category, {'available': [], 'leased': {}, 'allocating': []}
+        )
+
+    def _allocate(self, category, lease=False):
+        """Allocate a manifest, leased by this process or added to the available ones"""
+        record = None
+        try:
+            record = self.backend.allocate(category)
+        finally:
+            with self._state() as state:
+                entry = self._entry(state, category)
+                entry['allocating'].remove(os.getpid())
+                if record and lease:
+                    entry['leased'][record['uuid']] = {'pid': os.getpid(), 'record': record}
+                elif record:
+                    entry['available'].append(record)
+        return record
+
+    def _delete(self, category, record):
+        try:
+            self.backend.delete(category, record)
+        except Exception as err:
+            logger.warning(f'Failed to delete the {category} manifest {record["uuid"]}: {err}')
+
+    def _refill(self, category):
+        """Allocate manifests of ``category`` until the pool has ``size`` of them"""
+        while not self._closing:
+            with self._state() as state:
+                entry = self._entry(state, category)
+                if len(entry['available']) + len(entry['allocating']) >= self.size:
+                    return
+                entry['allocating'].append(os.getpid())
+            try:
+                self._allocate(category)
+            except Exception as err:
+                logger.warning(f'Failed to allocate a {category} manifest for the pool: {err}')
+                return
+
+    def _run(self):
+        while not self._closing:
+            for category in sorted(self._categories):
+                self._refill(category)
+            self._wake.wait(REFILL_INTERVAL)
+            self._wake.clear()
+
+    def start(self):
+        """Start allocating manifests in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='manifest-pool', daemon=True)
+            self._thread.start()
+
+    def acquire(self, category):
+        """Lease a manifest of ``category``, allocated on the spot if the pool has none
+
+        :return: a :class:`PooledManifest`
+        """
+        self._categories.add(category)
+        self.start()
+        with self._state() as state:
+            entry = self._entry(state, category)
+            if entry['available']:
+                record = entry['available'].pop(0)
+                entry['leased'][record['uuid']] = {'pid': os.getpid(), 'record': record}
+            else:
+                record = None
+                entry['allocating'].append(os.getpid())
+        if record is None:
+            logger.info(f'No {category} manifest in the pool, allocating one')
+            record = self._allocate(category, lease=True)
+        self._wake.set()
+        return PooledManifest(category, record, recycle=self.recycle)
+
+    def release(self, manifest):
+        """End the lease of a manifest, put back in the pool if recyclable or deleted"""
+        recycle = self.recycle and manifest.recyclable
+        with self._state() as state:
+            entry = self._entry(state, manifest.category)
+            entry['leased'].pop(manifest.uuid, None)
+            if recycle:
+                entry['available'].append(manifest.record)
+        if not recycle:
+            self._delete(manifest.category, manifest.record)
+        self._wake.set()
+
+    @contextmanager
+    def manifest(self, category):
+        """Lease a manifest of ``category`` for the duration of the context"""
+        manifest = self.acquire(category)
+        try:
+            yield manifest
+        finally:
+            self.release(manifest)
+
+    def close(self):
+        """Stop allocating, the last worker of the run deletes the manifests left in the pool"""
+        self._closing = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        leftovers = []
+        with self._state() as state:
+            if os.getpid() in state['workers']:
+                state['workers'].remove(os.getpid())
+            if not state['workers']:
+                for category, entry in state['categories'].items():
+                    leftovers.extend((category, record) for record in entry['available'])
+                    entry['available'] = []
+        for category, record in leftovers:
+            self._delete(category, record)
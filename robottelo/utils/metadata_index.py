@@ -0,0 +1,229 @@
+"""Persistent index of the testimony tokens and ``is_open`` usages of test modules
+
+Every collection used to run the testimony token regexes over the docstrings of every test item,
+and ``inspect.getsource`` over every test function and module to find ``is_open`` workarounds.
+The index parses each test module once with :mod:`ast` and stores the results in a json file,
+keyed by the module path. An entry is reused as long as the mtime and size of the file are
+unchanged, or its content hash is unchanged (e.g. after a git checkout touched the file), so
+only modified modules are parsed again.
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import re
+import sys
+
+from robottelo.logging import logger
+from robottelo.utils import write_atomic
+
+# bump when the format of the entries changes, older indexes are then discarded
+INDEX_VERSION = 1
+
+COMPONENT = re.compile(
+    # To match :CaseComponent: FooBar
+    r'\s*:CaseComponent:\s*(?P<component>\S*)',
+    re.IGNORECASE,
+)
+
+IMPORTANCE = re.compile(
+    # To match :CaseImportance: Critical
+    r'\s*:CaseImportance:\s*(?P<importance>\S*)',
+    re.IGNORECASE,
+)
+
+TEAM = re.compile(
+    # To match :Team: Rocket
+    r'\s*:Team:\s*(?P<team>\S*)',
+    re.IGNORECASE,
+)
+
+BLOCKED_BY = re.compile(
+    # To match :BlockedBy: SAT-32932
+    r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)',
+    re.IGNORECASE,
+)
+
+VERIFIES = re.compile(
+    # To match :Verifies: SAT-32932
+    r'\s*:Verifies:\s*(?P<verifies>.*\S*)',
+    re.IGNORECASE,
+)
+
+IS_OPEN = re.compile(
+    # To match `if is_open('SAT:123456'):`
+    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+NOT_IS_OPEN = re.compile(
+    # To match `if not is_open('SAT:123456'):`
+    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+
+def parse_tokens(docstring):
+    """Parse the testimony tokens used for markers out of a docstring
+
+    :return: dict with the first component, importance and team, and the issues listed by the
+        last BlockedBy and Verifies tokens, or None if there is no docstring.
+    """
+    if docstring is None:
+        return None
+    tokens = {}
+    for name, regex in (('component', COMPONENT), ('importance', IMPORTANCE), ('team', TEAM)):
+        matches = regex.findall(docstring)
+        tokens[name] = matches[0] if matches else None
+    for name, regex in (('blocked_by', BLOCKED_BY), ('verifies', VERIFIES)):
+        matches = regex.findall(docstring)
+        tokens[name] = [issue.strip() for issue in matches[-1].split(',')] if matches else None
+    return tokens
+
+
+def parse_source(source):
+    """Parse the docstring tokens and ``is_open`` usages of every class and function of a module
+
+    Classes and functions are indexed by their ``__qualname__``.
+    """
+    lines = source.splitlines(keepends=True)
+    classes, functions = {}, {}
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                qualname = f'{prefix}{child.name}'
+                classes[qualname] = parse_tokens(ast.get_docstring(child))
+                visit(child, f'{qualname}.')
+            elif isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef):
+                qualname = f'{prefix}{child.name}'
+                # same lines as inspect.getsource, decorators included
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                function_source = ''.join(lines[start - 1 : child.end_lineno])
+                functions[qualname] = {
+                    'tokens': parse_tokens(ast.get_docstring(child)),
+                    'is_open': IS_OPEN.findall(function_source),
+                    'not_is_open': NOT_IS_OPEN.findall(function_source),
+                }
+                visit(child, f'{qualname}.<locals>.')
+
+    tree = ast.parse(source)
+    visit(tree, '')
+    components = COMPONENT.findall(source)
+    return {
+        'module': {
+            'tokens': parse_tokens(ast.get_docstring(tree)),
+            'component': components[0] if components else None,
+            'is_open': IS_OPEN.findall(source),
+            'not_is_open': NOT_IS_OPEN.findall(source),
+        },
+        'classes': classes,
+        'functions': functions,
+    }
+
+
+class MetadataIndex:
+    """Parsed metadata of test modules, persisted between pytest sessions
+
+    Lookups fall back to inspecting the live objects when they are not found in the index,
+    e.g. for tests created dynamically.
+
+    :param cache_file: path of the json file storing the index, or None to keep it in memory.
+    """
+
+    def __init__(self, cache_file=None):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.files = self._load()
+        self._checked = set()
+        self._dirty = False
+
+    def _load(self):
+        if self.cache_file and self.cache_file.exists():
+            try:
+                data = json.loads(self.cache_file.read_text())
+            except ValueError as err:
+                logger.debug(f'Ignoring unreadable metadata index {self.cache_file}: {err}')
+                return {}
+            if data.get('version') == INDEX_VERSION:
+                return data['files']
+        return {}
+
+    def save(self):
+        """Write the index to ``cache_file`` if any module was parsed again"""
+        if not (self.cache_file and self._dirty):
+            return
+        self.files = {path: entry for path, entry in self.files.items() if os.path.exists(path)}
+        # xdist workers collect in parallel, replace the file atomically
+        write_atomic(self.cache_file, json.dumps({'version': INDEX_VERSION, 'files': self.files}))
+        self._dirty = False
+
+    def entry(self, path):
+        """Return the index entry of the module at ``path``, parsing it again if it changed
+
+        :return: the entry as returned by :func:`parse_source`, or None if it can't be parsed.
+        """
+        path = str(path)
+        if path in self._checked:
+            return self.files.get(path)
+        self._checked.add(path)
+        try:
+            stat = os.stat(path)
+            entry = self.files.get(path)
+            if entry is None or [entry['mtime'], entry['size']] != [stat.st_mtime_ns, stat.st_size]:
+                source = Path(path).read_bytes()
+                digest = hashlib.sha256(source).hexdigest()
+                if entry is None or entry['sha256'] != digest:
+                    entry = {'sha256': digest, **parse_source(source.decode())}
+                entry.update(mtime=stat.st_mtime_ns, size=stat.st_size)
+                self.files[path] = entry
+                self._dirty = True
+        except (OSError, SyntaxError, ValueError) as err:
+            logger.debug(f'Failed to index test module {path}: {err}')
+            self.files.pop(path, None)
+            return None
+        return entry
+
+    def _lookup(self, obj):
+        """Return the index data of a test function or class, or None if it is not indexed"""
+        if inspect.isclass(obj):
+            path = getattr(sys.modules.get(obj.__module__), '__file__', None)
+            section = 'classes'
+        else:
+            obj = inspect.unwrap(obj)
+            path = getattr(getattr(obj, '__code__', None), 'co_filename', None)
+            section = 'functions'
+        entry = self.entry(path) if path else None
+        return entry[section].get(obj.__qualname__) if entry else None
+
+    def tokens(self, obj):
+        """Return the parsed testimony tokens of a test function, class or module docstring"""
+        if inspect.ismodule(obj):
+            entry = self.entry(obj.__file__)
+            data = entry['module']['tokens'] if entry else None
+        else:
+            data = self._lookup(obj)
+            if not inspect.isclass(obj) and data is not None:
+                data = data['tokens']
+        # docstrings inherited from a parent class are only found by inspect
+        return data if data is not None else parse_tokens(inspect.getdoc(obj))
+
+    def function_usages(self, function):
+        """Return the ``is_open`` and ``not is_open`` matches in the source of a test function"""
+        if (data := self._lookup(function)) is None:
+            source = inspect.getsource(function)
+            return IS_OPEN.findall(source), NOT_IS_OPEN.findall(source)
+        return data['is_open'], data['not_is_open']
+
+    def module_usages(self, module):
+        """Return the first component, ``is_open`` and ``not is_open`` matches of a test module"""
+        if (entry := self.entry(module.__file__)) is None:
+            source = inspect.getsource(module)
+            components = COMPONENT.findall(source)
+            return (
+                components[0] if components else None,
+                IS_OPEN.findall(source),
+                NOT_IS_OPEN.findall(source),
+            )
+        data = entry['module']
+        return data['component'], data['is_open'], data['not_is_open']
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from tenacity import retry, stop_after_attempt, wait_fixed
 
@@ -26,6 +28,9 @@ class ReportPortal:
     }
     statuses = ['FAILED', 'PASSED', 'SKIPPED', 'INTERRUPTED', 'IN_PROGRESS']
     importance_levels = ['Low', 'Medium', 'High', 'Critical', 'Fips']
+    # test items fetched per request, and concurrent requests, when fetching launch tests
+    tests_page_size = 300
+    max_workers = 8
 
     def __init__(self, rp_url=None, rp_api_key=None, rp_project=None):
         """initiate report portal properties"""
@@ -118,7 +123,7 @@ class ReportPortal:
             ```{'test_name1':test1_properties_dict, 'test_name2':test2_properties_dict}```
         """
         params = {
-            'page.size': 50,
+            'page.size': self.tests_page_size,
             'page.sort': 'name',
             'filter.eq.launchId': launch["id"],
             'filter.ne.type': "SUITE",
@@ -137,30 +142,30 @@ class ReportPortal:
             params['filter.has.attributeKey'] = 'team'
             params['filter.has.attributeValue'] = test_args['team']
 
-        # send HTTP request to RP API, retrieve the paginated results and join them together
-        page = 1
-        total_pages = 1
-        resp_tests = []
-        while page <= total_pages:
+        # send HTTP requests to RP API, retrieve the paginated results and join them together
+        def get_page(page):
             logger.debug(page)
-            params['page.page'] = page
             resp = requests.get(
                 url=f'{self.api_url}/item',
                 headers=self.headers,
-                params=params,
+                params={**params, 'page.page': page},
                 verify=False,
             )
             resp.raise_for_status()
-            resp_tests.extend(resp.json()['content'])
-            total_pages = resp.json()['page']['totalPages']
-            page += 1
+            return resp.json()
+
+        first_page = get_page(1)
+        resp_tests = first_page['content']
+        total_pages = first_page['page']['totalPages']
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, total_pages - 1)) as executor:
+                for page in executor.map(get_page, range(2, total_pages + 1)):
+                    resp_tests.extend(page['content'])
 
         # Only select tests matching the supplied paths. This is a workaround for RP API limitation
         # - unable to combine multiple filters of a same type
-        if test_args.get('paths'):
+        if paths := test_args.get('paths'):
             resp_tests = [
-                test
-                for test in resp_tests
-                if any([path for path in test_args['paths'] if path in test['name']])
+                test for test in resp_tests if any(path in test['name'] for path in paths)
             ]
         return resp_tests
@@ -14,6 +14,17 @@ recoverable, the main watcher will fail and release all other processes.
 It is recommended to use this class as a context manager, as it will automatically register and
 report when the process is done.
 
+The state of the resource is kept by a pluggable backend, selected by the ``backend`` argument or
+the ``robottelo.shared_resource_backend`` setting:
+
+- ``file``: a json file in /tmp, the default. Waiting processes only re-read the file, without
+  locking or rewriting it, until its version changes.
+- ``redis``: a redis key, using the ``shared_function`` redis connection settings. Waiting
+  processes are notified of changes through a redis channel.
+- ``socket``: served by the first process of the run to use it to the other local processes,
+  through an authenticated unix socket, and persisted in the robottelo tmp dir. Waiting processes
+  are notified through a condition variable.
+
 Example:
     >>> with SharedResource("target_sat.hostname", upgrade_action, **upgrade_kwargs) as resource:
     ...     # Do pre-upgrade setup steps
@@ -22,23 +33,326 @@ Example:
     ...     # Do post-upgrade cleanup steps if any
 """
 
+from abc import ABC, abstractmethod
+import atexit
 import datetime
+from functools import cached_property
+import hashlib
 import json
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
 import os
 from pathlib import Path
+import threading
 import time
 from uuid import uuid4
 
 from broker.helpers import FileLock
 from wait_for import wait_for
 
-from robottelo.config import settings
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.utils import file_lock, write_atomic
 
 
 class SharedResourceError(Exception):
     """An exception class for SharedResource errors."""
 
 
+class SharedResourceBackend(ABC):
+    """Storage of the state shared by all the watchers of a resource.
+
+    The state is versioned, every update increases the version by one. Reading a resource which
+    does not exist, or was deleted, raises ``FileNotFoundError``.
+    """
+
+    def __init__(self, resource_name):
+        self.resource_name = resource_name
+
+    def exists(self):
+        """Return True if the resource exists"""
+        try:
+            self.read()
+        except FileNotFoundError:
+            return False
+        return True
+
+    @abstractmethod
+    def read(self):
+        """Return a tuple of the current state and its version"""
+
+    @abstractmethod
+    def update(self, func):
+        """Atomically replace the state by ``func(state)``, the state is None when it is missing
+
+        :return: the new state.
+        """
+
+    @abstractmethod
+    def delete(self):
+        """Delete the resource"""
+
+    @abstractmethod
+    def wait_changed(self, version, timeout):
+        """Block until the version of the state is not ``version`` anymore, or ``timeout``"""
+
+
+class FileBackend(SharedResourceBackend):
+    """State stored in a json file, locked with a ``FileLock`` while it is updated.
+
+    The file is replaced atomically, so it can be read without taking the lock.
+    """
+
+    # seconds between two reads of the file while waiting for a change
+    min_delay = 0.05
+    max_delay = 1
+
+    def __init__(self, resource_name):
+        super().__init__(resource_name)
+        self.resource_file = Path(f"/tmp/{resource_name}.shared")
+        self.lock_file = FileLock(self.resource_file)
+
+    def read(self):
+        data = json.loads(self.resource_file.read_text())
+        return data["state"], data["version"]
+
+    def update(self, func):
+        with self.lock_file:
+            try:
+                state, version = self.read()
+            except FileNotFoundError:
+                state, version = None, 0
+            state = func(state)
+            write_atomic(
+                self.resource_file, json.dumps({"state": state, "version": version + 1}, indent=4)
+            )
+        return state
+
+    def delete(self):
+        self.resource_file.unlink()
+
+    def wait_changed(self, version, timeout):
+        deadline = time.monotonic() + timeout
+        delay = self.min_delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                if self.read()[1] != version:
+                    return
+            except FileNotFoundError:
+                return
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_delay)
+
+
+class RedisBackend(SharedResourceBackend):
+    """State stored in a redis key, updates are published on a redis channel."""
+
+    def __init__(self, resource_name):
+        from robottelo.utils.decorators.func_shared.redis_storage import RedisStorageHandler
+
+        super().__init__(resource_name)
+        self.key = f"shared_resource:{resource_name}"
+        self.channel = f"{self.key}:changed"
+        self.storage = RedisStorageHandler(
+            host=settings.shared_function.redis_host,
+            port=settings.shared_function.redis_port,
+            db=settings.shared_function.redis_db,
+            password=settings.shared_function.redis_password,
+            lock_timeout=settings.shared_function.lock_timeout,
+        )
+
+    def read(self):
+        data = self.storage.get(self.key)
+        if data is None or data["state"] is None:
+            raise FileNotFoundError(f"Shared resource {self.resource_name} does not exist")
+        return data["state"], data["version"]
+
+    def _write(self, state):
+        data = self.storage.get(self.key)
+        version = data["version"] + 1 if data else 1
+        self.storage.set(self.key, {"state": state, "version": version})
+        self.storage.client.publish(self.channel, version)
+
+    def update(self, func):
+        with self.storage.lock(self.key):
+            try:
+                state = self.read()[0]
+            except FileNotFoundError:
+                state = None
+            state = func(state)
+            self._write(state)
+        return state
+
+    def delete(self):
+        with self.storage.lock(self.key):
+            self._write(None)
+
+    def wait_changed(self, version, timeout):
+        deadline = time.monotonic() + timeout
+        pubsub = self.storage.client.pubsub(ignore_subscribe_messages=True)
+        # subscribe before reading the version, so no update can be missed
+        pubsub.subscribe(self.channel)
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    if self.read()[1] != version:
+                        return
+                except FileNotFoundError:
+                    return
+                pubsub.get_message(timeout=remaining)
+        finally:
+            pubsub.close()
+
+
+class _StateServer:
+    """State of a resource, served to local processes through a unix socket.
+
+    The state is written to ``store`` on every change, so a server started after the serving
+    process exited carries on from the last state. Clients must authenticate with ``authkey``.
+
+    Every request is a tuple of an operation and its arguments:
+
+    - ``('read',)``: return the state and its version.
+    - ``('swap', version, state)``: replace the state if its version is still ``version``,
+      return whether it was replaced.
+    - ``('wait', version, timeout)``: block until the version is not ``version`` anymore.
+    """
+
+    def __init__(self, address, store, authkey):
+        self.address = address
+        self.store = store
+        try:
+            data = json.loads(store.read_text())
+            self.state, self.version = data["state"], data["version"]
+        except (OSError, ValueError):
+            self.state, self.version = None, 0
+        self.changed = threading.Condition()
+        self.listener = Listener(str(address), family="AF_UNIX", authkey=authkey)
+        atexit.register(self.close)
+        threading.Thread(target=self.serve, name=f"shared-resource-{address}", daemon=True).start()
+
+    def close(self):
+        self.listener.close()
+
+    def serve(self):
+        while True:
+            try:
+                connection = self.listener.accept()
+            except AuthenticationError:
+                continue
+            except OSError:  # listener closed
+                return
+            threading.Thread(target=self.handle, args=(connection,), daemon=True).start()
+
+    def handle(self, connection):
+        with connection:
+            operation, *args = connection.recv()
+            with self.changed:
+                if operation == "read":
+                    response = (self.state, self.version)
+                elif operation == "swap":
+                    version, state = args
+                    response = version == self.version
+                    if response:
+                        write_atomic(
+                            self.store, json.dumps({"state": state, "version": version + 1})
+                        )
+                        self.state = state
+                        self.version += 1
+                        self.changed.notify_all()
+                elif operation == "wait":
+                    version, timeout = args
+                    self.changed.wait_for(lambda: self.version != version, timeout=timeout)
+                    response = self.version
+            connection.send(response)
+
+
+class SocketBackend(SharedResourceBackend):
+    """State served by the first local process to use the resource.
+
+    The other processes reach it through a unix socket in the robottelo tmp dir, scoped to the
+    pytest run, and are notified of changes through a condition variable of the serving process,
+    so they wake up as soon as it changes. The state is persisted, the next process to use the
+    resource serves it when the serving process exits.
+    """
+
+    def __init__(self, resource_name):
+        super().__init__(resource_name)
+        run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID", str(os.getpid()))
+        # unix socket paths are limited to about 100 characters
+        name = hashlib.sha1(f"{run_id}:{resource_name}".encode()).hexdigest()[:16]
+        directory = robottelo_tmp_dir / "shared_resources"
+        directory.mkdir(parents=True, exist_ok=True)
+        self.address = directory / f"{name}.sock"
+        self.store = directory / f"{name}.json"
+        self.lock_file = directory / f"{name}.lock"
+        self.key_file = directory / f"{name}.key"
+        self.server = None
+
+    @cached_property
+    def authkey(self):
+        """The key authenticating the processes of the run, created by the first one"""
+        with file_lock(self.lock_file):
+            if not self.key_file.exists():
+                fd = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+                with os.fdopen(fd, "wb") as key_file:
+                    key_file.write(os.urandom(32))
+            return self.key_file.read_bytes()
+
+    def _client(self):
+        return Client(str(self.address), family="AF_UNIX", authkey=self.authkey)
+
+    def _connect(self):
+        try:
+            return self._client()
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        with file_lock(self.lock_file):
+            try:
+                return self._client()
+            except ConnectionRefusedError:  # left by a process which is gone
+                self.address.unlink()
+            except FileNotFoundError:
+                pass
+            self.server = _StateServer(self.address, self.store, self.authkey)
+        return self._client()
+
+    def _call(self, *request):
+        # the serving process may exit meanwhile, a read or a wait is safe to send again
+        attempts = 1 if request[0] == "swap" else 2
+        for attempt in range(attempts):
+            try:
+                with self._connect() as connection:
+                    connection.send(request)
+                    return connection.recv()
+            except (EOFError, ConnectionError):
+                if attempt == attempts - 1:
+                    raise
+        return None
+
+    def read(self):
+        state, version = self._call("read")
+        if state is None:
+            raise FileNotFoundError(f"Shared resource {self.resource_name} does not exist")
+        return state, version
+
+    def update(self, func):
+        while True:
+            state, version = self._call("read")
+            state = func(state)
+            # another process may have updated the state meanwhile, try again if so
+            if self._call("swap", version, state):
+                return state
+
+    def delete(self):
+        self.update(lambda state: None)
+
+    def wait_changed(self, version, timeout):
+        self._call("wait", version, timeout)
+
+
+_backends = {"file": FileBackend, "redis": RedisBackend, "socket": SocketBackend}
+
+
 class SharedResource:
     """A class representing a shared resource.
 
@@ -48,7 +362,7 @@ class SharedResource:
         action_kwargs (dict): The keyword arguments to be passed to the action function.
         action_is_recoverable (bool): Whether the action is recoverable or not.
         id (str): The unique identifier of the shared resource.
-        resource_file (Path): The path to the file representing the shared resource.
+        backend (SharedResourceBackend): The storage of the shared resource state.
         is_main (bool): Whether the current instance is the main watcher or not.
         is_recovering (bool): Whether the current instance is recovering from an error or not.
     """
@@ -61,6 +375,7 @@ class SharedResource:
         action_validator=None,
         retries=3,
         delay=300,
+        backend=None,
         **action_kwargs,
     ):
         """Initializes a new instance of the SharedResource class.
@@ -70,10 +385,15 @@ class SharedResource:
             action (function): The function to be executed when the resource is ready.
             action_args (tuple): The arguments to be passed to the action function.
             action_validator (function): The function to validate the action results.
+            backend (str): The backend storing the shared state, one of file, redis or socket.
+                Defaults to the robottelo.shared_resource_backend setting.
             action_kwargs (dict): The keyword arguments to be passed to the action function.
         """
-        self.resource_file = Path(f"/tmp/{resource_name}.shared")
-        self.lock_file = FileLock(self.resource_file)
+        backend = backend or settings.robottelo.shared_resource_backend
+        if backend not in _backends:
+            raise SharedResourceError(f"Unknown shared resource backend {backend}")
+        self.resource_name = resource_name
+        self.backend = _backends[backend](resource_name)
         self.id = str(uuid4().fields[-1])
         self.action = action
         self.action_validator = action_validator
@@ -96,17 +416,29 @@ class SharedResource:
         with open(f'logs/robottelo_{os.environ.get("PYTEST_XDIST_WORKER")}.log', 'a') as log_file:
             log_file.write(full_message)
 
+    def _update(self, func):
+        """Applies func to the current state of the shared resource.
+
+        Args:
+            func (function): Modifies the state dict in place.
+        """
+
+        def update(curr_data):
+            if curr_data is None:
+                raise FileNotFoundError(f"Shared resource {self.resource_name} does not exist")
+            func(curr_data)
+            return curr_data
+
+        return self.backend.update(update)
+
     def _update_status(self, status):
         """Updates the status of the shared resource.
 
         Args:
             status (str): The new status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["statuses"][self.id] = status
-            self.log(f"Updating watcher status to {status}")
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        self.log(f"Updating watcher status to {status}")
+        self._update(lambda curr_data: curr_data["statuses"].update({self.id: status}))
 
     def _update_main_status(self, status):
         """Updates the main status of the shared resource.
@@ -114,10 +446,13 @@ class SharedResource:
         Args:
             status (str): The new main status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["main_status"] = status
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        self._update(lambda curr_data: curr_data.update(main_status=status))
+
+    @staticmethod
+    def _all_status(curr_data, status):
+        return all(
+            curr_data["statuses"].get(watcher_id) == status for watcher_id in curr_data["watchers"]
+        )
 
     def _check_all_status(self, status):
         """Checks if all watchers have the specified status.
@@ -128,12 +463,7 @@ class SharedResource:
         Returns:
             bool: True if all watchers have the specified status, False otherwise.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            for watcher_id in curr_data["watchers"]:
-                if curr_data["statuses"].get(watcher_id) != status:
-                    return False
-            return True
+        return self._all_status(self.backend.read()[0], status)
 
     def _wait_for_status(self, status):
         """Waits until all watchers have the specified status.
@@ -141,65 +471,70 @@ class SharedResource:
         Args:
             status (str): The status to wait for.
         """
-        while not self._check_all_status(status):
+        while True:
+            curr_data, version = self.backend.read()
+            if self._all_status(curr_data, status):
+                return
             if status == "done":
                 self.log("Main worker still waiting for all workers to report status 'done'.")
-            time.sleep(1)
+            self.backend.wait_changed(version, timeout=settings.robottelo.shared_resource_wait)
 
     def _wait_for_main_watcher(self):
         """Waits for the main watcher to finish."""
         while True:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data, version = self.backend.read()
             if curr_data["main_status"] == "error":
                 raise Exception(f"Error in main watcher: {curr_data['main_watcher']}")
             if curr_data["main_status"] == "action_error":
                 self._try_take_over()
             elif curr_data["main_status"] != "done":
-                time.sleep(settings.robottelo.shared_resource_wait)
+                self.backend.wait_changed(version, timeout=settings.robottelo.shared_resource_wait)
             else:
                 self.log("Main status now done, breaking wait loop")
                 break
 
     def _try_take_over(self):
         """Tries to take over as the main watcher."""
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+
+        def take_over(curr_data):
             if curr_data["main_status"] in ("action_error", "error"):
                 curr_data["main_status"] = "recovering"
                 curr_data["main_watcher"] = self.id
-                self.resource_file.write_text(json.dumps(curr_data, indent=4))
-                self.is_main = True
-                self.is_recovering = True
+
+        if self._update(take_over)["main_watcher"] == self.id:
+            self.is_main = True
+            self.is_recovering = True
         self.wait()
 
     def register(self):
         """Registers the current process as a watcher."""
-        with self.lock_file:
-            if self.resource_file.exists():
-                curr_data = json.loads(self.resource_file.read_text())
-                self.is_main = False
-            else:  # First watcher to register, becomes the main watcher, and creates the file
+
+        def register(curr_data):
+            # First watcher to register, becomes the main watcher, and creates the resource
+            self.is_main = curr_data is None
+            if self.is_main:
                 curr_data = {
                     "watchers": [],
                     "statuses": {},
                     "main_watcher": self.id,
                     "main_status": "waiting",
                 }
-                self.is_main = True
             curr_data["watchers"].append(self.id)
             curr_data["statuses"][self.id] = "pending"
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            return curr_data
+
+        self.backend.update(register)
 
     def unregister(self):
         """Unregisters the current process as a watcher."""
         self.log(f"Unregistering {os.environ.get('PYTEST_XDIST_WORKER')}")
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            self.log("Removing watcher ID from resource file")
+
+        def unregister(curr_data):
+            self.log("Removing watcher ID from shared resource")
             curr_data["watchers"].remove(self.id)
             del curr_data["statuses"][self.id]
-            self.log("Writing new resource file")
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+
+        self._update(unregister)
 
     def ready(self):
         """Marks the current process as ready to perform the action."""
@@ -221,7 +556,7 @@ class SharedResource:
         except Exception as err:
             if not self.action_is_recoverable:
                 self._update_main_status("error")
-                self.resource_file.unlink()
+                self.backend.delete()
                 raise SharedResourceError('Main worker failed during action') from err
             self._update_main_status('action_error')
             raise SharedResourceError('Recoverable failures in main worker') from err
@@ -270,15 +605,15 @@ class SharedResource:
             self.done()
             if self.is_main:
                 self._wait_for_status("done")
-                self.log("All workers done, removing resource file")
-                self.resource_file.unlink()
+                self.log("All workers done, removing shared resource")
+                self.backend.delete()
         else:
             self._update_status("error")
             if self.is_main:
                 if self._check_all_status("error"):
                     # All have failed, delete the file
-                    self.log("All workers FAILED, removing resource file")
-                    self.resource_file.unlink()
+                    self.log("All workers FAILED, removing shared resource")
+                    self.backend.delete()
                 else:
                     self.log("Setting main status to ERROR")
                     self._update_main_status("error")
@@ -0,0 +1,96 @@
+"""Snapshots of the Satellite usage reports
+
+``satellite-maintain report generate`` scans the whole database and takes tens of seconds, while
+tests look up many keys of the same report. A :class:`ReportSnapshot` generates the report once,
+parses all its keys and serves the lookups from memory, until it expires or is refreshed by
+a test which changed the reported state.
+"""
+
+import json
+import threading
+import time
+
+# seconds a generated usage report is used for
+REPORT_TTL = 300
+
+
+def parse_report(output):
+    """Parse the output of ``satellite-maintain report generate``
+
+    :return: dict of the raw values by key, in the order of the report
+    """
+    values = {}
+    for line in output.splitlines():
+        if ':' not in line or line.startswith((' ', '-')):
+            continue
+        key, value = line.split(':', 1)
+        values.setdefault(key.strip(), value.strip())
+    return values
+
+
+def parse_condensed_report(output):
+    """Parse the json report printed by ``satellite-maintain report condense``"""
+    return json.loads(output[output.index('{') :])
+
+
+def find_value(values, key):
+    """Return the value of ``key``, or of the first key containing it, ignoring case
+
+    :return: the value, or None if no key matches
+    """
+    key = key.lower()
+    matches = [name for name in values if key in name.lower()]
+    for name in matches:
+        if name.lower() == key:
+            return values[name]
+    return values[matches[0]] if matches else None
+
+
+class ReportSnapshot:
+    """Values of a report, generated at most once per ``ttl`` seconds
+
+    :param generate: function generating the report, returning its values by key
+    :param ttl: seconds a generated report is used for, None to use it until refreshed
+    """
+
+    def __init__(self, generate, ttl=REPORT_TTL):
+        self._generate = generate
+        self.ttl = ttl
+        self._values = None
+        self._generated_at = None
+        self._lock = threading.Lock()
+
+    def _expired(self):
+        return self._values is None or (
+            self.ttl is not None and time.monotonic() - self._generated_at > self.ttl
+        )
+
+    def refresh(self):
+        """Generate the report again, e.g. after a test changed the reported state
+
+        :return: the new values by key
+        """
+        with self._lock:
+            self._values = self._generate()
+            self._generated_at = time.monotonic()
+            return self._values
+
+    def invalidate(self):
+        """Generate the report again on next lookup"""
+        with self._lock:
+            self._values = None
+
+    @property
+    def values(self):
+        """The values by key, the report is generated if there is no valid snapshot"""
+        with self._lock:
+            if self._expired():
+                self._values = self._generate()
+                self._generated_at = time.monotonic()
+            return self._values
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
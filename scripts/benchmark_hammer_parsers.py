@@ -0,0 +1,184 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "click",
+# ]
+# ///
+"""Benchmark the hammer output parsers of robottelo.cli.hammer on large outputs
+
+The outputs mimic what hammer prints for big entities, e.g. ``host list`` of a Satellite with
+10k hosts or ``content-view info`` of a content view with hundreds of versions and repositories.
+Usage:
+
+    python scripts/benchmark_hammer_parsers.py
+    python scripts/benchmark_hammer_parsers.py --rows 50000 --repeat 3 --dump-dir /tmp/outputs
+
+Captured outputs can be benchmarked too, parser is picked by the file extension (csv/json/txt):
+
+    python scripts/benchmark_hammer_parsers.py --output host_list.csv --output cv_info.txt
+"""
+
+import json
+from pathlib import Path
+import timeit
+
+import click
+
+from robottelo.cli import hammer
+
+HOST_COLUMNS = [
+    'Id',
+    'Name',
+    'Operating System',
+    'Host Group',
+    'IP',
+    'MAC',
+    'Global Status',
+    'Organization',
+    'Location',
+    'Additional Information',
+]
+
+
+def host_list_rows(rows):
+    for i in range(1, rows + 1):
+        yield [
+            i,
+            f'host-{i}.example.com',
+            f'RedHat 9.{i % 7}',
+            f'hostgroup-{i % 13}',
+            f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}',
+            ':'.join(f'{(i >> shift) % 256:02x}' for shift in (40, 32, 24, 16, 8, 0)),
+            ('OK', 'Warning', 'Error')[i % 3],
+            'Default Organization',
+            'Default Location',
+            f'Comment, with "quotes" {i}' if i % 10 == 0 else '',
+        ]
+
+
+def host_list_csv(rows):
+    """``hammer --output csv host list`` with ``rows`` hosts"""
+
+    def quote(value):
+        value = str(value)
+        if any(char in value for char in ',"\n'):
+            return '"{}"'.format(value.replace('"', '""'))
+        return value
+
+    lines = [','.join(HOST_COLUMNS)]
+    lines.extend(','.join(map(quote, row)) for row in host_list_rows(rows))
+    return '\n'.join(lines) + '\n'
+
+
+def host_list_json(rows):
+    """``hammer --output json host list`` with ``rows`` hosts"""
+    hosts = [dict(zip(HOST_COLUMNS, row, strict=True)) for row in host_list_rows(rows)]
+    for host in hosts:
+        host['Content Facet Attributes'] = {
+            'Content View': {'Id': host['Id'] % 50, 'Name': f'cv-{host["Id"] % 50}'},
+            'Lifecycle Environment': {'Id': 1, 'Name': 'Library'},
+            'Errata Counts': {'Security': 1, 'Bugfix': 2, 'Enhancement': 3, 'Total': 6},
+        }
+    return json.dumps(hosts, indent=2)
+
+
+def content_view_info(items):
+    """``hammer content-view info`` of a content view with ``items`` repositories and versions"""
+    lines = [
+        'Id:                     1',
+        'Name:                   big content view',
+        'Label:                  big_content_view',
+        'Composite:              false',
+        'Description:',
+        'Content Host Count:     42',
+        'Solve Dependencies:     no',
+        'Organization:           Default Organization',
+        'Yum Repositories:',
+    ]
+    for i in range(1, items + 1):
+        lines += [
+            f' {i}) Id:    {i}',
+            f'    Name:  repository {i}',
+            f'    Label: repository_{i}',
+        ]
+    lines += ['Container Image Repositories:', '', 'Lifecycle Environments:']
+    for i in range(1, 4):
+        lines += [f' {i}) Id:   {i}', f'    Name: environment {i}']
+    lines.append('Versions:')
+    for i in range(1, items + 1):
+        lines += [
+            f' {i}) Id:        {100 + i}',
+            f'    Version:   {i}.0',
+            '    Published: 2024/05/13 10:20:30',
+        ]
+    lines += [
+        'Content Information:',
+        '    Content View:',
+        '        ID:   1',
+        '        Name: big content view',
+        '    Lifecycle Environment:',
+        '        ID:   1',
+        '        Name: Library',
+        'Subscription Information:',
+        '    UUID: 2f1f7c47-4b41-4c3c-9c7f-8a7d3c3b0a1f',
+        '    Registered by Activation Keys:',
+    ]
+    lines += [f'        activation key {i}' for i in range(1, items + 1)]
+    lines += ['Activation Keys:']
+    lines += [f' {i}) activation key {i}' for i in range(1, items + 1)]
+    lines += ['Parameters:']
+    lines += [f'    param{i} => value {i}' for i in range(1, items + 1)]
+    return '\n'.join(lines) + '\n'
+
+
+PARSERS = {
+    '.csv': hammer.parse_csv,
+    '.json': hammer.parse_json,
+    '.txt': hammer.parse_info,
+}
+
+
+def bench(name, parser, output, repeat, number):
+    timings = timeit.repeat(lambda: parser(output), repeat=repeat, number=number)
+    best = min(timings) / number * 1000
+    click.echo(f'{name:<40} {len(output) / 1024:10.0f} KiB {best:10.2f} ms')
+
+
+@click.command()
+@click.option('--rows', default=10000, show_default=True, help='Hosts in the host list outputs.')
+@click.option('--items', default=1000, show_default=True, help='Versions/repos in the cv info.')
+@click.option('--repeat', default=5, show_default=True, help='Timing repetitions, best is shown.')
+@click.option('--number', default=1, show_default=True, help='Parser calls per repetition.')
+@click.option(
+    '--output',
+    'outputs',
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help='Captured hammer output to benchmark, can be given multiple times.',
+)
+@click.option(
+    '--dump-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    help='Write the generated outputs to this directory.',
+)
+def main(rows, items, repeat, number, outputs, dump_dir):
+    generated = {
+        f'host_list_{rows}.csv': host_list_csv(rows),
+        f'host_list_{rows}.json': host_list_json(rows),
+        f'content_view_info_{items}.txt': content_view_info(items),
+    }
+    if dump_dir:
+        dump_dir.mkdir(parents=True, exist_ok=True)
+        for name, output in generated.items():
+            dump_dir.joinpath(name).write_text(output)
+    click.echo(f'{"output":<40} {"size":>14} {"best":>13}')
+    for name, output in generated.items():
+        bench(name, PARSERS[Path(name).suffix], output, repeat, number)
+    for path in outputs:
+        if (parser := PARSERS.get(path.suffix)) is None:
+            raise click.BadParameter(f'Unknown output type {path}, use .csv, .json or .txt')
+        bench(path.name, parser, path.read_text(), repeat, number)
+
+
+if __name__ == '__main__':
+    main()
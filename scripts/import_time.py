@@ -0,0 +1,78 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "click",
+# ]
+# ///
+"""Measure how long importing robottelo modules takes in a fresh interpreter
+
+Every xdist worker imports these modules while collecting tests, so their import time is paid
+once per worker. Usage:
+
+    python scripts/import_time.py
+    python scripts/import_time.py -m robottelo.constants -m robottelo.hosts --runs 10 --top 20
+"""
+
+from statistics import median
+import subprocess
+import sys
+import time
+
+import click
+
+
+def import_time(module):
+    """Import ``module`` in a new interpreter
+
+    :return: tuple of the wall time in seconds and the ``-X importtime`` report lines.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode:
+        raise click.ClickException(f'Failed to import {module}:\n{result.stderr}')
+    return elapsed, [line for line in result.stderr.splitlines() if line.startswith('import time:')]
+
+
+def slowest_imports(report, top):
+    """Return the ``top`` modules with the highest self import time, in microseconds"""
+    imports = []
+    for line in report[1:]:  # the first line is the header
+        self_us, _, name = line.removeprefix('import time:').split('|')
+        imports.append((int(self_us), name.strip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+@click.command()
+@click.option(
+    '-m',
+    '--module',
+    'modules',
+    multiple=True,
+    default=['robottelo.constants'],
+    show_default=True,
+    help='Module to import, can be given multiple times.',
+)
+@click.option('--runs', default=5, show_default=True, help='Imports per module.')
+@click.option('--top', default=10, show_default=True, help='Slowest imports to list.')
+def main(modules, runs, top):
+    for module in modules:
+        timings, report = [], []
+        for _ in range(runs):
+            elapsed, report = import_time(module)
+            timings.append(elapsed)
+        click.echo(
+            f'{module}: median {median(timings) * 1000:.1f} ms, '
+            f'min {min(timings) * 1000:.1f} ms over {runs} runs (interpreter startup included)'
+        )
+        for self_us, name in slowest_imports(report, top):
+            click.echo(f'  {self_us / 1000:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
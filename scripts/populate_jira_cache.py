@@ -58,6 +58,9 @@ def populate_jira_cache(tests_dir, fresh):
         click.echo("Fresh mode enabled. Fetching all issues regardless of cache status...")
         new_issues = issues
     else:
+        # Refresh the cached issues changed since the last sync
+        refreshed = jira_cache.sync()
+        click.echo(f"Refreshed {len(refreshed)} cached issues changed in Jira")
         # Check which issues are already in cache
         cached_issues = jira_cache.get_many(issues)
         cached_issues = {k for k, v in cached_issues.items() if v is not None}
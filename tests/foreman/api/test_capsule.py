@@ -112,8 +112,7 @@ def test_positive_delete(target_sat):
 
     :BZ: 1398695
     """
-    new_port = target_sat.available_capsule_port
-    with target_sat.default_url_on_new_port(9090, new_port) as url:
+    with target_sat.default_url_on_new_port(9090) as url:
         proxy = target_sat.api.SmartProxy(url=url).create()
         proxy.delete()
     with pytest.raises(HTTPError):
@@ -130,13 +129,11 @@ def test_positive_update_url(request, target_sat):
     """
     # Create fake capsule with name
     name = gen_string('alpha')
-    port = target_sat.available_capsule_port
-    with target_sat.default_url_on_new_port(9090, port) as url:
+    with target_sat.default_url_on_new_port(9090) as url:
         proxy = target_sat.api.SmartProxy(url=url, name=name).create()
         assert proxy.name == name
     # Open another tunnel to update url
-    new_port = target_sat.available_capsule_port
-    with target_sat.default_url_on_new_port(9090, new_port) as url:
+    with target_sat.default_url_on_new_port(9090) as url:
         proxy.url = url
         proxy = proxy.update(['url'])
         assert proxy.url == url
@@ -193,8 +190,7 @@ def test_positive_import_puppet_classes(
     request.addfinalizer(user.delete)
     request.addfinalizer(role.delete)
 
-    new_port = puppet_sat.available_capsule_port
-    with puppet_sat.default_url_on_new_port(9090, new_port) as url:
+    with puppet_sat.default_url_on_new_port(9090) as url:
         proxy = puppet_sat.api.SmartProxy(url=url).create()
 
         result = proxy.import_puppetclasses()
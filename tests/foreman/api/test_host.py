@@ -403,6 +403,7 @@ def test_positive_create_and_update_with_subnet(
     host = host.update(['subnet'])
     assert host.subnet.read().name == new_subnet.name
     # check that subnet values are included in the usage report
+    module_target_sat.usage_report.refresh()
     if module_target_sat.network_type.has_ipv4:
         assert int(module_target_sat.get_reported_value('subnet_ipv4_count')) > 0
         assert int(module_target_sat.get_reported_value('hosts_with_ipv4only_interface_count')) > 0
@@ -74,7 +74,12 @@ def test_positive_bootc_api_actions(
     # Testing bootc image is correctly included in the usage report
     os = dummy_bootc_host.operatingsystem.read_json()
     assert (
-        int(target_sat.get_reported_value(f'image_mode_hosts_by_os_count|{os["family"]}')) == 1
+        int(
+            target_sat.get_reported_value(
+                f'image_mode_hosts_by_os_count|{os["family"]}', refresh=True
+            )
+        )
+        == 1
     ), "host not included in usage report"
 
 
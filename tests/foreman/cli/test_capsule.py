@@ -26,8 +26,7 @@ def test_positive_import_puppet_classes(session_puppet_enabled_sat, puppet_proxy
     :expectedresults: Puppet classes are imported from proxy
     """
     with session_puppet_enabled_sat as puppet_sat:
-        port = puppet_sat.available_capsule_port
-        with puppet_sat.default_url_on_new_port(9090, port) as url:
+        with puppet_sat.default_url_on_new_port(9090) as url:
             proxy = puppet_sat.cli_factory.make_proxy({'url': url})
             puppet_sat.cli.Proxy.import_classes({'id': proxy['id']})
         puppet_sat.cli.Proxy.delete({'id': proxy['id']})
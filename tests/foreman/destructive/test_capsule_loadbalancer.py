@@ -12,6 +12,8 @@
 
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from wait_for import wait_for
 from wrapanapi import VmState
@@ -81,6 +83,7 @@ def setup_capsules(
     """Install capsules with loadbalancer options"""
     extra_cert_var = {'foreman-proxy-cname': module_rhel_contenthost.hostname}
     extra_installer_var = {'certs-cname': module_rhel_contenthost.hostname}
+    capsule_ids = []
 
     for capsule in module_lb_capsule:
         capsule.register_to_cdn()
@@ -110,9 +113,15 @@ def setup_capsules(
                 'lifecycle-environment': content_for_client['client_lce'].name,
             }
         )
+        capsule_ids.append(capsule_id)
+
+    # sync all capsules at once and wait for them together
+    timestamp = datetime.now(UTC)
+    for capsule_id in capsule_ids:
         module_target_sat.cli.Capsule.content_synchronize(
-            {'id': capsule_id, 'organization-id': module_org.id}
+            {'id': capsule_id, 'organization-id': module_org.id, 'async': True}
         )
+    module_target_sat.wait_for_capsules_sync(module_lb_capsule, start_time=timestamp)
 
     return {
         'capsule_1': module_lb_capsule[0],
@@ -0,0 +1,46 @@
+"""Tests for running several commands in a single remote execution"""
+
+import subprocess
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.utils import batch_exec
+
+
+class LocalHost:
+    """Host running the commands locally, counting the executions"""
+
+    def __init__(self):
+        self.executions = 0
+
+    def execute(self, command, timeout=None):
+        self.executions += 1
+        proc = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=timeout)
+        return Result(status=proc.returncode, stdout=proc.stdout, stderr=proc.stderr)
+
+
+def test_execute_many():
+    host = LocalHost()
+    first, second, third = batch_exec.execute_many(
+        host,
+        [
+            "printf 'no newline'",
+            "echo 'it''s' multi; echo line; echo error >&2; exit 3",
+            'cat',  # stdin is closed
+        ],
+    )
+    assert host.executions == 1
+    assert (first.status, first.stdout, first.stderr) == (0, 'no newline', '')
+    assert (second.status, second.stdout, second.stderr) == (3, 'its multi\nline\n', 'error\n')
+    assert (third.status, third.stdout) == (0, '')
+
+
+def test_execute_many_stop_on_error():
+    results = batch_exec.execute_many(LocalHost(), ['false', 'echo skipped'], stop_on_error=True)
+    assert [result.status for result in results] == [1]
+
+
+def test_parse_output_failed_script():
+    with pytest.raises(RuntimeError, match='status 1'):
+        batch_exec.parse_output(Result(status=1, stdout='', stderr='mktemp failed'), 'token')
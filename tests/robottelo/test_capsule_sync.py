@@ -0,0 +1,92 @@
+"""Tests for module ``robottelo.host_helpers.capsule_sync``."""
+
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.capsule_sync import wait_for_capsules_sync
+from robottelo.host_helpers.task_waiter import TaskWaiter
+
+START = datetime(2024, 5, 13, 10, 0, 0, tzinfo=UTC)
+
+
+def timestamp(seconds):
+    return (START + timedelta(seconds=seconds)).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+
+def fake_capsule(hostname, task_ids=(), synced_at=60, failed=()):
+    """A capsule with ``task_ids`` running, or already synced if there are none, which is
+    synced at ``synced_at`` seconds
+    """
+    last_sync_time = timestamp(-3600 if task_ids else synced_at)
+    initial = {
+        'active_sync_tasks': [{'id': task_id} for task_id in task_ids],
+        'last_sync_time': last_sync_time,
+        'last_sync_task': {'ended_at': last_sync_time},
+        'last_failed_sync_tasks': [],
+    }
+    updated = {
+        'active_sync_tasks': [],
+        'last_sync_time': timestamp(synced_at),
+        'last_sync_task': {'ended_at': timestamp(synced_at)},
+        'last_failed_sync_tasks': [{'id': task_id} for task_id in failed],
+    }
+    capsule = mock.Mock(hostname=hostname)
+    capsule.nailgun_capsule.content_get_sync.side_effect = [initial, updated]
+    return capsule
+
+
+@pytest.fixture
+def satellite():
+    """Satellite whose foreman tasks are finished, task 202 failed"""
+    searches = []
+
+    def search(query):
+        searches.append(query['search'])
+        return [
+            mock.Mock(
+                id=task_id,
+                label='Actions::Katello::CapsuleContent::Sync',
+                state='stopped',
+                result='warning' if task_id == 202 else 'success',
+            )
+            for task_id in (101, 202)
+            if str(task_id) in query['search']
+        ]
+
+    satellite = mock.Mock(hostname='sat.example.com', searches=searches)
+    satellite.api.ForemanTask.return_value.search.side_effect = search
+    satellite.task_waiter = TaskWaiter(satellite, min_delay=0.01, max_delay=0.01)
+    return satellite
+
+
+def test_capsules_share_task_search(satellite):
+    capsules = [fake_capsule('capsule1', [101]), fake_capsule('capsule2', [202], failed=[202])]
+    report = wait_for_capsules_sync(satellite, capsules, start_time=START, must_succeed=False)
+    assert report['capsule1'].ok
+    assert [task.id for task in report['capsule1'].tasks] == [101]
+    assert report['capsule2'].problems == [
+        'Sync task 202 (Actions::Katello::CapsuleContent::Sync) finished with result warning.',
+        'Failed sync tasks: [202].',
+    ]
+    # both capsules were checked by the same search
+    assert len(satellite.searches) == 1
+    assert '101' in satellite.searches[0]
+    assert '202' in satellite.searches[0]
+
+
+def test_capsules_sync_report(satellite):
+    capsules = [
+        fake_capsule('capsule1', synced_at=0),
+        fake_capsule('capsule2', synced_at=-3600),
+        fake_capsule('capsule3', [101], synced_at=900),
+    ]
+    with pytest.raises(AssertionError) as error:
+        wait_for_capsules_sync(satellite, capsules, start_time=START)
+    message = str(error.value)
+    # the recently synced capsule passes, the others are all reported
+    assert 'capsule1' not in message
+    assert 'capsule2: No active or recent sync found' in message
+    assert 'capsule3: `last_sync_time`' in message
+    assert 'exceeded timeout (600s)' in message
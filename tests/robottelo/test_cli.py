@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from robottelo.cli import hammer_shell
 from robottelo.cli.base import Base
 from robottelo.exceptions import (
     CLIBaseError,
@@ -218,6 +219,55 @@ class BaseCliTestCase(unittest.TestCase):
         construct.assert_called_once_with({})
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
 
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_without_fetch(self, construct, execute, info):
+        """Check command create does not read the new record with fetch none"""
+        execute.return_value = [{'id': 'foo', 'name': 'bar'}]
+        Base.command_requires_org = False
+        assert execute.return_value == Base.create(fetch='none')
+        assert not info.called
+
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_lazy(self, construct, execute, info):
+        """Check command create reads the new record on first access to a missing field"""
+        execute.return_value = [{'id': 'foo', 'name': 'bar'}]
+        info.return_value = {'id': 'foo', 'name': 'bar', 'label': 'baz'}
+        Base.command_requires_org = True
+        result = Base.create({'organization-id': 'org-id'}, fetch='lazy')
+        assert result.name == 'bar'
+        assert not info.called
+        assert result.label == 'baz'
+        info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
+
+    @mock.patch('robottelo.cli.base.time.sleep')
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_org_not_ready(self, construct, execute, info, sleep):
+        """Check a new organization is read again until it is ready"""
+        execute.return_value = [{'id': 'foo'}]
+        info.side_effect = [CLIReturnCodeError(1, 'not found', 'msg'), {'id': 'foo'}]
+        Base.command_requires_org = False
+        Base.command_base = 'organization'
+        try:
+            assert Base.create() == {'id': 'foo'}
+        finally:
+            Base.command_base = None
+        assert info.call_count == 2
+        sleep.assert_called_once_with(0.5)
+
+    def test_isolated(self):
+        """Check the command state of an isolated class is not shared"""
+        Base.command_sub = 'info'
+        isolated = Base.isolated()
+        isolated.command_sub = 'create'
+        assert issubclass(isolated, Base)
+        assert Base.command_sub == 'info'
+
     def assert_cmd_execution(
         self, construct, execute, base_method, cmd_sub, ignore_stderr=False, **base_method_kwargs
     ):
@@ -285,12 +335,71 @@ class BaseCliTestCase(unittest.TestCase):
         handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
         assert response is handle_resp.return_value
 
+    @mock.patch('robottelo.cli.base.hammer_shell.get_shell')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_in_batch(self, settings, command, get_shell):
+        """Check commands in a batch go through the hammer server and keep error mapping"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        shell_execute = get_shell.return_value.execute
+        shell_execute.return_value = mock.Mock(status=0, stdout='ID,Name\n1,org\n', stderr='')
+        with Base.batch():
+            response = Base.execute('some_cmd', hostname='sat.example.com', output_format='csv')
+            shell_execute.return_value = mock.Mock(
+                status=65, stdout='', stderr='ERROR: INSERT INTO "hosts" failed'
+            )
+            with pytest.raises(CLIDataBaseError):
+                Base.execute('some_cmd', hostname='sat.example.com')
+        get_shell.assert_called_with('sat.example.com')
+        assert shell_execute.call_args_list[0] == mock.call(
+            '-v -u admin -p password --output=csv some_cmd', 'en_US', timeout=None
+        )
+        assert response == [{'id': '1', 'name': 'org'}]
+        command.assert_not_called()
+        Base.execute('some_cmd')
+        command.assert_called_once()
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    def test_sm_execute(self, command):
+        """Check satellite-maintain commands reconnect like the other ssh commands"""
+        assert Base.sm_execute('health check', hostname='sat.example.com', timeout=60) is (
+            command.return_value
+        )
+        command.assert_called_once_with(
+            ' satellite-maintain health check', hostname='sat.example.com', timeout=60
+        )
+
+    @mock.patch('robottelo.cli.hammer_shell.ssh.command')
+    def test_hammer_shell_connection_lost(self, command):
+        """Check a lost connection to the hammer server restarts it instead of failing"""
+        ok = mock.Mock(status=0, stdout='', stderr='')
+        answer = mock.Mock(status=0, stdout='{"status": 0, "stdout": "ok", "stderr": ""}')
+        command.side_effect = [ok, EOFError('connection closed'), ok, ok, answer]
+        shell = hammer_shell.HammerShell('sat.example.com')
+        assert shell.execute('ping', 'en_US').stdout == 'ok'
+        assert command.call_count == 5
+        assert all(call.kwargs['hostname'] == 'sat.example.com' for call in command.call_args_list)
+
+    def test_batch_decorator(self):
+        """Check a function decorated with batch runs in a batch on every call"""
+
+        @Base.batch()
+        def batched():
+            return hammer_shell.batch_active()
+
+        assert batched()
+        assert batched()
+        assert not hammer_shell.batch_active()
+
     @mock.patch('robottelo.cli.base.Base.list')
     def test_exists_without_option_and_empty_return(self, lst_method):
         """Check exists method without options and empty return"""
         lst_method.return_value = []
         response = Base.exists(search=['id', 1])
-        lst_method.assert_called_once_with({'search': 'id=\\"1\\"'})
+        lst_method.assert_called_once_with({'search': 'id=\\"1\\"', 'per-page': 1, 'page': 1})
         assert response == []
 
     @mock.patch('robottelo.cli.base.Base.list')
@@ -299,9 +408,20 @@ class BaseCliTestCase(unittest.TestCase):
         lst_method.return_value = [1, 2]
         my_options = {'search': 'foo=bar'}
         response = Base.exists(my_options, search=['id', 1])
-        lst_method.assert_called_once_with(my_options)
+        lst_method.assert_called_once_with({**my_options, 'per-page': 1, 'page': 1})
         assert response == 1
 
+    @mock.patch('robottelo.cli.base.Base.list')
+    def test_iter_list(self, lst_method):
+        """Check iter_list fetches the pages lazily, until one is not full"""
+        lst_method.side_effect = [[1, 2], [3, 4], [5]]
+        rows = Base.iter_list({'search': 'foo=bar'}, per_page=2)
+        assert next(rows) == 1
+        lst_method.assert_called_once_with({'search': 'foo=bar', 'per-page': 2, 'page': 1})
+        assert list(rows) == [2, 3, 4, 5]
+        assert lst_method.call_count == 3
+        lst_method.assert_called_with({'search': 'foo=bar', 'per-page': 2, 'page': 3})
+
     @mock.patch('robottelo.cli.base.Base.command_requires_org')
     def test_info_requires_organization_id(self, _):  # noqa: PT019 - not a fixture
         """Check info raises CLIError with organization-id is not present in
@@ -0,0 +1,74 @@
+"""Tests for module ``robottelo.host_helpers.cli_factory``."""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.base import Base
+from robottelo.host_helpers.cli_factory import CLIFactory
+
+
+class Subnet(Base):
+    command_base = 'subnet'
+
+
+@pytest.fixture
+def commands():
+    """Hammer commands run, ``subnet create`` answers with the id and name only"""
+    commands = []
+    lock = threading.Lock()
+
+    def execute(command, output_format=None, **kwargs):
+        with lock:
+            commands.append(command.split()[:2])
+            obj_id = str(len(commands))
+        if command.startswith('subnet create'):
+            return [{'message': 'Subnet created.', 'id': obj_id, 'name': f'subnet-{obj_id}'}]
+        return f'Id: {obj_id}\nName: subnet\nNetwork Addr: 10.0.0.0\n'
+
+    with mock.patch.object(Base, 'execute', side_effect=execute):
+        yield commands
+
+
+@pytest.fixture
+def factory():
+    satellite = mock.Mock()
+    satellite.cli.entity_names.return_value = ['Subnet']
+    satellite.cli.Subnet = Subnet
+    with mock.patch('robottelo.host_helpers.cli_factory.initiate_repo_helpers', return_value={}):
+        yield CLIFactory(satellite)
+
+
+def test_make_many_skips_info(factory, commands):
+    subnets = factory.make_many('subnet', 3, {'description': 'x'}, fields=['id', 'name'])
+    assert len(subnets) == 3
+    assert all(subnet.name.startswith('subnet-') for subnet in subnets)
+    assert commands == [['subnet', 'create']] * 3
+
+
+def test_make_many_reads_missing_fields(factory, commands):
+    subnets = factory.make_many(
+        'subnet', 2, [{'name': 'a'}, {'name': 'b'}], fields=['network-addr']
+    )
+    assert [subnet['network-addr'] for subnet in subnets] == ['10.0.0.0'] * 2
+    assert sorted(commands) == [['subnet', 'create']] * 2 + [['subnet', 'info']] * 2
+
+
+def test_make_eager_record(factory, commands):
+    subnet = factory.make_subnet({'name': 'a'})
+    assert commands == [['subnet', 'create'], ['subnet', 'info']]
+    assert subnet == {'id': '2', 'name': 'subnet', 'network-addr': '10.0.0.0'}
+
+
+def test_make_lazy_record(factory, commands):
+    subnet = factory.make_subnet({'name': 'a'}, fetch='lazy')
+    assert subnet.id == '1'
+    assert commands == [['subnet', 'create']]
+    # a field missing from the create output is read once, on first access
+    assert subnet['network-addr'] == '10.0.0.0'
+    assert subnet.get('gateway') is None
+    assert commands == [['subnet', 'create'], ['subnet', 'info']]
+    # the whole record was read, as with an eager fetch, without the create message
+    assert subnet == {'id': '2', 'name': 'subnet', 'network-addr': '10.0.0.0'}
+    assert 'message' not in subnet
@@ -0,0 +1,24 @@
+"""Tests for the test collection filtering helpers"""
+
+from unittest import mock
+
+from robottelo.utils.collection import filter_items, split_items
+
+
+def test_split_items():
+    items = list(range(10))
+    evens = set(range(0, 10, 2))
+    assert split_items(items, evens.__contains__) == ([0, 2, 4, 6, 8], [1, 3, 5, 7, 9])
+
+
+def test_filter_items():
+    config = mock.Mock()
+    items = ['test_a', 'test_b', 'test_c']
+    filter_items(items, config, {'test_c', 'test_a'}.__contains__)
+    assert items == ['test_a', 'test_c']
+    config.hook.pytest_deselected.assert_called_once_with(items=['test_b'])
+    # nothing deselected, nothing reported
+    config.reset_mock()
+    filter_items(items, config, lambda item: True)
+    assert items == ['test_a', 'test_c']
+    config.hook.pytest_deselected.assert_not_called()
@@ -0,0 +1,35 @@
+"""Tests for the lazily loaded constants of robottelo.constants"""
+
+import subprocess
+import sys
+
+import pytest
+
+from robottelo import constants
+
+
+def test_import_is_lazy():
+    """Importing the constants must not load the lazy submodules or nailgun"""
+    code = (
+        'import sys, robottelo.constants; '
+        'print(sorted(m for m in sys.modules if m.startswith(("nailgun", "robottelo.constants."))))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == '[]'
+
+
+def test_lazy_constants():
+    from robottelo.constants import PERMISSIONS, RH_SAT_ROLES, DataFile
+
+    assert constants.PERMISSIONS is PERMISSIONS
+    assert 'access_dashboard' in PERMISSIONS[None]
+    assert 'activation_keys' in RH_SAT_ROLES
+    assert DataFile.RPM_TO_UPLOAD.name == constants.RPM_TO_UPLOAD
+    assert {'PERMISSIONS', 'DataFile', 'OPERATING_SYSTEMS'} <= set(dir(constants))
+
+
+def test_unknown_constant():
+    with pytest.raises(AttributeError, match='NOT_A_CONSTANT'):
+        constants.NOT_A_CONSTANT  # noqa: B018
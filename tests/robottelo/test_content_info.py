@@ -0,0 +1,91 @@
+"""Tests for the repository inspection helpers"""
+
+import functools
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+import pytest
+
+from robottelo import content_info
+
+REPOMD = '''<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>1718000000</revision>
+  <data type="primary">
+    <checksum type="sha256">abc</checksum>
+    <location href="repodata/abc-primary.xml.gz"/>
+    <size>123</size>
+  </data>
+</repomd>
+'''
+
+PACKAGE = '''<package type="rpm">
+  <name>{name}</name>
+  <arch>noarch</arch>
+  <version epoch="0" ver="1.0" rel="1"/>
+  <checksum type="sha256" pkgid="YES">{name}-sum</checksum>
+  <size package="{size}" installed="1" archive="1"/>
+  <location href="Packages/{letter}/{name}-1.0-1.noarch.rpm"/>
+</package>
+'''
+
+PRIMARY = '''<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" packages="2">
+{packages}</metadata>
+'''
+
+PACKAGES = ['walrus', 'bear']
+
+
+@pytest.fixture
+def repo_url(tmp_path):
+    repodata = tmp_path / 'repo' / 'repodata'
+    repodata.mkdir(parents=True)
+    repodata.joinpath('repomd.xml').write_text(REPOMD)
+    packages = ''.join(
+        PACKAGE.format(name=name, letter=name[0], size=i * 100)
+        for i, name in enumerate(PACKAGES, 1)
+    )
+    repodata.joinpath('abc-primary.xml.gz').write_bytes(
+        gzip.compress(PRIMARY.format(packages=packages).encode())
+    )
+    for name in PACKAGES:
+        package_dir = tmp_path / 'repo' / 'Packages' / name[0]
+        package_dir.mkdir(parents=True)
+        package_dir.joinpath(f'{name}-1.0-1.noarch.rpm').write_text(name)
+    tmp_path.joinpath('files').mkdir()
+    tmp_path.joinpath('files', 'image.iso').write_text('iso')
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=tmp_path)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+
+
+def test_iter_repo_packages(repo_url):
+    packages = list(content_info.iter_repo_packages(f'{repo_url}repo'))
+    assert [package['name'] for package in packages] == PACKAGES
+    assert packages[1]['url'] == f'{repo_url}repo/Packages/b/bear-1.0-1.noarch.rpm'
+    assert packages[1]['checksum'] == 'bear-sum'
+    assert packages[1]['size'] == 200
+    assert content_info.get_repomd_revision(f'{repo_url}repo') == '1718000000'
+
+
+def test_get_repo_files_by_url(repo_url):
+    expected = ['bear-1.0-1.noarch.rpm', 'walrus-1.0-1.noarch.rpm']
+    assert content_info.get_repo_files_by_url(f'{repo_url}repo') == expected
+    # same files found by crawling the directory listings
+    crawled = content_info.crawl_repo_files_urls(f'{repo_url}repo')
+    assert crawled == content_info.get_repo_files_urls_by_url(f'{repo_url}repo')
+    # repositories without metadata are crawled
+    assert content_info.get_repo_files_by_url(f'{repo_url}files', extension='iso') == ['image.iso']
+
+
+@pytest.mark.parametrize('primary', [b'not gzip', gzip.compress(b'<metadata>')[:10] + b'\xff' * 4])
+def test_corrupted_metadata_crawled(repo_url, tmp_path, primary):
+    # a mangled primary file falls back to crawling the directory listings
+    Path(tmp_path, 'repo', 'repodata', 'abc-primary.xml.gz').write_bytes(primary)
+    expected = ['bear-1.0-1.noarch.rpm', 'walrus-1.0-1.noarch.rpm']
+    assert content_info.get_repo_files_by_url(f'{repo_url}repo') == expected
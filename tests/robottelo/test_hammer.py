@@ -23,6 +23,14 @@ class TestParseCSV:
             {'header': 'unicode', 'header-2': 'chårs'},
         ]
 
+    def test_parse_csv_uneven_rows(self):
+        """Rows with missing or extra values are parsed as csv.DictReader does"""
+        output_lines = '\n'.join(['Id,Name,Status', '1,host1', '', '2,host2,OK,extra'])
+        assert hammer.parse_csv(output_lines) == [
+            {'id': '1', 'name': 'host1', 'status': None},
+            {'id': '2', 'name': 'host2', 'status': 'OK', None: ['extra']},
+        ]
+
 
 class TestParseJSON:
     """Tests for parsing JSON hammer output"""
@@ -82,6 +90,14 @@ class TestParseJSON:
             'name': 'Default Organization View',
         }
 
+    def test_parse_json_nested(self):
+        """Keys of nested objects are normalized and integers converted at any depth"""
+        output = '{"Host Count": 10, "Items": [{"Sub Id": 1, "Enabled": true, "Ratio": 0.5}]}'
+        assert hammer.parse_json(output) == {
+            'host-count': '10',
+            'items': [{'sub-id': '1', 'enabled': True, 'ratio': 0.5}],
+        }
+
     def test_parsed_json_match_parsed_csv(self):
         """Output generated by:
         JSON:
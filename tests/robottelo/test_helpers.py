@@ -2,7 +2,7 @@
 
 import pytest
 
-from robottelo.utils import slugify_component, validate_ssh_pub_key
+from robottelo.utils import file_lock, slugify_component, validate_ssh_pub_key, write_atomic
 
 
 class FakeSSHResult:
@@ -69,3 +69,27 @@ def test_slugify_component():
     assert slugify_component('File-Management', False) == 'file_management'
     assert slugify_component('File&Management') == 'filemanagement'
     assert slugify_component('File and Management') == 'filemanagement'
+
+
+def test_file_lock(tmp_path):
+    lock = tmp_path / 'store.lock'
+    # shared locks are held together, they exclude an exclusive one
+    with (
+        file_lock(lock, shared=True),
+        file_lock(lock, shared=True, timeout=0),
+        pytest.raises(TimeoutError),
+        file_lock(lock, timeout=0.1),
+    ):
+        pass
+    with (
+        file_lock(lock, timeout=0),
+        pytest.raises(TimeoutError),
+        file_lock(lock, shared=True, timeout=0.1),
+    ):
+        pass
+
+
+def test_write_atomic(tmp_path):
+    write_atomic(tmp_path / 'store.json', '{}')
+    assert (tmp_path / 'store.json').read_text() == '{}'
+    assert [path.name for path in tmp_path.iterdir()] == ['store.json']
@@ -0,0 +1,87 @@
+"""Tests for the session cache of Satellite host facts"""
+
+import sys
+from unittest import mock
+
+from box import Box
+import pytest
+
+from robottelo.utils import host_facts
+
+FACTS = {'rhel_version': '9.6', 'sat_version': '6.19.0', 'fips': False}
+
+
+@pytest.fixture
+def facts_settings(tmp_path, monkeypatch):
+    settings = Box(
+        server={'hostname': 'sat.example.com'},
+        robottelo={
+            'host_facts': {
+                'cache_file': str(tmp_path / 'host_facts.json'),
+                'ttl': 0,
+                'offline': False,
+            }
+        },
+    )
+    monkeypatch.setattr(host_facts, 'settings', settings)
+    monkeypatch.setattr(host_facts, '_facts', {})
+    monkeypatch.setattr(host_facts, '_offline', False)
+    monkeypatch.setenv('PYTEST_XDIST_TESTRUNUID', 'run-1')
+    return settings
+
+
+def new_worker(monkeypatch):
+    """Forget the facts known by this process, as if another worker was asking"""
+    monkeypatch.setattr(host_facts, '_facts', {})
+
+
+def test_facts_read_once_per_session(facts_settings, monkeypatch):
+    with mock.patch.object(host_facts, '_fetch', return_value=FACTS) as fetch:
+        assert host_facts.get_host_facts() == FACTS
+        new_worker(monkeypatch)
+        assert host_facts.get_host_facts('sat.example.com') == FACTS
+        assert fetch.call_count == 1
+        # a new session reads the facts again
+        new_worker(monkeypatch)
+        monkeypatch.setenv('PYTEST_XDIST_TESTRUNUID', 'run-2')
+        assert host_facts.get_host_facts() == FACTS
+        assert fetch.call_count == 2
+
+
+def test_unreachable_satellite_cached(facts_settings, monkeypatch):
+    with mock.patch.object(host_facts, '_fetch', return_value={}) as fetch:
+        assert host_facts.get_host_facts() == {}
+        new_worker(monkeypatch)
+        assert host_facts.get_host_facts() == {}
+        assert fetch.call_count == 1
+
+
+def test_offline(facts_settings, monkeypatch):
+    host_facts.set_offline()
+    with mock.patch.object(host_facts, '_fetch', return_value=FACTS) as fetch:
+        assert host_facts.get_host_facts() == {}
+        # facts cached by an earlier session are used in offline mode
+        monkeypatch.setattr(host_facts, '_offline', False)
+        new_worker(monkeypatch)
+        host_facts.get_host_facts()
+        new_worker(monkeypatch)
+        monkeypatch.setenv('PYTEST_XDIST_TESTRUNUID', 'run-2')
+        facts_settings.robottelo.host_facts.offline = True
+        assert host_facts.get_host_facts() == FACTS
+        assert fetch.call_count == 1
+
+
+def test_failed_fact_left_out():
+    satellite = mock.Mock(os_version='9.6', version='6.19.0')
+    satellite.is_fips_enabled.side_effect = ValueError("invalid literal for int() with base 10: ''")
+    hosts = mock.Mock(Satellite=mock.Mock(return_value=satellite))
+    with mock.patch.dict(sys.modules, {'robottelo.hosts': hosts}):
+        assert host_facts._fetch('sat.example.com') == {
+            'rhel_version': '9.6',
+            'sat_version': '6.19.0',
+        }
+    # an unreachable Satellite is not probed again for the other facts
+    type(satellite).os_version = mock.PropertyMock(side_effect=ConnectionRefusedError)
+    with mock.patch.dict(sys.modules, {'robottelo.hosts': hosts}):
+        assert host_facts._fetch('sat.example.com') == {}
+    satellite.is_fips_enabled.assert_called_once()
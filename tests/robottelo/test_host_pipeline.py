@@ -0,0 +1,76 @@
+"""Tests for the concurrent host checkout and setup pipeline"""
+
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import ContentHostError
+from robottelo.host_helpers import host_pipeline
+from robottelo.host_helpers.host_pipeline import HostPipeline
+
+
+class FakeHost:
+    def __init__(self, name):
+        self.name = name
+        self.torn_down = False
+
+    def wait_for_connection(self, timeout):
+        pass
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        self.torn_down = True
+
+
+@pytest.fixture
+def broker():
+    with mock.patch.object(host_pipeline, 'Broker') as broker:
+        broker.side_effect = lambda **kwargs: mock.Mock(
+            checkout=lambda: FakeHost(kwargs.get('name'))
+        )
+        yield broker
+
+
+def test_pipeline_overlaps_hosts(broker):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def setup(host):
+        # only passes if the three hosts are set up at the same time
+        barrier.wait()
+
+    confs = [{'name': f'host{i}'} for i in range(3)]
+    with HostPipeline(confs, setup=setup, host_class=FakeHost) as hosts:
+        assert [host.name for host in hosts] == ['host0', 'host1', 'host2']
+    assert all(host.torn_down for host in hosts)
+
+
+def test_pipeline_errors(broker):
+    def setup(host):
+        if host.name == 'bad':
+            raise RuntimeError('registration failed')
+
+    pipeline = HostPipeline([{'name': 'good'}, {'name': 'bad'}], setup=setup, host_class=FakeHost)
+    good, bad = pipeline.run()
+    assert good.ok
+    assert (bad.ok, bad.stage, str(bad.error)) == (False, 'setup', 'registration failed')
+    assert pipeline.hosts == [good.host]
+    pipeline.checkin()
+    assert good.host.torn_down
+    assert bad.host.torn_down
+
+    with (
+        pytest.raises(ContentHostError, match='1 of 2 hosts failed: setup: registration failed'),
+        HostPipeline([{'name': 'good'}, {'name': 'bad'}], setup=setup, host_class=FakeHost),
+    ):
+        pass
+
+
+def test_pipeline_skip_context_checkin(broker):
+    with HostPipeline([{'name': 'kept'}, {'name': 'other'}], host_class=FakeHost) as hosts:
+        hosts[0]._skip_context_checkin = True
+    checked_in = [call.kwargs['hosts'] for call in broker.call_args_list if 'hosts' in call.kwargs]
+    assert checked_in == [[hosts[1]]]
+    assert all(host.torn_down for host in hosts)
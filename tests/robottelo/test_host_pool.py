@@ -0,0 +1,104 @@
+"""Tests for the warm pool of content hosts"""
+
+import time
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.host_helpers import host_pool
+from robottelo.host_helpers.host_pool import HostPool
+
+
+class FakeHost:
+    def __init__(self):
+        self.packages = 'base'
+        self.subscribed = False
+        self.checked_in = False
+
+    def execute(self, command):
+        return Result(status=0, stdout=f'{self.packages}-sum  -\n', stderr='')
+
+    def setup(self):
+        pass
+
+    def teardown(self):
+        self.subscribed = False
+
+
+@pytest.fixture
+def broker():
+    with mock.patch.object(host_pool, 'Broker') as broker:
+
+        def new_broker(hosts=None, **kwargs):
+            def checkin():
+                for host in hosts:
+                    host.checked_in = True
+
+            return mock.Mock(checkout=FakeHost, checkin=checkin)
+
+        broker.side_effect = new_broker
+        yield broker
+
+
+def wait_idle(pool, conf, count):
+    for _ in range(100):
+        if len(pool._idle[pool.key(conf)]) == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError('pool was not refilled')
+
+
+def test_recycle_clean_host(broker):
+    conf = {'workflow': 'deploy-rhel', 'deploy_rhel_version': '9'}
+    pool = HostPool(FakeHost, size=1)
+    host = pool.acquire(conf)
+    # a host is checked out in the background for the next test
+    wait_idle(pool, conf, 1)
+    host.subscribed = True
+    pool.release(host, conf)
+    # the pool is full, the released host is checked in
+    assert host.checked_in
+    other = pool.acquire(conf)
+    assert other is not host
+    wait_idle(pool, conf, 1)
+    pool.close()
+    assert not other.checked_in
+    pool.release(other, conf)
+    assert other.checked_in
+
+
+def test_dirty_and_expired_hosts(broker):
+    conf = {'workflow': 'deploy-rhel'}
+    pool = HostPool(FakeHost, size=2, ttl=60)
+    first, second = pool.acquire(conf), pool.acquire(conf)
+    wait_idle(pool, conf, 2)
+    pool.close()
+    pool = HostPool(FakeHost, size=2, ttl=60)
+    pool._fingerprints = {id(first): 'base-sum', id(second): 'base-sum'}
+    second.packages = 'base+httpd'
+    pool.release(first, conf)
+    pool.release(second, conf)
+    assert not first.checked_in
+    assert second.checked_in
+    # a failed test never gives back its host
+    third = FakeHost()
+    pool.release(third, conf, reusable=False)
+    assert third.checked_in
+    # idle hosts expire
+    pool.ttl = 0
+    with mock.patch.object(pool, '_refill'):
+        assert pool.acquire(conf) is not first
+    assert first.checked_in
+
+
+def test_skip_context_checkin(broker):
+    conf = {'workflow': 'deploy-rhel'}
+    pool = HostPool(FakeHost, size=1)
+    with mock.patch.object(pool, '_refill'):
+        host = pool.acquire(conf)
+    host._skip_context_checkin = True
+    pool.release(host, conf)
+    # the host is kept checked out for the tests after the upgrade, outside the pool
+    assert not host.checked_in
+    assert pool._idle[pool.key(conf)] == []
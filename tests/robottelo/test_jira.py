@@ -0,0 +1,125 @@
+"""Tests for the Jira issue fetcher"""
+
+from collections import defaultdict
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.utils.issue_handlers import jira
+from robottelo.utils.issue_handlers.jira import JiraStatusCache, TokenBucket
+
+
+def issue(key, **fields):
+    return {
+        'key': key,
+        'fields': {
+            'summary': key,
+            'status': {'name': 'New'},
+            'labels': [],
+            'resolution': None,
+            'fixVersions': [],
+            **fields,
+        },
+    }
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    # two tokens of burst, then one token every 50ms
+    assert 0.08 < time.monotonic() - start < 1
+    bucket.pause(0.2)
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.2
+
+
+def test_search_jira_pagination():
+    issues = [issue(f'SAT-{i}') for i in range(5)]
+
+    def get_jira(jql, fields=None, start_at=0, max_results=None):
+        # the server caps the page size to 2 issues
+        return mock.Mock(
+            json=lambda: {'issues': issues[start_at : start_at + 2], 'total': len(issues)}
+        )
+
+    with mock.patch.object(jira, 'get_jira', side_effect=get_jira) as get:
+        assert jira.search_jira('jql', page_size=10) == issues
+        assert [call.kwargs['start_at'] for call in get.call_args_list] == [0, 2, 4]
+
+
+def test_fetch_jira_issues_chunks(monkeypatch):
+    monkeypatch.setattr(jira.settings.jira, 'chunk_size', 2)
+    issue_ids = [f'SAT-{i}' for i in range(5)]
+
+    def search_jira(jql, fields=None, page_size=None):
+        return [issue(key.strip()) for key in jql.replace('id = ', '').split(' OR ')]
+
+    with mock.patch.object(jira, 'search_jira', side_effect=search_jira) as search:
+        issues = jira.fetch_jira_issues(issue_ids)
+    assert [item['key'] for item in issues] == issue_ids
+    assert search.call_count == 3
+
+
+def test_collect_dupes_timeout():
+    dupe = {'key': 'SAT-1', 'resolution': 'Duplicate', 'dupe_of': 'SAT-2'}
+    collected_data = defaultdict(dict)
+    with mock.patch.object(jira, 'get_data_jira', side_effect=jira.TimedOutError('timeout')):
+        jira.collect_dupes([dupe], collected_data)
+    assert dupe['dupe_data'] == jira.get_default_jira('SAT-2')
+    assert collected_data['SAT-2']['is_dupe'] is True
+
+
+@pytest.fixture
+def cache_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(jira.settings.jira, 'cache_file', str(tmp_path / 'jira_cache.json'))
+    monkeypatch.setattr(jira.settings.jira, 'cache_ttl_days', 7)
+    monkeypatch.setattr(jira.settings.jira, 'cache_sync_minutes', 60)
+    return tmp_path
+
+
+def test_cache_journal(cache_settings):
+    cache = JiraStatusCache()
+    cache.update('SAT-1', {'key': 'SAT-1', 'status': 'New'})
+    cache.save()
+    # another worker saves its own entries concurrently
+    other = JiraStatusCache()
+    other.update('SAT-2', {'key': 'SAT-2', 'status': 'New'})
+    other.save()
+    cache.update('SAT-1', {'key': 'SAT-1', 'status': 'Closed'})
+    cache.save()
+    loaded = JiraStatusCache()
+    assert loaded.get('SAT-1')['data']['status'] == 'Closed'
+    assert loaded.get('SAT-2')['data']['status'] == 'New'
+
+
+def test_cache_compaction(cache_settings):
+    cache = JiraStatusCache()
+    for i in range(3):
+        cache.update(f'SAT-{i}', {'key': f'SAT-{i}'})
+    # the journal is bigger than the missing snapshot
+    cache.save()
+    assert cache.cache_file.exists()
+    assert not cache.journal_file.exists()
+    assert set(JiraStatusCache().cache) == {'SAT-0', 'SAT-1', 'SAT-2'}
+
+
+def test_cache_sync(cache_settings):
+    cache = JiraStatusCache()
+    cache.update('SAT-1', {'key': 'SAT-1', 'status': 'New'})
+    cache.update('SAT-2', {'key': 'SAT-2', 'status': 'New'})
+    cache.save()
+    cache.cache['SAT-1']['timestamp'] -= 7200
+    with mock.patch.object(
+        jira, 'fetch_jira_issues', return_value=[issue('SAT-1', status={'name': 'Closed'})]
+    ) as fetch:
+        assert cache.sync() == ['SAT-1']
+        assert fetch.call_args.kwargs['jql_filter'] == 'updated >= "-122m"'
+        assert set(fetch.call_args.args[0]) == {'SAT-1', 'SAT-2'}
+        # synced recently, nothing is refreshed
+        assert JiraStatusCache().sync() == []
+        assert fetch.call_count == 1
+    assert JiraStatusCache().get('SAT-1')['data']['status'] == 'Closed'
@@ -0,0 +1,103 @@
+"""Tests for module ``robottelo.utils.manifest_pool``."""
+
+import json
+from pathlib import Path
+import threading
+from unittest import mock
+import zipfile
+
+import pytest
+
+from robottelo.utils.manifest_pool import LocalManifestBackend, ManifestPool
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LocalManifestBackend(tmp_path / 'manifests')
+    with mock.patch.object(backend, 'allocate', wraps=backend.allocate):
+        yield backend
+
+
+@pytest.fixture
+def make_pool(backend, tmp_path):
+    """Pools of the workers of a run, refilled on demand instead of by their thread"""
+    pools = []
+
+    def make_pool(**kwargs):
+        pool = ManifestPool(backend, tmp_path / 'pool.json', **kwargs)
+        pool.start = mock.Mock()
+        pools.append(pool)
+        return pool
+
+    yield make_pool
+    for pool in pools:
+        pool.close()
+
+
+def test_manifest_allocated_on_demand(make_pool, backend):
+    pool = make_pool()
+    with pool.manifest('golden_ticket') as manifest:
+        assert manifest.path.exists()
+        with zipfile.ZipFile(manifest.path) as archive:
+            assert json.loads(archive.read('consumer.json')) == {'uuid': manifest.uuid}
+        assert manifest.content == manifest.path.read_bytes()
+    # not recyclable, deleted
+    assert not manifest.path.exists()
+    assert backend.allocate.call_count == 1
+
+
+def test_manifests_shared_by_workers(make_pool, backend):
+    pool, other_worker = make_pool(size=2), make_pool(size=2)
+    pool._refill('golden_ticket')
+    other_worker._refill('golden_ticket')
+    assert backend.allocate.call_count == 2
+    with other_worker.manifest('golden_ticket'), pool.manifest('golden_ticket'):
+        assert backend.allocate.call_count == 2
+    other_worker._refill('golden_ticket')
+    pool.close()
+    assert len(list(backend.directory.iterdir())) == 2
+    # the manifests left in the pool are deleted by the last worker
+    other_worker.close()
+    assert list(backend.directory.iterdir()) == []
+
+
+def test_recycle(make_pool, backend):
+    pool = make_pool(recycle=True)
+    with pool.manifest('golden_ticket') as manifest:
+        assert manifest.recycle is True
+        manifest.recyclable = True
+    with pool.manifest('golden_ticket') as recycled:
+        assert recycled.uuid == manifest.uuid
+    assert backend.allocate.call_count == 1
+    assert not recycled.path.exists()
+
+
+def test_lease_of_dead_process_deleted(make_pool, backend, tmp_path):
+    record = backend.allocate('golden_ticket')
+    entry = {'available': [], 'leased': {record['uuid']: {'pid': 2**22 + 1, 'record': record}}}
+    (tmp_path / 'pool.json').write_text(
+        json.dumps({'workers': [], 'categories': {'golden_ticket': {**entry, 'allocating': []}}})
+    )
+    make_pool()
+    assert not Path(record['path']).exists()
+
+
+def test_state_shared_by_threads(make_pool, backend):
+    pool = make_pool(size=4)
+
+    def lease():
+        with pool.manifest('golden_ticket'):
+            pass
+
+    threads = [threading.Thread(target=pool._refill, args=('golden_ticket',))]
+    threads += [threading.Thread(target=lease) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with pool._state() as state:
+        entry = state['categories']['golden_ticket']
+    # no update of the pool was lost, every allocated manifest is accounted for
+    assert entry['leased'] == {}
+    assert entry['allocating'] == []
+    assert len(entry['available']) + 4 == backend.allocate.call_count
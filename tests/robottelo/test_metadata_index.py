@@ -0,0 +1,116 @@
+"""Tests for the test module metadata index"""
+
+import importlib.util
+import os
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import metadata_index
+from robottelo.utils.metadata_index import MetadataIndex
+
+TEST_MODULE = '''"""Test module
+
+:CaseComponent: Repositories
+
+:Team: Phoenix-content
+"""
+
+
+def is_open(issue):
+    return True
+
+
+if is_open('BZ:1'):
+    pass
+
+
+class TestRepo:
+    """Repository tests
+
+    :CaseImportance: High
+    """
+
+    @pytest.mark.e2e
+    def test_sync(self):
+        """Sync a repository
+
+        :Verifies: SAT-2, SAT-3
+
+        :BlockedBy: SAT-4
+        """
+        if not is_open('BZ:5'):
+            pass
+
+
+def test_no_docstring():
+    pass
+'''
+
+
+@pytest.fixture
+def test_module(tmp_path):
+    path = tmp_path / 'test_module.py'
+    path.write_text(TEST_MODULE.replace('@pytest.mark.e2e', '@staticmethod'))
+    spec = importlib.util.spec_from_file_location('test_module', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_source():
+    entry = metadata_index.parse_source(TEST_MODULE)
+    assert entry['module']['tokens'] == {
+        'component': 'Repositories',
+        'importance': None,
+        'team': 'Phoenix-content',
+        'blocked_by': None,
+        'verifies': None,
+    }
+    assert entry['module']['component'] == 'Repositories'
+    assert entry['module']['is_open'] == [('BZ', '1')]
+    assert entry['classes']['TestRepo']['importance'] == 'High'
+    test_sync = entry['functions']['TestRepo.test_sync']
+    assert test_sync['tokens']['verifies'] == ['SAT-2', 'SAT-3']
+    assert test_sync['tokens']['blocked_by'] == ['SAT-4']
+    assert test_sync['is_open'] == []
+    assert test_sync['not_is_open'] == [('BZ', '5')]
+    assert entry['functions']['test_no_docstring']['tokens'] is None
+
+
+def test_lookup(test_module):
+    index = MetadataIndex()
+    assert index.tokens(test_module)['team'] == 'Phoenix-content'
+    assert index.tokens(test_module.TestRepo)['importance'] == 'High'
+    assert index.tokens(test_module.TestRepo.test_sync)['blocked_by'] == ['SAT-4']
+    assert index.tokens(test_module.test_no_docstring) is None
+    assert index.tokens(None) is None
+    assert index.function_usages(test_module.TestRepo.test_sync) == ([], [('BZ', '5')])
+    assert index.module_usages(test_module) == ('Repositories', [('BZ', '1')], [('BZ', '5')])
+
+
+def test_persisted_index(tmp_path, test_module):
+    cache_file = tmp_path / 'index.json'
+    index = MetadataIndex(cache_file)
+    index.tokens(test_module)
+    index.save()
+    assert cache_file.exists()
+
+    with mock.patch.object(
+        metadata_index, 'parse_source', wraps=metadata_index.parse_source
+    ) as parse_source:
+        # unchanged module, nothing is parsed
+        index = MetadataIndex(cache_file)
+        assert index.tokens(test_module.TestRepo)['importance'] == 'High'
+        assert index.module_usages(test_module) == ('Repositories', [['BZ', '1']], [['BZ', '5']])
+        # touched but unchanged module, the content hash matches
+        os.utime(test_module.__file__, ns=(0, 0))
+        index = MetadataIndex(cache_file)
+        index.tokens(test_module)
+        assert not parse_source.called
+        # modified module
+        with open(test_module.__file__, 'a') as module_file:
+            module_file.write('\n# comment\n')
+        index = MetadataIndex(cache_file)
+        index.tokens(test_module)
+        assert parse_source.call_count == 1
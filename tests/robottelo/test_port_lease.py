@@ -0,0 +1,73 @@
+"""Tests for module ``robottelo.host_helpers.port_lease``."""
+
+import json
+import threading
+from unittest import mock
+
+from broker.helpers import Result
+import pytest
+
+from robottelo.cli.proxy import CapsuleTunnelError
+from robottelo.host_helpers.port_lease import PortLeases, parse_port_range
+
+
+@pytest.fixture
+def satellite():
+    satellite = mock.Mock(hostname='sat.example.com')
+    satellite.execute.return_value = Result(
+        status=0, stdout='9090\n9091\n9093\nCannot stat file\n', stderr=''
+    )
+    return satellite
+
+
+@pytest.fixture
+def leases(satellite, tmp_path):
+    return PortLeases(satellite, '9090-9095', tmp_path / 'leases.json')
+
+
+def test_parse_port_range():
+    assert parse_port_range('9091-9190') == range(9091, 9190)
+    assert parse_port_range(('1', '3')) == range(1, 3)
+    with pytest.raises(TypeError):
+        parse_port_range(9091)
+
+
+def test_lease_free_ports(leases, satellite):
+    assert leases.available() == [9092, 9094]
+    with leases.lease() as first, leases.lease() as second:
+        assert {first, second} == {9092, 9094}
+        assert leases.available() == []
+        with pytest.raises(CapsuleTunnelError), leases.lease():
+            pass
+    assert leases.available() == [9092, 9094]
+    # a single ss snapshot served all the leases
+    assert satellite.execute.call_count == 1
+
+
+def test_leases_shared_between_workers(leases, satellite, tmp_path):
+    other_worker = PortLeases(satellite, '9090-9095', tmp_path / 'leases.json')
+    port = other_worker.acquire()
+    assert leases.available() == sorted({9092, 9094} - {port})
+    other_worker.release(port)
+    assert leases.available() == [9092, 9094]
+
+
+def test_lease_of_dead_process_ignored(leases, tmp_path):
+    (tmp_path / 'leases.json').write_text(json.dumps({'9092': {'pid': 2**22 + 1, 'time': 0}}))
+    assert leases.available() == [9092, 9094]
+
+
+def test_concurrent_leases_unique(satellite, tmp_path):
+    workers = [PortLeases(satellite, '9000-9100', tmp_path / 'leases.json') for _ in range(2)]
+    ports = []
+
+    def acquire(worker):
+        ports.extend(worker.acquire() for _ in range(10))
+
+    threads = [threading.Thread(target=acquire, args=(worker,)) for worker in workers * 2]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(ports)) == 40
+    assert len(json.loads((tmp_path / 'leases.json').read_text())) == 40
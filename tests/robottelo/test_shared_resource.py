@@ -1,10 +1,12 @@
 import multiprocessing
 from pathlib import Path
 import random
-from threading import Thread
+from threading import Thread, Timer
 import time
 
-from robottelo.utils.shared_resource import SharedResource
+import pytest
+
+from robottelo.utils.shared_resource import SharedResource, SocketBackend
 
 
 def upgrade_action(*args, **kwargs):
@@ -67,3 +69,57 @@ def test_shared_resource_multithreading():
     t2.join()
 
     assert not Path("/tmp/test_resource_th.shared").exists()
+
+
+def run_resource_backend(resource_name, backend):
+    time.sleep(random.random())
+    with SharedResource(resource_name, upgrade_action, backend=backend) as resource:
+        assert resource.backend.exists()
+        resource.ready()
+
+
+@pytest.mark.parametrize('backend', ['file', 'socket'])
+def test_shared_resource_backends(backend):
+    """Test the SharedResource class with every local backend."""
+    threads = [
+        Thread(target=run_resource_backend, args=(f"test_resource_{backend}", backend))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not SharedResource(
+        f"test_resource_{backend}", upgrade_action, backend=backend
+    ).backend.exists()
+
+
+def test_backend_wait_changed():
+    """Waiting for a change returns as soon as the state is updated."""
+    backend = SocketBackend("test_resource_wait")
+    backend.update(lambda state: {"count": 0})
+    state, version = backend.read()
+    Timer(0.5, backend.update, args=(lambda state: {"count": 1},)).start()
+    start = time.monotonic()
+    backend.wait_changed(version, timeout=30)
+    assert time.monotonic() - start < 10
+    assert backend.read() == ({"count": 1}, version + 1)
+    backend.delete()
+    with pytest.raises(FileNotFoundError):
+        backend.read()
+
+
+def test_socket_backend_server_handoff():
+    """The state outlives the process serving it, clients must know the key of the run."""
+    backend = SocketBackend("test_resource_handoff")
+    backend.update(lambda state: {"count": 1})
+    # the serving process exits, the next call serves the persisted state again
+    backend.server.close()
+    other = SocketBackend("test_resource_handoff")
+    assert other.read() == ({"count": 1}, 1)
+    assert other.server is not None
+    other.authkey = b"not the key of the run"
+    with pytest.raises(multiprocessing.AuthenticationError):
+        other.read()
+    backend.delete()
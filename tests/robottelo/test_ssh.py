@@ -1,7 +1,10 @@
 """Tests for module ``robottelo.utils.ssh``."""
 
+import threading
 from unittest import mock
 
+import pytest
+
 from robottelo import ssh
 
 
@@ -102,3 +105,84 @@ class TestSSH:
 
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+    def test_command_retried_before_send(self):
+        stale, fresh = mock.Mock(_session=None), mock.Mock(_session=None)
+        stale.connect.side_effect = ConnectionResetError
+        with (
+            mock.patch.object(ssh, 'get_client', side_effect=[stale, fresh]),
+            mock.patch.object(ssh._pool, 'discard', return_value=True) as discard,
+        ):
+            assert ssh.command('ls').stdout is fresh.execute.return_value.stdout
+        discard.assert_called_once_with(stale)
+        stale.execute.assert_not_called()
+
+    def test_command_not_retried_after_send(self):
+        client = mock.Mock(_session=object())
+        client.execute.side_effect = EOFError
+        with (
+            mock.patch.object(ssh, 'get_client', return_value=client) as get_client,
+            mock.patch.object(ssh._pool, 'discard', return_value=True) as discard,
+            pytest.raises(EOFError),
+        ):
+            ssh.command('yum -y install foo')
+        # the broken client is dropped, but the command is not run twice
+        assert get_client.call_count == 1
+        client.execute.assert_called_once()
+        discard.assert_called_once_with(client)
+
+
+class TestSSHClientPool:
+    """Tests for ``robottelo.ssh.SSHClientPool``."""
+
+    key = ('example.com', 'root', 'secret', 22, 'ipv4')
+
+    def test_acquire_reuses_client(self):
+        pool = ssh.SSHClientPool()
+        client = pool.acquire(self.key, MockSSHClient)
+        assert pool.acquire(self.key, MockSSHClient) is client
+        assert (
+            pool.acquire(('other.com', 'root', 'secret', 22, 'ipv4'), MockSSHClient) is not client
+        )
+        assert len(pool) == 2
+
+    def test_idle_client_evicted(self):
+        pool = ssh.SSHClientPool(idle_timeout=0)
+        client = pool.acquire(self.key, MockSSHClient)
+        pool.evict_idle()
+        assert len(pool) == 0
+        assert client.close_ == 1
+        assert pool.acquire(self.key, MockSSHClient) is not client
+
+    def test_unhealthy_client_replaced(self):
+        pool = ssh.SSHClientPool(health_check_interval=0)
+        client = pool.acquire(self.key, MockSSHClient)
+        client._session = object()
+        client.execute = mock.Mock(side_effect=ConnectionResetError)
+        assert pool.acquire(self.key, MockSSHClient) is not client
+        assert client.close_ == 1
+
+    def test_health_checked_since_last_success(self):
+        pool = ssh.SSHClientPool(health_check_interval=60)
+        client = pool.acquire(self.key, MockSSHClient)
+        client._session = object()
+        client.execute = mock.Mock(side_effect=ConnectionResetError)
+        # acquired again right away, but no command went through for longer than the interval
+        pool._clients[(*self.key, threading.get_ident())].last_ok -= 61
+        assert pool.acquire(self.key, MockSSHClient) is not client
+        other = pool.acquire(self.key, MockSSHClient)
+        pool.succeeded(other)
+        assert pool.acquire(self.key, MockSSHClient) is other
+
+    def test_password_in_key(self):
+        pool = ssh.SSHClientPool()
+        client = pool.acquire(self.key, MockSSHClient)
+        other_key = ('example.com', 'root', 'other', 22, 'ipv4')
+        assert pool.acquire(other_key, MockSSHClient) is not client
+
+    def test_discard(self):
+        pool = ssh.SSHClientPool()
+        client = pool.acquire(self.key, MockSSHClient)
+        assert pool.discard(client)
+        assert not pool.discard(client)
+        assert client.close_ == 1
@@ -0,0 +1,107 @@
+"""Tests for module ``robottelo.host_helpers.task_waiter``."""
+
+import threading
+import time
+from unittest import mock
+
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+import pytest
+
+from robottelo.host_helpers.task_waiter import TaskWaiter
+
+
+class FakeTasks:
+    """Foreman tasks finishing after a given number of searches"""
+
+    def __init__(self, searches_left, results=None):
+        self.searches_left = searches_left
+        self.results = results or {}
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def search(self, query):
+        with self.lock:
+            self.queries.append(query['search'])
+            tasks = []
+            for task_id, left in self.searches_left.items():
+                if task_id not in query['search']:
+                    continue
+                self.searches_left[task_id] = left - 1
+                tasks.append(
+                    mock.Mock(
+                        id=int(task_id),
+                        label='Actions::Test',
+                        state='stopped' if left <= 0 else 'running',
+                        result=self.results.get(task_id, 'success'),
+                    )
+                )
+            return tasks
+
+
+@pytest.fixture
+def fake_tasks():
+    return FakeTasks({'1': 0, '2': 2, '3': 1})
+
+
+@pytest.fixture
+def waiter(fake_tasks):
+    satellite = mock.Mock(hostname='sat.example.com')
+    satellite.api.ForemanTask.return_value = fake_tasks
+    return TaskWaiter(satellite, min_delay=0.01, max_delay=0.05)
+
+
+def test_wait_for_ids(waiter, fake_tasks):
+    tasks = waiter.wait_for_ids([3, 1, 2], timeout=5)
+    assert [task.id for task in tasks] == [1, 2, 3]
+    assert all(task.state == 'stopped' for task in tasks)
+    # a single search checks all pending tasks
+    assert fake_tasks.queries[0] == 'id ^ (1,2,3)'
+
+
+def test_wait_for_many(waiter, fake_tasks):
+    first, second = waiter.wait_for_many([[1, 3], [2]], timeout=5)
+    assert [task.id for task in first] == [1, 3]
+    assert [task.id for task in second] == [2]
+    # the sets are polled by the same searches, the first one may run before [2] is watched
+    assert len(fake_tasks.queries) in (3, 4)
+    assert 'id ^ (3)' not in fake_tasks.queries
+
+
+def test_task_failed(waiter, fake_tasks):
+    fake_tasks.results['3'] = 'error'
+    with pytest.raises(TaskFailedError):
+        waiter.wait_for_ids([3], timeout=5)
+    assert waiter.wait_for_ids([3], timeout=5, must_succeed=False)[0].result == 'error'
+
+
+def test_task_timed_out(waiter, fake_tasks):
+    fake_tasks.searches_left['4'] = 1000
+    with pytest.raises(TaskTimedOutError):
+        waiter.wait_for_ids([4], timeout=0.1)
+    time.sleep(0.1)
+    assert not waiter._watched
+
+
+def test_wait_for_tasks_not_found(waiter):
+    waiter._satellite.api.ForemanTask.return_value = mock.Mock(search=mock.Mock(return_value=[]))
+    with pytest.raises(AssertionError, match='No task was found'):
+        waiter.wait_for_tasks('label = Foo', search_rate=0, max_tries=2)
+
+
+def test_search_errors_retried(waiter, fake_tasks):
+    errors = iter([ConnectionError('connection reset')] * 2)
+    search = fake_tasks.search
+
+    def flaky_search(query):
+        if error := next(errors, None):
+            raise error
+        return search(query)
+
+    fake_tasks.search = flaky_search
+    # the tasks are found once the Satellite answers again
+    assert [task.id for task in waiter.wait_for_ids([1], timeout=5)] == [1]
+    # the callers fail once the searches failed max_errors times in a row
+    errors = iter([ConnectionError('connection refused')] * waiter.max_errors)
+    with pytest.raises(ConnectionError, match='connection refused'):
+        waiter.wait_for_ids([1], timeout=5)
+    assert not waiter._watched
@@ -0,0 +1,115 @@
+"""Tests for module ``robottelo.host_helpers.ui_session_pool``."""
+
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers.ui_session_pool import UISessionPool
+
+
+class FakeSession:
+    """Airgun Session started on enter, recording the cookies and pages of its browser"""
+
+    started = []
+
+    def __init__(self, session_name, user, password, hostname, login, url=None):
+        self.name = session_name
+        self.user = user
+        self.login = login
+        self.closed = False
+        self.browser = mock.Mock()
+        selenium = self.browser.selenium
+        selenium.current_url = f'https://{hostname}/'
+        selenium.get_cookies.return_value = [{'name': '_session_id', 'value': user}]
+
+    def __enter__(self):
+        self.started.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    FakeSession.started = []
+    pool = UISessionPool(session_class=FakeSession)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def satellite():
+    return mock.Mock(hostname='sat.example.com', url='https://sat.example.com')
+
+
+def test_session_reused_by_user(pool, satellite):
+    with pool.session(satellite, 'test_a', 'admin', 'pass') as first, first:
+        pass
+    with pool.session(satellite, 'test_b', 'admin', 'pass') as second:
+        assert second._session is first._session
+        assert second.name == 'test_b'
+        second.selenium.execute_script.assert_called_once()
+        second.selenium.get.assert_called_once_with('https://sat.example.com')
+    with pool.session(satellite, 'test_c', 'viewer', 'pass') as other:
+        assert other._session is not first._session
+    assert len(FakeSession.started) == 2
+    assert not any(session.closed for session in FakeSession.started)
+    pool.close()
+    assert all(session.closed for session in FakeSession.started)
+
+
+def test_session_not_reused(pool, satellite):
+    with (
+        pytest.raises(ValueError, match='test failed'),
+        pool.session(satellite, 'test_a', 'admin', 'pass'),
+    ):
+        raise ValueError('test failed')
+    with pool.session(satellite, 'test_b', 'admin', 'pass'):
+        pass
+    assert [session.closed for session in FakeSession.started] == [True, False]
+
+
+def test_session_called(pool, satellite):
+    with pool.session(satellite, 'test_a', 'admin', 'pass') as session:
+        pooled = FakeSession.started[0]
+        with session(url='/content_hosts?per_page=5'):
+            pooled.browser.selenium.get.assert_called_once_with(
+                'https://sat.example.com/content_hosts?per_page=5'
+            )
+        # another user logs in a new browser of the test
+        with session(user='viewer', password='secret'):
+            assert session.user == 'viewer'
+            assert FakeSession.started[1].user == 'viewer'
+        assert FakeSession.started[1].closed
+    # the pooled browser was left logged in as the pool user, it is reused
+    with pool.session(satellite, 'test_b', 'admin', 'pass') as session:
+        assert session.user == 'admin'
+        assert session._session is pooled
+    assert not pooled.closed
+
+
+def test_sessions_of_deleted_user_closed(pool, satellite):
+    # each test module logs in with a user of its own, deleted at the end of the module
+    with pool.session(satellite, 'test_a', 'module_a_user', 'pass') as first:
+        pass
+    pool.discard(satellite.hostname, 'module_a_user')
+    assert FakeSession.started[0].closed
+    with pool.session(satellite, 'test_b', 'module_b_user', 'pass') as second:
+        assert second._session is not first._session
+    assert pool._idle == {(satellite.hostname, 'module_b_user'): [second]}
+    assert not FakeSession.started[1].closed
+
+
+def test_restore_cookies(pool, satellite):
+    pool.restore_cookies = True
+    with (
+        pool.session(satellite, 'test_a', 'admin', 'pass') as first,
+        pool.session(satellite, 'test_b', 'admin', 'pass') as second,
+    ):
+        assert first.login is True
+        # the second browser did not log in, the cookies of the first login were restored
+        assert second.login is False
+        second.selenium.add_cookie.assert_called_once_with(
+            {'name': '_session_id', 'value': 'admin'}
+        )
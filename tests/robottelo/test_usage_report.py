@@ -0,0 +1,50 @@
+"""Tests for module ``robottelo.utils.usage_report``."""
+
+from unittest import mock
+
+from robottelo.constants import DataFile
+from robottelo.utils import usage_report
+from robottelo.utils.usage_report import ReportSnapshot
+
+
+def test_parse_report():
+    values = usage_report.parse_report(DataFile.USAGE_REPORT_ITEMS.read_text())
+    assert values['compliance_scap_contents_count'] == '5'
+    assert values['hosts_by_os_count|RedHat'] == '1'
+    assert values['facts_by_type|Puppet|min_update_time'] == '"2025-08-14 08:28:58.921124"'
+    assert values['last_login_on_through_external_auth_source_in_days'] == ''
+    assert usage_report.find_value(values, 'HOSTS_BY_OS_COUNT') == '1'
+    # the first key containing the searched one, as grep would find
+    assert usage_report.find_value(values, 'audits|records') == '57'
+    assert usage_report.find_value(values, 'no_such_key') is None
+
+
+def test_parse_condensed_report():
+    output = f'Generating report...\n{DataFile.USAGE_REPORT_ITEMS_CONDENSED.read_text()}'
+    values = usage_report.parse_condensed_report(output)
+    assert values['foreman.host_rhel_count'] == 1
+    assert values['foreman.use_ipv6'] is False
+
+
+def test_report_snapshot():
+    generate = mock.Mock(side_effect=[{'count': '1'}, {'count': '2'}, {'count': '3'}])
+    snapshot = ReportSnapshot(generate, ttl=None)
+    assert snapshot['count'] == '1'
+    assert snapshot.get('count') == '1'
+    assert generate.call_count == 1
+    assert snapshot.refresh() == {'count': '2'}
+    assert snapshot['count'] == '2'
+    snapshot.invalidate()
+    assert snapshot['count'] == '3'
+    assert generate.call_count == 3
+
+
+def test_report_snapshot_ttl():
+    generate = mock.Mock(side_effect=[{'count': '1'}, {'count': '2'}])
+    snapshot = ReportSnapshot(generate, ttl=60)
+    with mock.patch.object(usage_report.time, 'monotonic', return_value=100):
+        assert snapshot['count'] == '1'
+    with mock.patch.object(usage_report.time, 'monotonic', return_value=150):
+        assert snapshot['count'] == '1'
+    with mock.patch.object(usage_report.time, 'monotonic', return_value=161):
+        assert snapshot['count'] == '2'
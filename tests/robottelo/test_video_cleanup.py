@@ -0,0 +1,39 @@
+"""Tests for module ``pytest_plugins.video_cleanup``."""
+
+from unittest import mock
+
+import pytest
+
+from pytest_plugins import video_cleanup
+from pytest_plugins.video_cleanup import VideoCleaner
+
+
+@pytest.fixture
+def host():
+    with mock.patch.object(video_cleanup, 'Host') as host_class:
+        yield host_class
+
+
+def test_videos_removed_in_batches(host):
+    cleaner = VideoCleaner('grid.example.com', batch_size=2, flush_interval=3600)
+    for session_id in ('a', 'b', 'c'):
+        cleaner.add(session_id)
+    cleaner.close()
+    # a single connection removed the full batch then the rest of the queue
+    host.assert_called_once_with(hostname='grid.example.com')
+    commands = [call.kwargs['command'] for call in host.return_value.execute.call_args_list]
+    assert commands == [
+        'rm -rf /var/www/html/videos/a /var/www/html/videos/b',
+        'rm -rf /var/www/html/videos/c',
+    ]
+    host.return_value.close.assert_called_once()
+
+
+def test_failed_cleanup_reconnects(host):
+    host.return_value.execute.side_effect = [ConnectionError, None]
+    cleaner = VideoCleaner('grid.example.com', flush_interval=3600)
+    cleaner.add('a')
+    cleaner.flush()
+    cleaner.add('b')
+    cleaner.close()
+    assert host.call_count == 2